@@ -9,16 +9,21 @@ from models.user import User
 from models.expense import Expense
 from models.expense_category import ExpenseCategory
 from models.household import Household
+from models.household_daily_rollup import HouseholdDailyRollup
 from models.income import Income
 from models.investment_asset import InvestmentAsset
+from models.investment_position import InvestmentPosition
 from models.investment_transaction import InvestmentTransaction
 from models.investment_valuation_snapshot import InvestmentValuationSnapshot
 from models.loan import Loan
+from models.loan_adjustment import LoanAdjustment
 from models.loan_member import LoanMember
 from models.loan_payment import LoanPayment
 from models.loan_snapshot import LoanSnapshot
 from models.member import Member
 from models.monthly_budget import MonthlyBudget
+from models.monthly_category_spend import MonthlyCategorySpend
+from models.recurring_template import RecurringTemplate
 from models.session import Session
 from core.config import settings
 
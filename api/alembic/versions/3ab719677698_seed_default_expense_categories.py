@@ -0,0 +1,98 @@
+"""seed default expense categories
+
+Revision ID: 3ab719677698
+Revises: 75325f8e14af
+Create Date: 2026-10-18 02:29:31.206351
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3ab719677698'
+down_revision: Union[str, Sequence[str], None] = '75325f8e14af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Snapshot of the defaults the API used to create on every category read
+DEFAULT_CATEGORIES = [
+    ("Matvörur (Groceries)", "GREEN"),
+    ("Samgöngur (Transportation)", "BLUE"),
+    ("Afþreying (Entertainment)", "PURPLE"),
+    ("Útvegingar (Dining Out)", "ORANGE"),
+    ("Gjald (Utilities)", "YELLOW"),
+    ("Heilsa (Healthcare)", "RED"),
+    ("Verslun (Shopping)", "PINK"),
+    ("Annað (Other)", "GRAY"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+
+    # The API inserted a fresh batch of defaults on every category read, so existing databases hold many copies.
+    # Batches went in whole and in list order: the nth default of each batch is a copy of the nth of the first
+    # one. Point expenses at the first copy and delete the rest.
+    duplicates = """
+        WITH defaults AS (
+            SELECT id, (row_number() OVER (ORDER BY id) - 1) % :count AS slot
+            FROM expense_categories
+            WHERE NOT is_custom
+        )
+        SELECT id, min(id) OVER (PARTITION BY slot) AS canonical_id FROM defaults
+    """
+    connection.execute(
+        sa.text(f"""
+            UPDATE expenses
+            SET category_id = duplicates.canonical_id
+            FROM ({duplicates}) AS duplicates
+            WHERE expenses.category_id = duplicates.id AND duplicates.id <> duplicates.canonical_id
+        """),
+        {"count": len(DEFAULT_CATEGORIES)},
+    )
+    connection.execute(
+        sa.text(f"""
+            DELETE FROM expense_categories
+            USING ({duplicates}) AS duplicates
+            WHERE expense_categories.id = duplicates.id AND duplicates.id <> duplicates.canonical_id
+        """),
+        {"count": len(DEFAULT_CATEGORIES)},
+    )
+
+    existing_ids = connection.execute(
+        sa.text("SELECT id FROM expense_categories WHERE NOT is_custom ORDER BY id")
+    ).scalars().all()
+
+    if not existing_ids:
+        connection.execute(
+            sa.text("""
+                INSERT INTO expense_categories (name, is_custom, color, created_at, updated_at)
+                VALUES (:name, false, CAST(:color AS color), now(), now())
+            """),
+            [{"name": name, "color": color} for name, color in DEFAULT_CATEGORIES],
+        )
+        return
+
+    # Bring existing defaults in line with the current names and colors
+    connection.execute(
+        sa.text("""
+            UPDATE expense_categories
+            SET name = :name, color = CAST(:color AS color), updated_at = now()
+            WHERE id = :id AND (name <> :name OR color <> CAST(:color AS color))
+        """),
+        [
+            {"id": category_id, "name": name, "color": color}
+            for category_id, (name, color) in zip(existing_ids, DEFAULT_CATEGORIES)
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Default categories may be referenced by expenses, so they are left in place
+    pass
@@ -0,0 +1,60 @@
+"""short id collision fallback
+
+Revision ID: 4090c9a1a1a3
+Revises: 3ab719677698
+Create Date: 2026-10-18 02:32:00.263494
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4090c9a1a1a3'
+down_revision: Union[str, Sequence[str], None] = '3ab719677698'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Seven hex characters collide after a few thousand rows per table (birthday bound),
+    # so take more of the hash until the value is unused. Rows inserted earlier in the
+    # same statement are visible here, which covers multi-row inserts too.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_short_id() RETURNS trigger AS $$
+        DECLARE
+            digest text;
+            length int := 7;
+            taken boolean;
+        BEGIN
+            IF NEW.short_id IS NOT NULL THEN
+                RETURN NEW;
+            END IF;
+            digest := upper(encode(sha256(convert_to(lower(TG_TABLE_NAME) || '_' || NEW.id, 'UTF8')), 'hex'));
+            LOOP
+                NEW.short_id := left(digest, length);
+                EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE short_id = $1)', TG_TABLE_NAME)
+                    INTO taken USING NEW.short_id;
+                EXIT WHEN NOT taken OR length >= 64;
+                length := length + 1;
+            END LOOP;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_short_id() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.short_id IS NULL THEN
+                NEW.short_id := upper(left(encode(sha256(convert_to(lower(TG_TABLE_NAME) || '_' || NEW.id, 'UTF8')), 'hex'), 7));
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
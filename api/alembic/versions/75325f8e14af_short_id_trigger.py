@@ -0,0 +1,69 @@
+"""short id trigger
+
+Revision ID: 75325f8e14af
+Revises: c71e282718f8
+Create Date: 2026-10-18 02:27:39.603324
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '75325f8e14af'
+down_revision: Union[str, Sequence[str], None] = 'c71e282718f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = [
+    'expense_categories',
+    'expenses',
+    'household',
+    'income',
+    'investment_asset',
+    'investment_position',
+    'investment_transaction',
+    'investment_valuation_snapshot',
+    'loan',
+    'loan_member',
+    'loan_payment',
+    'loan_snapshot',
+    'member',
+    'monthly_budgets',
+    'sessions',
+    'users',
+]
+
+# Same value the old after_insert listener computed in Python:
+# first 7 hex chars of sha256("<table>_<id>"), upper-cased
+SHORT_ID_EXPRESSION = "upper(left(encode(sha256(convert_to(lower({table}) || '_' || {id}, 'UTF8')), 'hex'), 7))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION set_short_id() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.short_id IS NULL THEN
+                NEW.short_id := {SHORT_ID_EXPRESSION.format(table='TG_TABLE_NAME', id='NEW.id')};
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(f"CREATE TRIGGER set_short_id BEFORE INSERT ON {table} FOR EACH ROW EXECUTE FUNCTION set_short_id()")
+        # Rows written by bulk inserts never went through the listener
+        op.execute(
+            f"UPDATE {table} SET short_id = {SHORT_ID_EXPRESSION.format(table=repr(table), id='id')} "
+            "WHERE short_id IS NULL"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS set_short_id ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_short_id()")
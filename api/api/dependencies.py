@@ -1,9 +1,11 @@
 from fastapi import Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
 
 from core.config import settings
-from db.engine import get_db
+from db.engine import get_async_db
 from models.household import Household
 from models.member import Member
 from models.session import Session as SessionModel
@@ -11,7 +13,7 @@ from models.user import User
 from services.session import SessionService, get_session_service
 
 
-def get_session_from_cookie_optional(
+async def get_session_from_cookie_optional(
     request: Request,
     session_service: SessionService = Depends(get_session_service),
 ) -> SessionModel | None:
@@ -19,10 +21,13 @@ def get_session_from_cookie_optional(
     token = request.cookies.get(settings.session_cookie_name)
     if not token:
         return None
-    return session_service.get_valid_session(token)
+    session = await session_service.get_valid_session(token)
+    # Picked up by SessionRefreshMiddleware, which refreshes without querying again
+    request.state.session = session
+    return session
 
 
-def get_current_session(
+async def get_current_session(
     request: Request,
     session_service: SessionService = Depends(get_session_service),
 ) -> SessionModel:
@@ -30,13 +35,14 @@ def get_current_session(
     if not token:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
-    session = session_service.get_valid_session(token)
+    session = await session_service.get_valid_session(token)
     if not session:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+    request.state.session = session
     return session
 
 
-def get_current_user(
+async def get_current_user(
     session: SessionModel = Depends(get_current_session),
 ) -> User:
     """Get the currently authenticated user from the session."""
@@ -49,13 +55,14 @@ class HouseholdAccess:
     def __init__(self, household_id_param: str = "household_id"):
         self.household_id_param = household_id_param
 
-    def __call__(
+    async def __call__(
         self,
         household_id: int,
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
     ) -> Household:
-        household = db.query(Household).filter(Household.id == household_id).first()
+        result = await db.execute(select(Household).where(Household.id == household_id))
+        household = result.scalars().first()
 
         if not household:
             raise HTTPException(status_code=404, detail="Household not found")
@@ -72,13 +79,14 @@ class HouseholdAccess:
 verify_household_access = HouseholdAccess()
 
 
-def get_user_member(
+async def get_user_member(
     member_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Member:
     """Verify user has access to this member and return it."""
-    member = db.query(Member).filter(Member.id == member_id).first()
+    result = await db.execute(select(Member).options(joinedload(Member.household)).where(Member.id == member_id))
+    member = result.scalars().first()
 
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
@@ -3,17 +3,25 @@ from fastapi import APIRouter
 from .auth import router as auth_router
 from .expense import router as expense_router
 from .expense_category import router as expense_category_router
+from .household import router as household_router
 from .income import router as income_router
 from .investment import router as investment_router
+from .loan import router as loan_router
 from .member import router as member_router
+from .metrics import router as metrics_router
 from .monthly_budget import router as monthly_budget_router
+from .recurring import router as recurring_router
 
 v1_router = APIRouter(prefix="/v1", tags=["v1"])
 
 v1_router.include_router(auth_router)
+v1_router.include_router(household_router)
 v1_router.include_router(member_router)
 v1_router.include_router(monthly_budget_router)
 v1_router.include_router(expense_router)
 v1_router.include_router(income_router)
+v1_router.include_router(recurring_router)
 v1_router.include_router(expense_category_router)
 v1_router.include_router(investment_router)
+v1_router.include_router(loan_router)
+v1_router.include_router(metrics_router)
@@ -56,14 +56,14 @@ async def login(
 ):
     identifier = request.identifier
     password = request.password
-    user = user_service.authenticate(identifier, password)
+    user = await user_service.authenticate(identifier, password)
     if not user:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     user_agent = fastapi_request.headers.get("user-agent", "")
     ip_address = fastapi_request.client.host if fastapi_request.client else ""
 
-    token = session_service.create_session(user.id, user_agent, ip_address)
+    token = await session_service.create_session(user.id, user_agent, ip_address)
     set_session_cookie(response, token)
 
     return LoginResponse(user=UserResponse.model_validate(user))
@@ -76,9 +76,9 @@ async def register(
     household_service: HouseholdService = Depends(get_household_service),
     member_service: MemberService = Depends(get_member_service),
 ):
-    user = user_service.create_user(request.username, request.email, request.password)
-    household = household_service.create_household(f"{user.username}'s Household", user.id)
-    member_service.create_member(user.username, household.id)
+    user = await user_service.create_user(request.username, request.email, request.password)
+    household = await household_service.create_household(f"{user.username}'s Household", user.id)
+    await member_service.create_member(user.username, household.id)
     return RegisterResponse(success=True)
 
 
@@ -88,7 +88,7 @@ async def logout(
     session: SessionModel = Depends(get_current_session),
     session_service: SessionService = Depends(get_session_service),
 ):
-    session_service.delete_session(session.token)
+    await session_service.delete_session(session.token)
     clear_session_cookie(response)
     return LogoutResponse(success=True)
 
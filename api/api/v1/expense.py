@@ -17,7 +17,7 @@ async def update_expense(
     expense_service: ExpenseService = Depends(get_expense_service),
 ):
     """Update an existing expense."""
-    expense = expense_service.update(
+    expense = await expense_service.update(
         expense_id=expense_id,
         amount=request.amount,
         description=request.description,
@@ -42,7 +42,7 @@ async def delete_expense(
     expense_service: ExpenseService = Depends(get_expense_service),
 ):
     """Delete an expense."""
-    deleted = expense_service.delete(expense_id)
+    deleted = await expense_service.delete(expense_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Expense not found")
 
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from starlette.status import HTTP_304_NOT_MODIFIED
 
 from models.expense_category import Color
 from schemas.expense_category import (
@@ -16,12 +17,27 @@ from services.expense_category import (
 router = APIRouter(prefix="/expense_categories", tags=["Expense Categories"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get("", response_model=GetCategoriesResponse)
 async def get_categories(
+    request: Request,
+    response: Response,
     category_service: ExpenseCategoryService = Depends(get_expense_category_service),
 ):
     """Get all expense categories (includes default and custom categories)."""
-    categories = category_service.get_all()
+    categories, etag = await category_service.get_all_with_etag()
+    # Let clients revalidate instead of re-downloading the list on every page load
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    response.headers.update(cache_headers)
     return GetCategoriesResponse(
         categories=[
             CategoryResponse(
@@ -50,7 +66,7 @@ async def create_category(
             detail=f"Invalid color. Must be one of: {[c.value for c in Color]}",
         ) from e
 
-    category = category_service.create(
+    category = await category_service.create(
         name=request.name,
         color=color,
         color_code=request.color_code,
@@ -71,7 +87,7 @@ async def delete_category(
 ):
     """Delete a custom expense category. Default categories cannot be deleted."""
     try:
-        deleted = category_service.delete(category_id)
+        deleted = await category_service.delete(category_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Category not found")
         return DeleteCategoryResponse(success=True)
@@ -0,0 +1,152 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.status import HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+from api.dependencies import verify_household_access
+from core.config import settings
+from models.household import Household
+from schemas.bulk_import import BulkImportResponse, BulkImportRowError
+from schemas.export import ExportFormat
+from schemas.monthly_budget import BudgetAnalyticsResponse, MonthAnalytics
+from schemas.net_worth import NetWorthInterval, NetWorthPoint, NetWorthResponse
+from schemas.search import SearchResponse, SearchResult
+from services.budget_analytics import BudgetAnalyticsService, get_budget_analytics_service
+from services.bulk_import import is_supported_content_type, iter_records
+from services.expense import ExpenseService, get_expense_service
+from services.export import MEDIA_TYPES, ExportService, get_export_service
+from services.net_worth import NetWorthService, get_net_worth_service
+from services.search import SearchService, get_search_service
+
+router = APIRouter(prefix="/households", tags=["Households"])
+
+# A month as YYYY-MM
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+# ============ Import Endpoints ============
+
+
+@router.post("/{household_id}/expenses/import", response_model=BulkImportResponse)
+async def import_expenses(
+    request: Request,
+    household: Household = Depends(verify_household_access),
+    expense_service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    Import dated expenses from a streamed CSV (with header row) or NDJSON body.
+    Each row is added to the household's monthly budget for its date, creating budgets as needed.
+    """
+    content_type = request.headers.get("content-type", "")
+    if not is_supported_content_type(content_type):
+        raise HTTPException(
+            status_code=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Body must be text/csv or application/x-ndjson",
+        )
+
+    report = await expense_service.bulk_create(
+        iter_records(request.stream(), content_type),
+        household_id=household.id,
+    )
+    return BulkImportResponse(
+        inserted=report.inserted,
+        failed=len(report.errors),
+        errors=[BulkImportRowError(row=row, errors=messages) for row, messages in report.errors],
+    )
+
+
+# ============ Export Endpoints ============
+
+
+@router.get("/{household_id}/export")
+async def export_household(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    household: Household = Depends(verify_household_access),
+    export_service: ExportService = Depends(get_export_service),
+):
+    """
+    Stream the household's full financial history as NDJSON or CSV.
+    Each record carries a record_type: expense, income, investment_transaction, valuation or loan_payment.
+    """
+    filename = f"household-{household.id}-export.{export_format.value}"
+    return StreamingResponse(
+        export_service.stream_household(household.id, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# ============ Net Worth Endpoints ============
+
+
+@router.get("/{household_id}/net-worth", response_model=NetWorthResponse)
+async def get_net_worth(
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    interval: NetWorthInterval = NetWorthInterval.DAY,
+    household: Household = Depends(verify_household_access),
+    net_worth_service: NetWorthService = Depends(get_net_worth_service),
+):
+    """
+    Get the household's net worth over time: investments at their latest valuation plus accumulated
+    savings, minus outstanding loans. Defaults to the last year up to today.
+    """
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=365)
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+
+    points = await net_worth_service.get_series(household.id, date_from, date_to, interval)
+    return NetWorthResponse(interval=interval, points=[NetWorthPoint(**point) for point in points])
+
+
+# ============ Budget Analytics Endpoints ============
+
+
+@router.get("/{household_id}/budgets/analytics", response_model=BudgetAnalyticsResponse)
+async def get_budget_analytics(
+    month_from: Optional[str] = Query(None, alias="from", pattern=MONTH_PATTERN),
+    month_to: Optional[str] = Query(None, alias="to", pattern=MONTH_PATTERN),
+    household: Household = Depends(verify_household_access),
+    analytics_service: BudgetAnalyticsService = Depends(get_budget_analytics_service),
+):
+    """
+    Get spending per month and category between two months (YYYY-MM), with rolling 3 and 12 month averages,
+    year-over-year changes and category shares. Defaults to the last twelve months up to the current one.
+    """
+    try:
+        end = date.fromisoformat(f"{month_to}-01") if month_to else date.today().replace(day=1)
+        if month_from:
+            start = date.fromisoformat(f"{month_from}-01")
+        else:
+            year, month = divmod(end.year * 12 + end.month - 12, 12)
+            start = date(year, month + 1, 1)
+    except ValueError as e:
+        # Year 0, given or reached by the default range
+        raise HTTPException(status_code=400, detail="Months must be between 0001-01 and 9999-12") from e
+    if start > end:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+
+    months = await analytics_service.get_analytics(household.id, start, end)
+    return BudgetAnalyticsResponse(months=[MonthAnalytics(**month) for month in months])
+
+
+# ============ Search Endpoints ============
+
+
+@router.get("/{household_id}/search", response_model=SearchResponse)
+async def search(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    offset: int = Query(0, ge=0),
+    household: Household = Depends(verify_household_access),
+    search_service: SearchService = Depends(get_search_service),
+):
+    """
+    Search the household's expenses and income across all months by description or source, tolerating typos.
+    Results are ranked best match first; pass next_offset back as offset for the next page.
+    """
+    results, next_offset = await search_service.search(household.id, q, limit, offset)
+    return SearchResponse(results=[SearchResult(**result) for result in results], next_offset=next_offset)
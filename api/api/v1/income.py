@@ -17,7 +17,7 @@ async def update_income(
     income_service: IncomeService = Depends(get_income_service),
 ):
     """Update an existing income entry."""
-    income = income_service.update(
+    income = await income_service.update(
         income_id=income_id,
         amount=request.amount,
         source=request.source,
@@ -38,7 +38,7 @@ async def delete_income(
     income_service: IncomeService = Depends(get_income_service),
 ):
     """Delete an income entry."""
-    deleted = income_service.delete(income_id)
+    deleted = await income_service.delete(income_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Income not found")
 
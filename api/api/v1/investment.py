@@ -1,6 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date, timedelta
+from typing import Optional
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.status import HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+from api.dependencies import verify_household_access
+from core.config import settings
+from models.household import Household
 from models.investment_transaction import TransactionType
+from schemas.bulk_import import BulkImportResponse, BulkImportRowError
 from schemas.investment import (
     AssetDetailResponse,
     AssetResponse,
@@ -16,12 +24,20 @@ from schemas.investment import (
     GetAssetsResponse,
     GetTransactionsResponse,
     GetValuationsResponse,
+    PortfolioHistoryResponse,
+    PortfolioReturnsResponse,
     PortfolioSummaryResponse,
     TransactionResponse,
     UpdateAssetRequest,
     UpdateTransactionRequest,
     ValuationResponse,
 )
+from schemas.investment import (
+    TransactionType as TransactionTypeSchema,
+)
+from schemas.net_worth import NetWorthInterval
+from services.broker_parsers import BROKER_PARSERS
+from services.bulk_import import is_supported_content_type, iter_records
 from services.investment import InvestmentService, get_investment_service
 
 router = APIRouter(prefix="/investments", tags=["Investments"])
@@ -36,11 +52,9 @@ async def get_assets_by_household(
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
     """Get all investment assets for a household with computed metrics."""
-    assets = investment_service.get_assets_by_household(household_id)
     assets_with_metrics = []
 
-    for asset in assets:
-        metrics = investment_service.calculate_asset_metrics(asset)
+    for asset, metrics in await investment_service.calculate_household_metrics(household_id):
         assets_with_metrics.append(
             AssetWithMetricsResponse(
                 id=asset.id,
@@ -76,23 +90,56 @@ async def get_portfolio_summary(
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
     """Get portfolio summary for a household."""
-    summary = investment_service.calculate_portfolio_summary(household_id)
+    summary = await investment_service.calculate_portfolio_summary(household_id)
     return PortfolioSummaryResponse(**summary)
 
 
+@router.get("/household/{household_id}/history", response_model=PortfolioHistoryResponse)
+async def get_portfolio_history(
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    interval: NetWorthInterval = NetWorthInterval.DAY,
+    household: Household = Depends(verify_household_access),
+    investment_service: InvestmentService = Depends(get_investment_service),
+):
+    """
+    Get the value of each asset and of the whole portfolio over time, one point per day, week or month.
+    Each point values the quantity held at the last valuation on or before it. Defaults to the last year.
+    """
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=365)
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+
+    history = await investment_service.get_portfolio_history(household.id, date_from, date_to, interval.value)
+    return PortfolioHistoryResponse(interval=interval.value, **history)
+
+
+@router.get("/household/{household_id}/returns", response_model=PortfolioReturnsResponse)
+async def get_portfolio_returns(
+    household: Household = Depends(verify_household_access),
+    investment_service: InvestmentService = Depends(get_investment_service),
+):
+    """
+    Get money-weighted (XIRR) and time-weighted returns per asset, per asset type and for the whole
+    household. Rates are fractions, so 0.05 is 5%. Values that cannot be determined are null.
+    """
+    return PortfolioReturnsResponse(**await investment_service.calculate_returns(household.id))
+
+
 @router.get("/{asset_id}", response_model=AssetDetailResponse)
 async def get_asset_detail(
     asset_id: int,
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
     """Get detailed information about a single asset including transactions and valuations."""
-    asset = investment_service.get_asset_by_id(asset_id)
+    asset = await investment_service.get_asset_by_id(asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    metrics = investment_service.calculate_asset_metrics(asset)
-    transactions = investment_service.get_transactions_by_asset(asset_id)
-    valuations = investment_service.get_valuations_by_asset(asset_id)
+    metrics = await investment_service.calculate_asset_metrics(asset)
+    transactions, _ = await investment_service.get_transactions_by_asset(asset_id)
+    valuations = await investment_service.get_valuations_by_asset(asset_id)
 
     asset_response = AssetWithMetricsResponse(
         id=asset.id,
@@ -162,7 +209,7 @@ async def create_asset(
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
     """Create a new investment asset with initial BUY transaction."""
-    asset = investment_service.create_asset(
+    asset = await investment_service.create_asset(
         household_id=household_id,
         member_id=member_id,
         name=request.name,
@@ -196,7 +243,7 @@ async def update_asset(
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
     """Update an existing asset."""
-    asset = investment_service.update_asset(
+    asset = await investment_service.update_asset(
         asset_id=asset_id,
         name=request.name,
         symbol=request.symbol,
@@ -229,7 +276,7 @@ async def delete_asset(
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
     """Delete an asset and all related transactions and valuations."""
-    deleted = investment_service.delete_asset(asset_id)
+    deleted = await investment_service.delete_asset(asset_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Asset not found")
 
@@ -242,16 +289,32 @@ async def delete_asset(
 @router.get("/{asset_id}/transactions", response_model=GetTransactionsResponse)
 async def get_transactions(
     asset_id: int,
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    cursor: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = Query(None, description="Inclusive"),
+    transaction_type: Optional[TransactionTypeSchema] = None,
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
-    """Get all transactions for an asset."""
+    """Get a page of transactions for an asset, newest first. Pass next_cursor back as cursor for the next page."""
     # Verify asset exists
-    asset = investment_service.get_asset_by_id(asset_id)
+    asset = await investment_service.get_asset_by_id(asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    transactions = investment_service.get_transactions_by_asset(asset_id)
+    try:
+        transactions, next_cursor = await investment_service.get_transactions_by_asset(
+            asset_id,
+            limit=limit,
+            cursor=cursor,
+            date_from=date_from,
+            date_to=date_to,
+            transaction_type=TransactionType(transaction_type.value) if transaction_type else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     return GetTransactionsResponse(
+        next_cursor=next_cursor,
         transactions=[
             TransactionResponse(
                 id=t.id,
@@ -266,7 +329,7 @@ async def get_transactions(
                 created_at=t.created_at,
             )
             for t in transactions
-        ]
+        ],
     )
 
 
@@ -278,13 +341,13 @@ async def create_transaction(
 ):
     """Create a new transaction for an asset."""
     # Verify asset exists and get details
-    asset = investment_service.get_asset_by_id(asset_id)
+    asset = await investment_service.get_asset_by_id(asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
     # Validate SELL doesn't exceed current quantity
     if request.transaction_type.value == "sell":
-        metrics = investment_service.calculate_asset_metrics(asset)
+        metrics = await investment_service.calculate_asset_metrics(asset)
         if request.quantity > metrics["current_quantity"]:
             available = metrics["current_quantity"]
             raise HTTPException(
@@ -292,7 +355,7 @@ async def create_transaction(
                 detail=f"Cannot sell {request.quantity} units. Only {available} available.",
             )
 
-    transaction = investment_service.create_transaction(
+    transaction = await investment_service.create_transaction(
         asset_id=asset_id,
         household_id=asset.household_id,
         member_id=asset.member_id,
@@ -318,6 +381,43 @@ async def create_transaction(
     )
 
 
+@router.post("/household/{household_id}/member/{member_id}/transactions/import", response_model=BulkImportResponse)
+async def import_transactions(
+    household_id: int,
+    member_id: int,
+    request: Request,
+    broker: str = "generic",
+    default_currency: str = "ISK",
+    investment_service: InvestmentService = Depends(get_investment_service),
+):
+    """
+    Import transactions for many assets from a streamed CSV or NDJSON broker export.
+    Assets are matched by symbol and created for the member when missing.
+    """
+    content_type = request.headers.get("content-type", "")
+    if not is_supported_content_type(content_type):
+        raise HTTPException(
+            status_code=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Body must be text/csv or application/x-ndjson",
+        )
+    parser = BROKER_PARSERS.get(broker)
+    if parser is None:
+        raise HTTPException(status_code=400, detail=f"Unknown broker. Must be one of: {list(BROKER_PARSERS)}")
+
+    report = await investment_service.import_transactions(
+        iter_records(request.stream(), content_type, normalize_keys=False),
+        household_id=household_id,
+        member_id=member_id,
+        parser=parser,
+        default_currency=default_currency,
+    )
+    return BulkImportResponse(
+        inserted=report.inserted,
+        failed=len(report.errors),
+        errors=[BulkImportRowError(row=row, errors=messages) for row, messages in report.errors],
+    )
+
+
 @router.patch("/transactions/{transaction_id}", response_model=TransactionResponse)
 async def update_transaction(
     transaction_id: int,
@@ -325,7 +425,7 @@ async def update_transaction(
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
     """Update an existing transaction."""
-    transaction = investment_service.update_transaction(
+    transaction = await investment_service.update_transaction(
         transaction_id=transaction_id,
         transaction_type=TransactionType(request.transaction_type.value) if request.transaction_type else None,
         quantity=request.quantity,
@@ -357,7 +457,7 @@ async def delete_transaction(
     investment_service: InvestmentService = Depends(get_investment_service),
 ):
     """Delete a transaction."""
-    deleted = investment_service.delete_transaction(transaction_id)
+    deleted = await investment_service.delete_transaction(transaction_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Transaction not found")
 
@@ -374,11 +474,11 @@ async def get_valuations(
 ):
     """Get all valuations for an asset."""
     # Verify asset exists
-    asset = investment_service.get_asset_by_id(asset_id)
+    asset = await investment_service.get_asset_by_id(asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    valuations = investment_service.get_valuations_by_asset(asset_id)
+    valuations = await investment_service.get_valuations_by_asset(asset_id)
     return GetValuationsResponse(
         valuations=[
             ValuationResponse(
@@ -403,11 +503,11 @@ async def create_valuation(
 ):
     """Create a new valuation snapshot for an asset."""
     # Verify asset exists
-    asset = investment_service.get_asset_by_id(asset_id)
+    asset = await investment_service.get_asset_by_id(asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    valuation = investment_service.create_valuation(
+    valuation = await investment_service.create_valuation(
         asset_id=asset_id,
         valuation=request.valuation,
         valuation_date=request.date,
@@ -0,0 +1,256 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.dependencies import verify_household_access
+from models.household import Household
+from models.loan import Loan
+from models.loan_adjustment import AdjustmentType
+from schemas.loan import (
+    AdjustmentResponse,
+    CreateAdjustmentRequest,
+    CreateLoanRequest,
+    DeleteAdjustmentResponse,
+    DeleteLoanResponse,
+    GetLoansResponse,
+    HouseholdDebtResponse,
+    LoanBalanceResponse,
+    LoanMemberShare,
+    LoanResponse,
+    LoanScheduleResponse,
+    RecalculateLoansResponse,
+    SchedulePaymentResponse,
+    UpdateLoanRequest,
+)
+from services.loan import LoanService, get_loan_service
+
+router = APIRouter(prefix="/loans", tags=["Loans"])
+
+
+def _loan_response(loan: Loan) -> LoanResponse:
+    return LoanResponse(
+        id=loan.id,
+        short_id=loan.short_id,
+        household_id=loan.household_id,
+        name=loan.name,
+        loan_type=loan.loan_type,
+        currency=loan.currency,
+        principal=loan.principal,
+        interest_rate=loan.interest_rate,
+        start_date=loan.start_date,
+        end_date=loan.end_date,
+        members=[LoanMemberShare(member_id=m.member_id, share_percent=m.share_percent) for m in loan.loan_members],
+        remaining_balance=LoanService.build_schedule(loan).balance_at(date.today()),
+        created_at=loan.created_at,
+        updated_at=loan.updated_at,
+    )
+
+
+async def _get_loan_or_404(loan_id: int, loan_service: LoanService) -> Loan:
+    loan = await loan_service.get_loan_by_id(loan_id)
+    if not loan:
+        raise HTTPException(status_code=404, detail="Loan not found")
+    return loan
+
+
+# ============ Loan Endpoints ============
+
+
+@router.get("/household/{household_id}", response_model=GetLoansResponse)
+async def get_loans_by_household(
+    household: Household = Depends(verify_household_access),
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Get all loans for a household with their current remaining balance."""
+    loans = await loan_service.get_loans_by_household(household.id)
+    return GetLoansResponse(loans=[_loan_response(loan) for loan in loans])
+
+
+@router.post("/household/{household_id}", response_model=LoanResponse)
+async def create_loan(
+    request: CreateLoanRequest,
+    household: Household = Depends(verify_household_access),
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Create a loan and generate its payment schedule."""
+    try:
+        loan = await loan_service.create_loan(
+            household_id=household.id,
+            name=request.name,
+            loan_type=request.loan_type,
+            currency=request.currency,
+            principal=request.principal,
+            interest_rate=request.interest_rate,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            members=[(m.member_id, m.share_percent) for m in request.members],
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return _loan_response(loan)
+
+
+@router.post("/household/{household_id}/recalculate", response_model=RecalculateLoansResponse)
+async def recalculate_loans(
+    household: Household = Depends(verify_household_access),
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Regenerate the payments and snapshots of every loan in a household."""
+    loans, payments, snapshots = await loan_service.recalculate_household(household.id)
+    return RecalculateLoansResponse(loans=loans, payments=payments, snapshots=snapshots)
+
+
+@router.get("/household/{household_id}/debt", response_model=HouseholdDebtResponse)
+async def get_household_debt(
+    on: Optional[date] = None,
+    household: Household = Depends(verify_household_access),
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """
+    Get the household's debt on a date (default today), split between members by their loan shares.
+    Monthly payment and interest are those of each loan's next installment.
+    """
+    debt = await loan_service.get_household_debt(household.id, on or date.today())
+    return HouseholdDebtResponse(**debt)
+
+
+@router.get("/{loan_id}", response_model=LoanResponse)
+async def get_loan(
+    loan_id: int,
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Get a single loan."""
+    return _loan_response(await _get_loan_or_404(loan_id, loan_service))
+
+
+@router.patch("/{loan_id}", response_model=LoanResponse)
+async def update_loan(
+    loan_id: int,
+    request: UpdateLoanRequest,
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Update a loan. Changing its terms regenerates the payment schedule."""
+    try:
+        loan = await loan_service.update_loan(
+            loan_id=loan_id,
+            name=request.name,
+            loan_type=request.loan_type,
+            currency=request.currency,
+            principal=request.principal,
+            interest_rate=request.interest_rate,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            members=[(m.member_id, m.share_percent) for m in request.members] if request.members is not None else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if not loan:
+        raise HTTPException(status_code=404, detail="Loan not found")
+    return _loan_response(loan)
+
+
+@router.delete("/{loan_id}", response_model=DeleteLoanResponse)
+async def delete_loan(
+    loan_id: int,
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Delete a loan with its payments, snapshots and adjustments."""
+    deleted = await loan_service.delete_loan(loan_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Loan not found")
+
+    return DeleteLoanResponse(success=True)
+
+
+# ============ Schedule Endpoints ============
+
+
+@router.get("/{loan_id}/schedule", response_model=LoanScheduleResponse)
+async def get_schedule(
+    loan_id: int,
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Get the full amortization schedule of a loan, including its adjustments."""
+    schedule = loan_service.build_schedule(await _get_loan_or_404(loan_id, loan_service))
+    return LoanScheduleResponse(
+        loan_id=loan_id,
+        total_interest=schedule.total_interest,
+        payments=[
+            SchedulePaymentResponse(
+                date=payment_date,
+                amount=amount,
+                interest_amount=interest,
+                principal_amount=principal,
+                remaining_balance=balance,
+            )
+            for payment_date, amount, interest, principal, balance in zip(
+                schedule.dates.tolist(),
+                schedule.payments.tolist(),
+                schedule.interest.tolist(),
+                schedule.principal_paid.tolist(),
+                schedule.balances.tolist(),
+                strict=True,
+            )
+        ],
+    )
+
+
+@router.get("/{loan_id}/balance", response_model=LoanBalanceResponse)
+async def get_balance(
+    loan_id: int,
+    on: Optional[date] = None,
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Get the remaining balance and interest paid of a loan on a date (default today)."""
+    schedule = loan_service.build_schedule(await _get_loan_or_404(loan_id, loan_service))
+    on = on or date.today()
+    return LoanBalanceResponse(
+        loan_id=loan_id,
+        date=on,
+        remaining_balance=schedule.balance_at(on),
+        interest_paid=schedule.interest_paid_at(on),
+    )
+
+
+# ============ Adjustment Endpoints ============
+
+
+@router.post("/{loan_id}/adjustments", response_model=AdjustmentResponse)
+async def create_adjustment(
+    loan_id: int,
+    request: CreateAdjustmentRequest,
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Add an extra payment or interest rate change to a loan and regenerate its schedule."""
+    loan = await _get_loan_or_404(loan_id, loan_service)
+    adjustment = await loan_service.create_adjustment(
+        loan,
+        adjustment_type=AdjustmentType(request.adjustment_type.value),
+        adjustment_date=request.date,
+        value=request.value,
+    )
+    return AdjustmentResponse(
+        id=adjustment.id,
+        short_id=adjustment.short_id,
+        loan_id=adjustment.loan_id,
+        adjustment_type=adjustment.adjustment_type.value,
+        date=adjustment.date,
+        value=adjustment.value,
+        created_at=adjustment.created_at,
+    )
+
+
+@router.delete("/{loan_id}/adjustments/{adjustment_id}", response_model=DeleteAdjustmentResponse)
+async def delete_adjustment(
+    loan_id: int,
+    adjustment_id: int,
+    loan_service: LoanService = Depends(get_loan_service),
+):
+    """Remove an adjustment from a loan and regenerate its schedule."""
+    loan = await _get_loan_or_404(loan_id, loan_service)
+    deleted = await loan_service.delete_adjustment(loan, adjustment_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Adjustment not found")
+
+    return DeleteAdjustmentResponse(success=True)
@@ -19,7 +19,7 @@ async def get_members(
     household_id: int,
     member_service: MemberService = Depends(get_member_service),
 ):
-    members = member_service.get_members(household_id)
+    members = await member_service.get_members(household_id)
     return GetMembersResponse(
         members=[
             MemberResponse(
@@ -41,7 +41,7 @@ async def create_member(
     member: CreateMemberRequest,
     member_service: MemberService = Depends(get_member_service),
 ):
-    return member_service.create_member(
+    return await member_service.create_member(
         member.name,
         member.household_id,
         member.image_url,
@@ -53,5 +53,5 @@ async def delete_member(
     member: Member = Depends(get_user_member),
     member_service: MemberService = Depends(get_member_service),
 ):
-    member_service.delete_member(member.id)
+    await member_service.delete_member(member.id)
     return DeleteMemberResponse(success=True)
@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+
+from db.engine import get_pool_status
+from db.pool import pool_metrics
+from schemas.metrics import (
+    CacheMetricsResponse,
+    HistogramResponse,
+    MetricsResponse,
+    PasswordHasherMetricsResponse,
+    PoolMetricsResponse,
+)
+from services.expense_category import category_cache
+from services.password import password_hasher
+from services.session import session_cache
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", response_model=MetricsResponse)
+async def get_metrics():
+    """Get connection pool usage, checkout latency, cache and password hashing counters."""
+    return MetricsResponse(
+        pool=PoolMetricsResponse(
+            **get_pool_status(),
+            timeouts=pool_metrics.timeouts,
+            checkout_latency=HistogramResponse(**pool_metrics.checkout_latency.snapshot()),
+        ),
+        session_cache=CacheMetricsResponse(**session_cache.stats()),
+        category_cache=CacheMetricsResponse(**category_cache.stats()),
+        password_hasher=PasswordHasherMetricsResponse(
+            pending=password_hasher.pending,
+            rejected=password_hasher.rejected,
+            duration=HistogramResponse(**password_hasher.duration.snapshot()),
+        ),
+    )
@@ -1,5 +1,11 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Optional
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.status import HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+from core.config import settings
+from schemas.bulk_import import BulkImportResponse, BulkImportRowError
 from schemas.expense import (
     CreateExpenseRequest,
     CreateExpenseResponse,
@@ -14,9 +20,11 @@ from schemas.income import (
 )
 from schemas.monthly_budget import (
     GetOrCreateMonthlyBudgetResponse,
+    MonthlyBudgetSummaryResponse,
     UpdateMonthlyBudgetRequest,
     UpdateMonthlyBudgetResponse,
 )
+from services.bulk_import import is_supported_content_type, iter_records
 from services.expense import ExpenseService, get_expense_service
 from services.income import IncomeService, get_income_service
 from services.monthly_budget import MonthlyBudgetService, get_monthly_budget_service
@@ -30,12 +38,12 @@ router = APIRouter(prefix="/monthly_budgets", tags=["Monthly Budgets"])
 @router.post("", response_model=GetOrCreateMonthlyBudgetResponse)
 async def get_or_create_monthly_budget(
     household_id: int,
-    year: int,
-    month: int,
+    year: int = Query(ge=1, le=9999),
+    month: int = Query(ge=1, le=12),
     monthly_budget_service: MonthlyBudgetService = Depends(get_monthly_budget_service),
 ):
     """Get an existing monthly budget or create a new one for the given month/year."""
-    monthly_budget = monthly_budget_service.get_or_create(household_id, year, month)
+    monthly_budget = await monthly_budget_service.get_or_create(household_id, year, month)
     return GetOrCreateMonthlyBudgetResponse(
         id=monthly_budget.id,
         year=monthly_budget.year,
@@ -52,7 +60,7 @@ async def update_monthly_budget(
     monthly_budget_service: MonthlyBudgetService = Depends(get_monthly_budget_service),
 ):
     """Update the planned budget and/or currency for a monthly budget."""
-    monthly_budget = monthly_budget_service.update(
+    monthly_budget = await monthly_budget_service.update(
         monthly_budget_id,
         request.planned_budget,
         request.currency,
@@ -64,17 +72,49 @@ async def update_monthly_budget(
     )
 
 
+@router.get("/{monthly_budget_id}/summary", response_model=MonthlyBudgetSummaryResponse)
+async def get_monthly_budget_summary(
+    monthly_budget_id: int,
+    monthly_budget_service: MonthlyBudgetService = Depends(get_monthly_budget_service),
+):
+    """Get planned versus actual spending, per-category totals, income and burn rate for a monthly budget."""
+    summary = await monthly_budget_service.get_summary(monthly_budget_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Monthly budget not found")
+    return MonthlyBudgetSummaryResponse(**summary)
+
+
 # ============ Expense Endpoints ============
 
 
 @router.get("/{monthly_budget_id}/expenses", response_model=GetExpensesResponse)
 async def get_expenses(
     monthly_budget_id: int,
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    cursor: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = Query(None, description="Exclusive"),
+    category_id: Optional[int] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
     expense_service: ExpenseService = Depends(get_expense_service),
 ):
-    """Get all expenses for a monthly budget."""
-    expenses = expense_service.get_by_budget(monthly_budget_id)
+    """Get a page of expenses for a monthly budget, newest first. Pass next_cursor back as cursor for the next page."""
+    try:
+        expenses, next_cursor = await expense_service.get_by_budget(
+            monthly_budget_id,
+            limit=limit,
+            cursor=cursor,
+            date_from=date_from,
+            date_to=date_to,
+            category_id=category_id,
+            min_amount=min_amount,
+            max_amount=max_amount,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     return GetExpensesResponse(
+        next_cursor=next_cursor,
         expenses=[
             ExpenseResponse(
                 id=e.id,
@@ -84,7 +124,7 @@ async def get_expenses(
                 date=e.date,
             )
             for e in expenses
-        ]
+        ],
     )
 
 
@@ -95,7 +135,7 @@ async def create_expense(
     expense_service: ExpenseService = Depends(get_expense_service),
 ):
     """Create a new expense for a monthly budget."""
-    expense = expense_service.create(
+    expense = await expense_service.create(
         monthly_budget_id=monthly_budget_id,
         amount=request.amount,
         description=request.description,
@@ -111,17 +151,63 @@ async def create_expense(
     )
 
 
+@router.post("/{monthly_budget_id}/expenses/bulk", response_model=BulkImportResponse)
+async def bulk_create_expenses(
+    monthly_budget_id: int,
+    request: Request,
+    expense_service: ExpenseService = Depends(get_expense_service),
+    monthly_budget_service: MonthlyBudgetService = Depends(get_monthly_budget_service),
+):
+    """Import expenses into a monthly budget from a streamed CSV (with header row) or NDJSON body."""
+    content_type = request.headers.get("content-type", "")
+    if not is_supported_content_type(content_type):
+        raise HTTPException(
+            status_code=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Body must be text/csv or application/x-ndjson",
+        )
+    if not await monthly_budget_service.get_by_id(monthly_budget_id):
+        raise HTTPException(status_code=404, detail="Monthly budget not found")
+
+    report = await expense_service.bulk_create(
+        iter_records(request.stream(), content_type),
+        monthly_budget_id=monthly_budget_id,
+    )
+    return BulkImportResponse(
+        inserted=report.inserted,
+        failed=len(report.errors),
+        errors=[BulkImportRowError(row=row, errors=messages) for row, messages in report.errors],
+    )
+
+
 # ============ Income Endpoints ============
 
 
 @router.get("/{monthly_budget_id}/income", response_model=GetIncomeResponse)
 async def get_income(
     monthly_budget_id: int,
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    cursor: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None, description="Filters on when the entry was created"),
+    date_to: Optional[datetime] = Query(None, description="Exclusive"),
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
     income_service: IncomeService = Depends(get_income_service),
 ):
-    """Get all income entries for a monthly budget."""
-    income_list = income_service.get_by_budget(monthly_budget_id)
+    """Get a page of income entries for a monthly budget, newest first."""
+    try:
+        income_list, next_cursor = await income_service.get_by_budget(
+            monthly_budget_id,
+            limit=limit,
+            cursor=cursor,
+            date_from=date_from,
+            date_to=date_to,
+            min_amount=min_amount,
+            max_amount=max_amount,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     return GetIncomeResponse(
+        next_cursor=next_cursor,
         income=[
             IncomeResponse(
                 id=i.id,
@@ -129,7 +215,7 @@ async def get_income(
                 source=i.source,
             )
             for i in income_list
-        ]
+        ],
     )
 
 
@@ -140,7 +226,7 @@ async def create_income(
     income_service: IncomeService = Depends(get_income_service),
 ):
     """Create a new income entry for a monthly budget."""
-    income = income_service.create(
+    income = await income_service.create(
         monthly_budget_id=monthly_budget_id,
         amount=request.amount,
         source=request.source,
@@ -0,0 +1,132 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.dependencies import verify_household_access
+from models.household import Household
+from models.recurring_template import RecurrenceFrequency, RecurringKind, RecurringTemplate
+from schemas.recurring import (
+    CreateRecurringTemplateRequest,
+    DeleteRecurringTemplateResponse,
+    GetRecurringTemplatesResponse,
+    MaterializeRecurringResponse,
+    RecurringTemplateResponse,
+    UpdateRecurringTemplateRequest,
+)
+from services.recurring import RecurringService, get_recurring_service
+
+router = APIRouter(prefix="/recurring", tags=["Recurring"])
+
+
+def _template_response(template: RecurringTemplate) -> RecurringTemplateResponse:
+    return RecurringTemplateResponse(
+        id=template.id,
+        short_id=template.short_id,
+        household_id=template.household_id,
+        kind=template.kind.value,
+        amount=template.amount,
+        description=template.description,
+        category_id=template.category_id,
+        frequency=template.frequency.value,
+        interval=template.interval,
+        start_date=template.start_date,
+        end_date=template.end_date,
+        materialized_through=template.materialized_through,
+        created_at=template.created_at,
+        updated_at=template.updated_at,
+    )
+
+
+# ============ Template Endpoints ============
+
+
+@router.get("/household/{household_id}", response_model=GetRecurringTemplatesResponse)
+async def get_templates_by_household(
+    household: Household = Depends(verify_household_access),
+    recurring_service: RecurringService = Depends(get_recurring_service),
+):
+    """Get all recurring expenses and income of a household."""
+    templates = await recurring_service.get_by_household(household.id)
+    return GetRecurringTemplatesResponse(templates=[_template_response(template) for template in templates])
+
+
+@router.post("/household/{household_id}", response_model=RecurringTemplateResponse)
+async def create_template(
+    request: CreateRecurringTemplateRequest,
+    household: Household = Depends(verify_household_access),
+    recurring_service: RecurringService = Depends(get_recurring_service),
+):
+    """Create a recurring expense or income. Occurrences up to the end of the current month are written at once."""
+    try:
+        template = await recurring_service.create(
+            household_id=household.id,
+            kind=RecurringKind(request.kind.value),
+            amount=request.amount,
+            description=request.description,
+            category_id=request.category_id,
+            frequency=RecurrenceFrequency(request.frequency.value),
+            interval=request.interval,
+            start_date=request.start_date,
+            end_date=request.end_date,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return _template_response(template)
+
+
+@router.post("/household/{household_id}/materialize", response_model=MaterializeRecurringResponse)
+async def materialize_templates(
+    household: Household = Depends(verify_household_access),
+    recurring_service: RecurringService = Depends(get_recurring_service),
+):
+    """Write the household's due recurring occurrences up to the end of the current month."""
+    expenses, income = await recurring_service.materialize(household_ids=[household.id])
+    return MaterializeRecurringResponse(expenses=expenses, income=income)
+
+
+@router.get("/{template_id}", response_model=RecurringTemplateResponse)
+async def get_template(
+    template_id: int,
+    recurring_service: RecurringService = Depends(get_recurring_service),
+):
+    """Get a single recurring template."""
+    template = await recurring_service.get_by_id(template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail="Recurring template not found")
+    return _template_response(template)
+
+
+@router.patch("/{template_id}", response_model=RecurringTemplateResponse)
+async def update_template(
+    template_id: int,
+    request: UpdateRecurringTemplateRequest,
+    recurring_service: RecurringService = Depends(get_recurring_service),
+):
+    """Update a recurring template. Occurrences already written are left as they are."""
+    try:
+        template = await recurring_service.update(
+            template_id=template_id,
+            amount=request.amount,
+            description=request.description,
+            category_id=request.category_id,
+            frequency=RecurrenceFrequency(request.frequency.value) if request.frequency else None,
+            interval=request.interval,
+            start_date=request.start_date,
+            end_date=request.end_date,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if not template:
+        raise HTTPException(status_code=404, detail="Recurring template not found")
+    return _template_response(template)
+
+
+@router.delete("/{template_id}", response_model=DeleteRecurringTemplateResponse)
+async def delete_template(
+    template_id: int,
+    recurring_service: RecurringService = Depends(get_recurring_service),
+):
+    """Delete a recurring template, keeping the expenses and income it already wrote."""
+    deleted = await recurring_service.delete(template_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Recurring template not found")
+
+    return DeleteRecurringTemplateResponse(success=True)
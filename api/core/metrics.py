@@ -0,0 +1,36 @@
+import threading
+
+# Upper bounds in milliseconds
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """Cumulative histogram of millisecond durations with fixed bucket bounds."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        with self._lock:
+            for i, bound in enumerate(self.buckets):
+                if value_ms <= bound:
+                    self._counts[i] += 1
+                    break
+            else:
+                self._counts[-1] += 1
+            self._count += 1
+            self._sum += value_ms
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(self.buckets, self._counts, strict=False):
+                cumulative += count
+                buckets[f"le_{bound}"] = cumulative
+            buckets["le_inf"] = self._count
+            return {"count": self._count, "sum_ms": self._sum, "buckets": buckets}
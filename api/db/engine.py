@@ -1,17 +1,45 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from core.config import settings
+from db.pool import InstrumentedAsyncQueuePool
 
 DATABASE_URL = settings.database_url
+# psycopg (v3) provides the asyncio driver
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="postgresql+psycopg")
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Postgres converts dates with an offset to the session time zone when storing them as timestamp
+options = [f"-c timezone={settings.db_timezone}"]
+if settings.db_statement_timeout > 0:
+    options.append(f"-c statement_timeout={settings.db_statement_timeout}")
+connect_args = {"options": " ".join(options)}
 
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args=connect_args,
+)
+# Objects stay loaded after commit so they can be read without implicit (blocking) refreshes
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
-def get_db():
-    db = SessionLocal()
-    try:
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def get_pool_status() -> dict:
+    """Get a point-in-time view of the connection pool."""
+    pool = async_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # SQLAlchemy reports unused base capacity as negative overflow
+        "overflow": max(pool.overflow(), 0),
+    }
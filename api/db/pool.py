@@ -0,0 +1,31 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.metrics import Histogram
+
+
+class PoolMetrics:
+    """Counters for connection checkouts from the database pool."""
+
+    def __init__(self):
+        self.checkout_latency = Histogram()
+        self.timeouts = 0
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        finally:
+            pool_metrics.checkout_latency.observe((time.perf_counter() - start) * 1000)
@@ -0,0 +1,38 @@
+import argparse
+import asyncio
+from datetime import date
+
+import models  # noqa: F401
+from db.engine import AsyncSessionLocal
+from services.recurring import RecurringService
+
+
+async def materialize(through: date | None, household_ids: list[int] | None) -> tuple[int, int]:
+    async with AsyncSessionLocal() as db:
+        return await RecurringService(db).materialize(through, household_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write due recurring expenses and income into monthly budgets. Safe to run repeatedly (nightly)."
+    )
+    parser.add_argument(
+        "--through",
+        type=date.fromisoformat,
+        help="Write occurrences up to this date (YYYY-MM-DD). Defaults to the end of the current month.",
+    )
+    parser.add_argument(
+        "--household-id",
+        dest="household_ids",
+        type=int,
+        action="append",
+        help="Only materialize the given household. Can be repeated. Covers every household when omitted.",
+    )
+    args = parser.parse_args()
+
+    expenses, income = asyncio.run(materialize(args.through, args.household_ids))
+    print(f"Wrote {expenses} recurring expense(s) and {income} recurring income entries")
+
+
+if __name__ == "__main__":
+    main()
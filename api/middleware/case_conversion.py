@@ -1,13 +1,22 @@
+import contextlib
 import json
 import re
+from functools import lru_cache
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster JSON serializer
+    orjson = None
 
+CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@lru_cache(maxsize=4096)
 def camel_to_snake(name: str) -> str:
-    """Convert camelCase to snake_case."""
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+    """Convert camelCase to snake_case. Memoized since payloads reuse a small set of keys."""
+    return CAMEL_BOUNDARY.sub("_", name).lower()
 
 
 def convert_keys_to_snake(obj):
@@ -19,24 +28,75 @@ def convert_keys_to_snake(obj):
     return obj
 
 
-class CaseConversionMiddleware(BaseHTTPMiddleware):
+def _snake_case_pairs(pairs: list[tuple[str, object]]) -> dict:
+    return {camel_to_snake(k): v for k, v in pairs}
+
+
+def loads_snake_case(body: bytes):
+    """Parse JSON with all object keys converted to snake_case."""
+    # Keys are rewritten while the parser builds each object, so there is no second walk. orjson has no such
+    # hook, and parsing with it then walking the result is slower than this on large bodies.
+    return json.loads(body, object_pairs_hook=_snake_case_pairs)
+
+
+def dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class CaseConversionMiddleware:
     """
     Middleware that converts incoming JSON request body keys from camelCase to snake_case
     """
 
-    async def dispatch(self, request: Request, call_next):
-        if request.method in ("POST", "PUT", "PATCH") and request.headers.get("content-type", "").startswith(
-            "application/json"
-        ):
-            body = await request.body()
-            if body:
-                try:
-                    data = json.loads(body)
-                    converted = convert_keys_to_snake(data)
-                    # Override request._body with converted data
-                    request._body = json.dumps(converted).encode()
-                except json.JSONDecodeError:
-                    # If body isn't valid JSON, let it pass through
-                    pass
-
-        return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT", "PATCH") or not self._is_json(scope):
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                # Client went away before sending the whole body
+                await self.app(scope, self._replay(message, receive), send)
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+
+        body = b"".join(chunks)
+        # If body isn't valid JSON, let it pass through
+        if body:
+            with contextlib.suppress(ValueError):
+                body = dumps(loads_snake_case(body))
+
+        headers = [(name, value) for name, value in scope["headers"] if name != b"content-length"]
+        headers.append((b"content-length", str(len(body)).encode()))
+        scope["headers"] = headers
+
+        message = {"type": "http.request", "body": body, "more_body": False}
+        await self.app(scope, self._replay(message, receive), send)
+
+    @staticmethod
+    def _is_json(scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == b"content-type":
+                return value.startswith(b"application/json")
+        return False
+
+    @staticmethod
+    def _replay(first_message: Message, receive: Receive) -> Receive:
+        """Build a receive callable that returns first_message once, then defers to the original."""
+        pending = [first_message]
+
+        async def replay_receive() -> Message:
+            if pending:
+                return pending.pop()
+            return await receive()
+
+        return replay_receive
@@ -1,42 +1,56 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.config import settings
-from db.engine import SessionLocal
-from services.session import SessionService
-
-
-class SessionRefreshMiddleware(BaseHTTPMiddleware):
-    """Middleware that refreshes sessions close to expiration."""
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
-
-        # Only process if there's a session cookie
-        token = request.cookies.get(settings.session_cookie_name)
-        if not token:
-            return response
-
-        # Check if session needs refresh
-        db = SessionLocal()
-        try:
-            session_service = SessionService(db)
-            session = session_service.get_valid_session(token)
-
-            if session and session_service.should_refresh_session(session):
-                session_service.refresh_session(session)
-                # Update the cookie with extended expiration
-                response.set_cookie(
-                    key=settings.session_cookie_name,
-                    value=token,
-                    max_age=settings.session_token_expiration_time,
-                    httponly=True,
-                    secure=settings.cookie_secure,
-                    samesite=settings.cookie_samesite,
-                    domain=settings.cookie_domain,
-                )
-        finally:
-            db.close()
-
-        return response
+from services.session import SessionService, session_refresh_queue
+
+
+def _session_cookie_header(token: str) -> str:
+    response = Response()
+    response.set_cookie(
+        key=settings.session_cookie_name,
+        value=token,
+        max_age=settings.session_token_expiration_time,
+        httponly=True,
+        secure=settings.cookie_secure,
+        samesite=settings.cookie_samesite,
+        domain=settings.cookie_domain,
+    )
+    return response.headers["set-cookie"]
+
+
+class SessionRefreshMiddleware:
+    """Middleware that refreshes sessions close to expiration.
+
+    Reuses the session resolved by the auth dependencies (``request.state.session``) and hands
+    the expiry update to a background writer, so requests never wait on a refresh.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_with_refresh(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._refresh(state.get("session"), MutableHeaders(scope=message))
+            await send(message)
+
+        await self.app(scope, receive, send_with_refresh)
+
+    @staticmethod
+    def _refresh(session, headers: MutableHeaders) -> None:
+        if session is None or not SessionService.should_refresh_session(session):
+            return
+        # Login and logout set the cookie themselves
+        cookie_prefix = f"{settings.session_cookie_name}="
+        if any(value.startswith(cookie_prefix) for value in headers.getlist("set-cookie")):
+            return
+        if session_refresh_queue.schedule(session):
+            headers.append("set-cookie", _session_cookie_header(session.token))
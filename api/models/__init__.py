@@ -1,16 +1,21 @@
 from .expense import Expense
 from .expense_category import ExpenseCategory
 from .household import Household
+from .household_daily_rollup import HouseholdDailyRollup
 from .income import Income
 from .investment_asset import InvestmentAsset
+from .investment_position import InvestmentPosition
 from .investment_transaction import InvestmentTransaction
 from .investment_valuation_snapshot import InvestmentValuationSnapshot
 from .loan import Loan
+from .loan_adjustment import LoanAdjustment
 from .loan_member import LoanMember
 from .loan_payment import LoanPayment
 from .loan_snapshot import LoanSnapshot
 from .member import Member
 from .monthly_budget import MonthlyBudget
+from .monthly_category_spend import MonthlyCategorySpend
+from .recurring_template import RecurringTemplate
 from .session import Session
 from .user import User
 
@@ -18,16 +23,21 @@ __all__ = [
     "Expense",
     "ExpenseCategory",
     "Household",
+    "HouseholdDailyRollup",
     "Income",
     "InvestmentAsset",
+    "InvestmentPosition",
     "InvestmentTransaction",
     "InvestmentValuationSnapshot",
     "Loan",
+    "LoanAdjustment",
     "LoanMember",
     "LoanPayment",
     "LoanSnapshot",
     "Member",
     "MonthlyBudget",
+    "MonthlyCategorySpend",
+    "RecurringTemplate",
     "Session",
     "User",
 ]
@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import datetime  # noqa: TC003
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Computed, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -15,11 +16,26 @@ if TYPE_CHECKING:
 
 class Expense(Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_monthly_budget_id_date", "monthly_budget_id", "date", "id"),
+        Index("ix_expenses_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram index (pg_trgm) for fuzzy matching
+        Index(
+            "ix_expenses_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
 
     amount: Mapped[float] = mapped_column(Float)
     description: Mapped[str] = mapped_column(String)
+    # Words of the description for full-text search, kept up to date by Postgres
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed("to_tsvector('simple', description)", persisted=True), deferred=True
+    )
     date: Mapped[datetime] = mapped_column(DateTime)
-    category_id: Mapped[int] = mapped_column(Integer, ForeignKey("expense_categories.id"))
+    category_id: Mapped[int] = mapped_column(Integer, ForeignKey("expense_categories.id"), index=True)
     category: Mapped[ExpenseCategory] = relationship("ExpenseCategory", back_populates="expenses")
     monthly_budget_id: Mapped[int] = mapped_column(Integer, ForeignKey("monthly_budgets.id"))
     monthly_budget: Mapped[MonthlyBudget] = relationship("MonthlyBudget", back_populates="expenses")
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+from datetime import date  # noqa: TC003
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import Date, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
 
 if TYPE_CHECKING:
+    from models.household_daily_rollup import HouseholdDailyRollup
     from models.investment_asset import InvestmentAsset
     from models.investment_transaction import InvestmentTransaction
     from models.loan import Loan
     from models.member import Member
     from models.monthly_budget import MonthlyBudget
+    from models.recurring_template import RecurringTemplate
     from models.user import User
 
 
@@ -26,7 +29,11 @@ class Household(Base):
     )
     monthly_budgets: Mapped[list[MonthlyBudget]] = relationship("MonthlyBudget", back_populates="household")
     loans: Mapped[list[Loan]] = relationship("Loan", back_populates="household")
+    daily_rollups: Mapped[list[HouseholdDailyRollup]] = relationship("HouseholdDailyRollup", back_populates="household")
+    recurring_templates: Mapped[list[RecurringTemplate]] = relationship("RecurringTemplate", back_populates="household")
 
     name: Mapped[str] = mapped_column(String)
-    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
     owner: Mapped[User] = relationship("User", back_populates="households")
+    # Earliest day whose daily rollup is out of date, or None when rollups are current
+    rollup_stale_from: Mapped[date | None] = mapped_column(Date, nullable=True)
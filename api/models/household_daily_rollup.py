@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, Float, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from db.base import Base
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from models.household import Household
+
+
+class HouseholdDailyRollup(Base):
+    """
+    A household's balances at the end of a day, rebuilt from the stale date onward after any change.
+    Rollups are derived data, so they have no short_id.
+    """
+
+    __tablename__ = "household_daily_rollup"
+    __table_args__ = (UniqueConstraint("household_id", "date", name="uq_household_daily_rollup_household_id_date"),)
+
+    household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"))
+    household: Mapped[Household] = relationship("Household", back_populates="daily_rollups")
+    date: Mapped[date] = mapped_column(Date)
+    investment_value: Mapped[float] = mapped_column(Float)
+    loan_balance: Mapped[float] = mapped_column(Float)
+    # Income and expenses booked on the day; savings is their running total
+    income: Mapped[float] = mapped_column(Float)
+    expenses: Mapped[float] = mapped_column(Float)
+    savings: Mapped[float] = mapped_column(Float)
+    net_worth: Mapped[float] = mapped_column(Float)
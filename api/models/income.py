@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy import Computed, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -13,8 +14,23 @@ if TYPE_CHECKING:
 
 class Income(Base):
     __tablename__ = "income"
+    __table_args__ = (
+        Index("ix_income_monthly_budget_id_created_at", "monthly_budget_id", "created_at", "id"),
+        Index("ix_income_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram index (pg_trgm) for fuzzy matching
+        Index(
+            "ix_income_source_trgm",
+            "source",
+            postgresql_using="gin",
+            postgresql_ops={"source": "gin_trgm_ops"},
+        ),
+    )
 
     amount: Mapped[float] = mapped_column(Float)
     source: Mapped[str] = mapped_column(String)
+    # Words of the source for full-text search, kept up to date by Postgres
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed("to_tsvector('simple', source)", persisted=True), deferred=True
+    )
     monthly_budget_id: Mapped[int] = mapped_column(Integer, ForeignKey("monthly_budgets.id"))
     monthly_budget: Mapped[MonthlyBudget] = relationship("MonthlyBudget", back_populates="incomes")
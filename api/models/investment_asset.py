@@ -3,13 +3,14 @@ from __future__ import annotations
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, Integer, String
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
 
 if TYPE_CHECKING:
     from models.household import Household
+    from models.investment_position import InvestmentPosition
     from models.investment_transaction import InvestmentTransaction
     from models.investment_valuation_snapshot import InvestmentValuationSnapshot
     from models.member import Member
@@ -22,6 +23,10 @@ class ValuationMode(PyEnum):
 
 class InvestmentAsset(Base):
     __tablename__ = "investment_asset"
+    __table_args__ = (
+        Index("ix_investment_asset_household_id_created_at", "household_id", "created_at"),
+        Index("ix_investment_asset_member_id_created_at", "member_id", "created_at"),
+    )
 
     investment_transactions: Mapped[list[InvestmentTransaction]] = relationship(
         "InvestmentTransaction", back_populates="asset"
@@ -29,6 +34,9 @@ class InvestmentAsset(Base):
     valuation_snapshots: Mapped[list[InvestmentValuationSnapshot]] = relationship(
         "InvestmentValuationSnapshot", back_populates="asset"
     )
+    position: Mapped[InvestmentPosition | None] = relationship(
+        "InvestmentPosition", back_populates="asset", uselist=False
+    )
 
     household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"))
     household: Mapped[Household] = relationship("Household", back_populates="investment_assets")
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from db.base import Base
+
+if TYPE_CHECKING:
+    from models.investment_asset import InvestmentAsset
+
+
+class InvestmentPosition(Base):
+    """Running totals for an asset, maintained incrementally on every transaction write."""
+
+    __tablename__ = "investment_position"
+
+    asset_id: Mapped[int] = mapped_column(Integer, ForeignKey("investment_asset.id"), unique=True, index=True)
+    asset: Mapped[InvestmentAsset] = relationship("InvestmentAsset", back_populates="position")
+    quantity: Mapped[int] = mapped_column(Integer, default=0)
+    buy_total: Mapped[float] = mapped_column(Float, default=0.0)
+    sell_total: Mapped[float] = mapped_column(Float, default=0.0)
+    fee_total: Mapped[float] = mapped_column(Float, default=0.0)
+    realized_income: Mapped[float] = mapped_column(Float, default=0.0)
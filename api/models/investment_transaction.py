@@ -3,7 +3,7 @@ from __future__ import annotations
 import enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy import Date, Enum, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -25,10 +25,11 @@ class TransactionType(enum.Enum):
 
 class InvestmentTransaction(Base):
     __tablename__ = "investment_transaction"
+    __table_args__ = (Index("ix_investment_transaction_asset_id_date", "asset_id", "date", "id"),)
 
-    household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"))
+    household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"), index=True)
     household: Mapped[Household] = relationship("Household", back_populates="investment_transactions")
-    member_id: Mapped[int] = mapped_column(Integer, ForeignKey("member.id"))
+    member_id: Mapped[int] = mapped_column(Integer, ForeignKey("member.id"), index=True)
     member: Mapped[Member] = relationship("Member", back_populates="investment_transactions")
     asset_id: Mapped[int] = mapped_column(Integer, ForeignKey("investment_asset.id"))
     asset: Mapped[InvestmentAsset] = relationship("InvestmentAsset", back_populates="investment_transactions")
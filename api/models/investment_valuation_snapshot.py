@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, Float, ForeignKey, Integer, String
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 class InvestmentValuationSnapshot(Base):
     __tablename__ = "investment_valuation_snapshot"
+    # Also serves the latest-valuation lookup (DISTINCT ON asset_id ORDER BY date DESC, id DESC)
+    __table_args__ = (Index("ix_investment_valuation_snapshot_asset_id_date", "asset_id", "date", "id"),)
 
     asset_id: Mapped[int] = mapped_column(Integer, ForeignKey("investment_asset.id"))
     asset: Mapped[InvestmentAsset] = relationship("InvestmentAsset", back_populates="valuation_snapshots")
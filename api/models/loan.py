@@ -10,6 +10,7 @@ from db.base import Base
 
 if TYPE_CHECKING:
     from models.household import Household
+    from models.loan_adjustment import LoanAdjustment
     from models.loan_member import LoanMember
     from models.loan_payment import LoanPayment
     from models.loan_snapshot import LoanSnapshot
@@ -20,8 +21,9 @@ class Loan(Base):
     loan_members: Mapped[list[LoanMember]] = relationship("LoanMember", back_populates="loan")
     loan_payments: Mapped[list[LoanPayment]] = relationship("LoanPayment", back_populates="loan")
     loan_snapshots: Mapped[list[LoanSnapshot]] = relationship("LoanSnapshot", back_populates="loan")
+    loan_adjustments: Mapped[list[LoanAdjustment]] = relationship("LoanAdjustment", back_populates="loan")
 
-    household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"))
+    household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"), index=True)
     household: Mapped[Household] = relationship("Household", back_populates="loans")
     name: Mapped[str] = mapped_column(String)
     loan_type: Mapped[str] = mapped_column(String)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import enum
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, Enum, Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from db.base import Base
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from models.loan import Loan
+
+
+class AdjustmentType(enum.Enum):
+    EXTRA_PAYMENT = "extra_payment"
+    RATE_CHANGE = "rate_change"
+
+
+class LoanAdjustment(Base):
+    """An extra payment or interest rate change that alters a loan's amortization schedule."""
+
+    __tablename__ = "loan_adjustment"
+    __table_args__ = (Index("ix_loan_adjustment_loan_id_date", "loan_id", "date"),)
+
+    loan_id: Mapped[int] = mapped_column(Integer, ForeignKey("loan.id"))
+    loan: Mapped[Loan] = relationship("Loan", back_populates="loan_adjustments")
+    adjustment_type: Mapped[AdjustmentType] = mapped_column(Enum(AdjustmentType))
+    date: Mapped[date] = mapped_column(Date)
+    # Extra payment amount, or the new annual interest rate in percent
+    value: Mapped[float] = mapped_column(Float)
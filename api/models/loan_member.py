@@ -15,8 +15,8 @@ if TYPE_CHECKING:
 class LoanMember(Base):
     __tablename__ = "loan_member"
 
-    loan_id: Mapped[int] = mapped_column(Integer, ForeignKey("loan.id"))
+    loan_id: Mapped[int] = mapped_column(Integer, ForeignKey("loan.id"), index=True)
     loan: Mapped[Loan] = relationship("Loan", back_populates="loan_members")
-    member_id: Mapped[int] = mapped_column(Integer, ForeignKey("member.id"))
+    member_id: Mapped[int] = mapped_column(Integer, ForeignKey("member.id"), index=True)
     member: Mapped[Member] = relationship("Member", back_populates="loan_members")
     share_percent: Mapped[float] = mapped_column(Float)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, Float, ForeignKey, Integer
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -14,7 +14,10 @@ if TYPE_CHECKING:
 
 
 class LoanSnapshot(Base):
+    """Outstanding principal on a date. Rewritten whenever the schedule is recalculated, so it has no short_id."""
+
     __tablename__ = "loan_snapshot"
+    __table_args__ = (Index("ix_loan_snapshot_loan_id_date", "loan_id", "date"),)
 
     loan_id: Mapped[int] = mapped_column(Integer, ForeignKey("loan.id"))
     loan: Mapped[Loan] = relationship("Loan", back_populates="loan_snapshots")
@@ -25,5 +25,5 @@ class Member(Base):
 
     name: Mapped[str] = mapped_column(String)
     image_url: Mapped[str | None] = mapped_column(String, nullable=True)
-    household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"))
+    household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"), index=True)
     household: Mapped[Household] = relationship("Household", back_populates="members")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base import Base
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 class MonthlyBudget(Base):
     __tablename__ = "monthly_budgets"
+    __table_args__ = (
+        UniqueConstraint("household_id", "year", "month", name="uq_monthly_budgets_household_id_year_month"),
+        Index("ix_monthly_budgets_household_id_created_at", "household_id", "created_at"),
+    )
 
     expenses: Mapped[list[Expense]] = relationship("Expense", back_populates="monthly_budget")
     incomes: Mapped[list[Income]] = relationship("Income", back_populates="monthly_budget")
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from sqlalchemy import Float, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class MonthlyCategorySpend(Base):
+    """
+    Total and count of a budget's expenses in one category, maintained incrementally on every expense write.
+    Derived data, so it has no short_id and goes away with its budget or category.
+    """
+
+    __tablename__ = "monthly_category_spend"
+    __table_args__ = (
+        UniqueConstraint(
+            "monthly_budget_id", "category_id", name="uq_monthly_category_spend_monthly_budget_id_category_id"
+        ),
+    )
+
+    monthly_budget_id: Mapped[int] = mapped_column(Integer, ForeignKey("monthly_budgets.id", ondelete="CASCADE"))
+    category_id: Mapped[int] = mapped_column(Integer, ForeignKey("expense_categories.id", ondelete="CASCADE"))
+    total: Mapped[float] = mapped_column(Float, default=0.0)
+    count: Mapped[int] = mapped_column(Integer, default=0)
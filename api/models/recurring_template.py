@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import enum
+from datetime import date  # noqa: TC003
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from db.base import Base
+
+if TYPE_CHECKING:
+    from models.expense_category import ExpenseCategory
+    from models.household import Household
+
+
+class RecurringKind(enum.Enum):
+    EXPENSE = "expense"
+    INCOME = "income"
+
+
+class RecurrenceFrequency(enum.Enum):
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+
+
+class RecurringTemplate(Base):
+    """An expense or income that repeats, written into the monthly budgets as its occurrences come due."""
+
+    __tablename__ = "recurring_template"
+
+    household_id: Mapped[int] = mapped_column(Integer, ForeignKey("household.id"), index=True)
+    household: Mapped[Household] = relationship("Household", back_populates="recurring_templates")
+    kind: Mapped[RecurringKind] = mapped_column(Enum(RecurringKind))
+    amount: Mapped[float] = mapped_column(Float)
+    # Description of the expenses, or source of the income
+    description: Mapped[str] = mapped_column(String)
+    category_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("expense_categories.id"), nullable=True)
+    category: Mapped[ExpenseCategory | None] = relationship("ExpenseCategory")
+    frequency: Mapped[RecurrenceFrequency] = mapped_column(Enum(RecurrenceFrequency))
+    interval: Mapped[int] = mapped_column(Integer, default=1)  # Every interval weeks, months or years
+    start_date: Mapped[date] = mapped_column(Date)
+    end_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    # Last day whose occurrences have been written, or None when nothing has been yet
+    materialized_through: Mapped[date | None] = mapped_column(Date, nullable=True)
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 class Session(Base):
     __tablename__ = "sessions"
 
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
     user: Mapped[User] = relationship("User", back_populates="sessions")
     token: Mapped[str] = mapped_column(String, index=True, unique=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime)
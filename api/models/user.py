@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from passlib.context import CryptContext
 from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,8 +11,6 @@ if TYPE_CHECKING:
     from models.household import Household
     from models.session import Session
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
-
 
 class User(Base):
     __tablename__ = "users"
@@ -24,9 +21,3 @@ class User(Base):
     username: Mapped[str] = mapped_column(String, unique=True, index=True)
     email: Mapped[str] = mapped_column(String, unique=True, index=True)
     password: Mapped[str] = mapped_column(String)
-
-    def check_password(self, plain_password: str) -> bool:
-        return pwd_context.verify(plain_password, self.password)
-
-    def set_password(self, plain_password: str) -> None:
-        self.password = pwd_context.hash(plain_password)
@@ -0,0 +1,30 @@
+import argparse
+import asyncio
+
+import models  # noqa: F401
+from db.engine import AsyncSessionLocal
+from services.investment import InvestmentService
+
+
+async def rebuild(asset_ids: list[int] | None) -> int:
+    async with AsyncSessionLocal() as db:
+        return await InvestmentService(db).rebuild_positions(asset_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild materialized investment positions from transaction history.")
+    parser.add_argument(
+        "--asset-id",
+        dest="asset_ids",
+        type=int,
+        action="append",
+        help="Only rebuild the given asset. Can be repeated. Rebuilds every asset when omitted.",
+    )
+    args = parser.parse_args()
+
+    count = asyncio.run(rebuild(args.asset_ids))
+    print(f"Rebuilt {count} investment position(s)")
+
+
+if __name__ == "__main__":
+    main()
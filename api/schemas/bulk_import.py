@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class BulkImportRowError(BaseModel):
+    row: int
+    errors: list[str]
+
+
+class BulkImportResponse(BaseModel):
+    inserted: int
+    failed: int
+    errors: list[BulkImportRowError]
@@ -1,7 +1,10 @@
 from datetime import datetime
 from typing import Optional
+from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+from core.config import settings
 
 
 class ExpenseBase(BaseModel):
@@ -18,6 +21,27 @@ class CreateExpenseRequest(BaseModel):
     date: Optional[datetime] = None
 
 
+class BulkExpenseRow(BaseModel):
+    amount: float
+    description: str = ""
+    category_id: int
+    date: Optional[datetime] = None
+
+    @field_validator("date")
+    @classmethod
+    def to_db_time(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # Rows are COPYed as text into a timestamp column, where Postgres would drop the offset. Convert to naive
+        # time in the database's zone instead, as a single insert stores it.
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(ZoneInfo(settings.db_timezone)).replace(tzinfo=None)
+        return value
+
+
+class ImportExpenseRow(BulkExpenseRow):
+    # Household imports place each row in the monthly budget for its date
+    date: datetime
+
+
 class CreateExpenseResponse(BaseModel):
     id: int
     amount: float
@@ -54,6 +78,7 @@ class ExpenseResponse(BaseModel):
 
 class GetExpensesResponse(BaseModel):
     expenses: list[ExpenseResponse]
+    next_cursor: Optional[str] = None
 
 
 class DeleteExpenseResponse(BaseModel):
@@ -36,6 +36,7 @@ class IncomeResponse(BaseModel):
 
 class GetIncomeResponse(BaseModel):
     income: list[IncomeResponse]
+    next_cursor: Optional[str] = None
 
 
 class DeleteIncomeResponse(BaseModel):
@@ -2,7 +2,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # Enums
@@ -157,6 +157,18 @@ class CreateTransactionResponse(BaseModel):
         from_attributes = True
 
 
+class ImportTransactionRow(BaseModel):
+    symbol: str = Field(min_length=1)
+    name: Optional[str] = None  # Used when the import creates the asset
+    currency: Optional[str] = None
+    transaction_type: TransactionType
+    quantity: int = Field(gt=0)  # Holdings are whole units, so fractional quantities are rejected
+    date: date
+    price_per_unit: float
+    fees: Optional[float] = None
+    note: Optional[str] = None
+
+
 class UpdateTransactionRequest(BaseModel):
     transaction_type: Optional[TransactionType] = None
     quantity: Optional[float] = None
@@ -168,6 +180,7 @@ class UpdateTransactionRequest(BaseModel):
 
 class GetTransactionsResponse(BaseModel):
     transactions: list[TransactionResponse]
+    next_cursor: Optional[str] = None
 
 
 class DeleteTransactionResponse(BaseModel):
@@ -230,6 +243,48 @@ class PortfolioSummaryResponse(BaseModel):
     sold_assets: int
 
 
+# Portfolio History
+class AssetHistory(BaseModel):
+    asset_id: int
+    name: str
+    symbol: Optional[str] = None
+    quantities: list[float]
+    values: list[Optional[float]]  # None while units are held but no valuation is known yet
+
+
+class PortfolioHistoryResponse(BaseModel):
+    interval: str
+    dates: list[date]
+    total_values: list[float]
+    assets: list[AssetHistory]
+
+
+# Returns
+class SeriesReturns(BaseModel):
+    current_value: Optional[float] = None  # None while units are held but no valuation is known yet
+    income: float  # Dividends and interest, net of fees
+    xirr: Optional[float] = None  # Money-weighted annual return, as a fraction
+    twr: Optional[float] = None  # Time-weighted return since the first transaction, as a fraction
+    annualized_twr: Optional[float] = None
+
+
+class AssetReturns(SeriesReturns):
+    asset_id: int
+    name: str
+    asset_type: str
+
+
+class AssetTypeReturns(SeriesReturns):
+    asset_type: str
+
+
+class PortfolioReturnsResponse(BaseModel):
+    as_of: date
+    total: SeriesReturns
+    asset_types: list[AssetTypeReturns]
+    assets: list[AssetReturns]
+
+
 # Asset Detail (includes transactions and valuations)
 class AssetDetailResponse(BaseModel):
     asset: AssetWithMetricsResponse
@@ -0,0 +1,139 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+# Enums
+class AdjustmentType(str, Enum):
+    EXTRA_PAYMENT = "extra_payment"
+    RATE_CHANGE = "rate_change"
+
+
+# Loan Schemas
+class LoanMemberShare(BaseModel):
+    member_id: int
+    share_percent: float = Field(gt=0, le=100)
+
+
+class CreateLoanRequest(BaseModel):
+    name: str
+    loan_type: str
+    currency: str
+    principal: float = Field(gt=0)
+    interest_rate: float = Field(ge=0)  # Annual, in percent
+    start_date: date
+    end_date: date
+    members: list[LoanMemberShare] = []
+
+
+class UpdateLoanRequest(BaseModel):
+    name: Optional[str] = None
+    loan_type: Optional[str] = None
+    currency: Optional[str] = None
+    principal: Optional[float] = Field(None, gt=0)
+    interest_rate: Optional[float] = Field(None, ge=0)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    members: Optional[list[LoanMemberShare]] = None
+
+
+class LoanResponse(BaseModel):
+    id: int
+    short_id: str
+    household_id: int
+    name: str
+    loan_type: str
+    currency: str
+    principal: float
+    interest_rate: float
+    start_date: date
+    end_date: date
+    members: list[LoanMemberShare]
+    remaining_balance: float
+    created_at: datetime
+    updated_at: datetime
+
+
+class GetLoansResponse(BaseModel):
+    loans: list[LoanResponse]
+
+
+class DeleteLoanResponse(BaseModel):
+    success: bool
+
+
+# Adjustment Schemas
+class CreateAdjustmentRequest(BaseModel):
+    adjustment_type: AdjustmentType
+    date: date
+    value: float = Field(ge=0)  # Extra payment amount, or the new annual interest rate in percent
+
+
+class AdjustmentResponse(BaseModel):
+    id: int
+    short_id: str
+    loan_id: int
+    adjustment_type: str
+    date: date
+    value: float
+    created_at: datetime
+
+
+class DeleteAdjustmentResponse(BaseModel):
+    success: bool
+
+
+# Schedule Schemas
+class SchedulePaymentResponse(BaseModel):
+    date: date
+    amount: float
+    interest_amount: float
+    principal_amount: float
+    remaining_balance: float
+
+
+class LoanScheduleResponse(BaseModel):
+    loan_id: int
+    total_interest: float
+    payments: list[SchedulePaymentResponse]
+
+
+class LoanBalanceResponse(BaseModel):
+    loan_id: int
+    date: date
+    remaining_balance: float
+    interest_paid: float
+
+
+class RecalculateLoansResponse(BaseModel):
+    loans: int
+    payments: int
+    snapshots: int
+
+
+# Debt Allocation Schemas
+class DebtAmounts(BaseModel):
+    outstanding_principal: float
+    monthly_payment: float
+    monthly_interest: float
+    interest_paid: float
+
+
+class MemberDebtResponse(BaseModel):
+    member_id: int
+    member_name: str
+    loan_count: int
+    outstanding_principal: float
+    monthly_payment: float
+    monthly_interest: float
+    interest_paid: float
+
+
+class HouseholdDebtResponse(BaseModel):
+    date: date
+    loan_count: int
+    total: DebtAmounts
+    unallocated: DebtAmounts
+    members: list[MemberDebtResponse]
@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+
+
+class HistogramResponse(BaseModel):
+    count: int
+    sum_ms: float
+    buckets: dict[str, int]
+
+
+class PoolMetricsResponse(BaseModel):
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    timeouts: int
+    checkout_latency: HistogramResponse
+
+
+class CacheMetricsResponse(BaseModel):
+    size: int
+    hits: int
+    misses: int
+
+
+class PasswordHasherMetricsResponse(BaseModel):
+    pending: int
+    rejected: int
+    duration: HistogramResponse
+
+
+class MetricsResponse(BaseModel):
+    pool: PoolMetricsResponse
+    session_cache: CacheMetricsResponse
+    category_cache: CacheMetricsResponse
+    password_hasher: PasswordHasherMetricsResponse
@@ -20,3 +20,58 @@ class UpdateMonthlyBudgetResponse(BaseModel):
     id: int
     planned_budget: float
     currency: str
+
+
+class CategorySummary(BaseModel):
+    category_id: int
+    name: str
+    color: str
+    color_code: Optional[str] = None
+    total: float
+    count: int
+
+
+class MonthlyBudgetSummaryResponse(BaseModel):
+    id: int
+    year: int
+    month: int
+    currency: str
+    planned_budget: float
+    total_expenses: float
+    expense_count: int
+    total_income: float
+    income_count: int
+    remaining_budget: float  # Negative when over budget
+    days_in_month: int
+    days_elapsed: int
+    daily_burn_rate: float  # Average spending per elapsed day
+    projected_expenses: float  # Spending by the end of the month at the current burn rate
+    categories: list[CategorySummary]  # Largest total first
+
+
+class SpendTrend(BaseModel):
+    total: float
+    count: int
+    rolling_3_month_average: float
+    rolling_12_month_average: float
+    previous_year_total: Optional[float] = None  # None when there is no data for the same month a year earlier
+    year_over_year_change: Optional[float] = None
+    year_over_year_percentage: Optional[float] = None
+
+
+class CategoryMonthAnalytics(SpendTrend):
+    category_id: int
+    name: str
+    color: str
+    color_code: Optional[str] = None
+    share_percentage: float  # Of the month's total spending
+
+
+class MonthAnalytics(SpendTrend):
+    year: int
+    month: int
+    categories: list[CategoryMonthAnalytics]  # Largest total first
+
+
+class BudgetAnalyticsResponse(BaseModel):
+    months: list[MonthAnalytics]
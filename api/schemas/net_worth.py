@@ -0,0 +1,26 @@
+from datetime import date
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+# Enums
+class NetWorthInterval(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class NetWorthPoint(BaseModel):
+    date: date
+    investment_value: float
+    loan_balance: float
+    savings: float  # Running total of income minus expenses
+    income: float
+    expenses: float
+    net_worth: float
+
+
+class NetWorthResponse(BaseModel):
+    interval: NetWorthInterval
+    points: list[NetWorthPoint]
@@ -0,0 +1,69 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+# Enums
+class RecurringKind(str, Enum):
+    EXPENSE = "expense"
+    INCOME = "income"
+
+
+class RecurrenceFrequency(str, Enum):
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+
+
+# Template Schemas
+class CreateRecurringTemplateRequest(BaseModel):
+    kind: RecurringKind
+    amount: float = Field(gt=0)
+    description: str  # Source, for income
+    category_id: Optional[int] = None  # Required for expenses
+    frequency: RecurrenceFrequency
+    interval: int = Field(1, ge=1)  # Every interval weeks, months or years
+    start_date: date
+    end_date: Optional[date] = None
+
+
+class UpdateRecurringTemplateRequest(BaseModel):
+    amount: Optional[float] = Field(None, gt=0)
+    description: Optional[str] = None
+    category_id: Optional[int] = None
+    frequency: Optional[RecurrenceFrequency] = None
+    interval: Optional[int] = Field(None, ge=1)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+class RecurringTemplateResponse(BaseModel):
+    id: int
+    short_id: str
+    household_id: int
+    kind: RecurringKind
+    amount: float
+    description: str
+    category_id: Optional[int] = None
+    frequency: RecurrenceFrequency
+    interval: int
+    start_date: date
+    end_date: Optional[date] = None
+    materialized_through: Optional[date] = None  # Occurrences up to this day have been written
+    created_at: datetime
+    updated_at: datetime
+
+
+class GetRecurringTemplatesResponse(BaseModel):
+    templates: list[RecurringTemplateResponse]
+
+
+class DeleteRecurringTemplateResponse(BaseModel):
+    success: bool
+
+
+class MaterializeRecurringResponse(BaseModel):
+    expenses: int
+    income: int
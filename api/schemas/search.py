@@ -0,0 +1,29 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+# Enums
+class SearchResultKind(str, Enum):
+    EXPENSE = "expense"
+    INCOME = "income"
+
+
+class SearchResult(BaseModel):
+    kind: SearchResultKind
+    id: int
+    year: int  # Month of the budget the row belongs to
+    month: int
+    date: datetime
+    amount: float
+    text: str  # Expense description or income source
+    highlight: str  # HTML-escaped text with matched words wrapped in <mark>
+    category_id: Optional[int] = None  # Expenses only
+    score: float  # Higher is a better match
+
+
+class SearchResponse(BaseModel):
+    results: list[SearchResult]  # Best match first
+    next_offset: Optional[int] = None
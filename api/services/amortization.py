@@ -0,0 +1,126 @@
+"""
+Vectorized amortization for monthly annuity loans.
+
+A loan is paid in equal monthly installments from one month after its start date until its end date.
+Rate changes and extra payments split the term into segments; at the start of each segment the
+installment is recomputed from the outstanding balance so the loan still ends on its end date.
+Within a segment the balances follow the closed-form annuity formula, so every period of a segment
+is computed at once.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+
+import numpy as np
+
+
+class AmortizationSchedule:
+    """A loan's payment schedule, with cumulative arrays for O(log n) lookups by date."""
+
+    def __init__(
+        self,
+        principal: float,
+        dates: np.ndarray,
+        interest: np.ndarray,
+        principal_paid: np.ndarray,
+    ):
+        self.principal = principal
+        self.dates = dates
+        self.interest = interest
+        self.principal_paid = principal_paid
+        self.payments = interest + principal_paid
+        self.cumulative_interest = np.cumsum(interest)
+        self.balances = np.maximum(principal - np.cumsum(principal_paid), 0.0)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def total_interest(self) -> float:
+        return float(self.cumulative_interest[-1]) if len(self) else 0.0
+
+    def _paid_periods(self, on: np.ndarray) -> np.ndarray:
+        # Number of payments made on or before each date
+        return np.searchsorted(self.dates, on, side="right")
+
+    def balances_at(self, on: Iterable[date]) -> np.ndarray:
+        """Outstanding principal after the payments made on or before each date."""
+        paid = self._paid_periods(np.array(list(on), dtype="datetime64[D]"))
+        return np.where(paid > 0, self.balances[np.maximum(paid - 1, 0)], self.principal)
+
+    def balance_at(self, on: date) -> float:
+        return float(self.balances_at([on])[0])
+
+    def interest_paid_at(self, on: date) -> float:
+        """Interest paid on or before a date."""
+        paid = int(self._paid_periods(np.datetime64(on, "D")))
+        return float(self.cumulative_interest[paid - 1]) if paid else 0.0
+
+
+def payment_dates(start_date: date, end_date: date) -> np.ndarray:
+    """Monthly payment dates on the start date's day of month (clamped to short months), up to the end date."""
+    start_month = np.datetime64(start_date, "M")
+    periods = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month
+    months = start_month + np.arange(1, max(periods, 1) + 1)
+    month_starts = months.astype("datetime64[D]")
+    days_in_month = ((months + 1).astype("datetime64[D]") - month_starts).astype(int)
+    dates = month_starts + np.minimum(start_date.day, days_in_month) - 1
+    # The last month's payment day can fall after the end date
+    return dates if len(dates) == 1 or dates[-1] <= np.datetime64(end_date, "D") else dates[:-1]
+
+
+def amortize(
+    principal: float,
+    interest_rate: float,
+    start_date: date,
+    end_date: date,
+    extra_payments: Iterable[tuple[date, float]] = (),
+    rate_changes: Iterable[tuple[date, float]] = (),
+) -> AmortizationSchedule:
+    """
+    Build the schedule for a loan. Rates are annual percentages; a rate change applies from the first
+    payment on or after its date, and an extra payment is made together with that payment.
+    """
+    dates = payment_dates(start_date, end_date)
+    periods = len(dates)
+
+    monthly_rates = np.full(periods, interest_rate / 1200)
+    for change_date, rate in sorted(rate_changes):
+        monthly_rates[np.searchsorted(dates, np.datetime64(change_date, "D")) :] = rate / 1200
+
+    extras = np.zeros(periods)
+    extra_payments = list(extra_payments)
+    if extra_payments:
+        extra_dates = np.array([extra_date for extra_date, _ in extra_payments], dtype="datetime64[D]")
+        extra_periods = np.minimum(np.searchsorted(dates, extra_dates), periods - 1)
+        np.add.at(extras, extra_periods, [amount for _, amount in extra_payments])
+
+    # A segment starts wherever the rate changes or after a period with an extra payment
+    boundaries = np.flatnonzero(np.diff(monthly_rates)) + 1
+    boundaries = np.union1d(boundaries, np.flatnonzero(extras[:-1]) + 1)
+    starts = np.concatenate(([0], boundaries)).astype(int)
+    ends = np.append(starts[1:], periods)
+
+    interest = np.empty(periods)
+    principal_paid = np.empty(periods)
+    balance = float(principal)
+    for start, end in zip(starts, ends, strict=True):
+        rate = monthly_rates[start]
+        remaining = periods - start
+        k = np.arange(end - start)
+        if rate:
+            growth = (1 + rate) ** k
+            installment = balance * rate / (1 - (1 + rate) ** -remaining)
+            opening = balance * growth - installment * (growth - 1) / rate
+        else:
+            installment = balance / remaining
+            opening = balance - installment * k
+        interest[start:end] = opening * rate
+        principal_paid[start:end] = installment - interest[start:end]
+
+        closing = opening[-1] - principal_paid[end - 1]
+        extra = min(extras[end - 1], max(closing, 0.0))
+        principal_paid[end - 1] += extra
+        balance = max(closing - extra, 0.0)
+
+    return AmortizationSchedule(principal, dates, interest, principal_paid)
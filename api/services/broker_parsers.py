@@ -0,0 +1,106 @@
+"""
+Parsers that turn rows of broker exports into investment transaction records.
+
+Each parser takes one raw CSV/NDJSON record (keys exactly as in the file) and returns a dict
+matching ImportTransactionRow, or raises ValueError/KeyError if the row cannot be understood.
+"""
+
+import re
+from collections.abc import Callable
+from datetime import datetime
+from typing import Optional
+
+from middleware.case_conversion import camel_to_snake
+
+BrokerParser = Callable[[dict], dict]
+
+BROKER_PARSERS: dict[str, BrokerParser] = {}
+
+
+def register_parser(name: str) -> Callable[[BrokerParser], BrokerParser]:
+    def decorator(parser: BrokerParser) -> BrokerParser:
+        BROKER_PARSERS[name] = parser
+        return parser
+
+    return decorator
+
+
+def _number(value, decimal_mark: Optional[str] = None) -> float:
+    """
+    Parse a number that may use a decimal comma and thousands separators ("1,234.56", "1.234,56", "1 234,5").
+    Parsers whose format fixes the decimal mark pass it. Otherwise, where both marks appear the last one is the
+    decimal mark, and a lone mark followed by exactly three digits ("1,234" or "1.234") could be either, so it is
+    rejected.
+    """
+    if isinstance(value, int | float):
+        return float(value)
+    text = str(value).strip().replace(" ", "")
+    if decimal_mark is not None:
+        thousands = "," if decimal_mark == "." else "."
+        return float(text.replace(thousands, "").replace(decimal_mark, "."))
+
+    comma, dot = text.rfind(","), text.rfind(".")
+    if comma >= 0 and dot >= 0:
+        thousands, decimal = (".", ",") if comma > dot else (",", ".")
+        text = text.replace(thousands, "").replace(decimal, ".")
+    elif text.count(",") > 1 or text.count(".") > 1:
+        # Only thousands separators repeat
+        text = text.replace(",", "").replace(".", "")
+    else:
+        if re.fullmatch(r"[-+]?[1-9]\d{0,2}[.,]\d{3}", text):
+            raise ValueError(f"Ambiguous number {value!r}: the separator may be a decimal or thousands mark")
+        text = text.replace(",", ".")
+    return float(text)
+
+
+def _trade(symbol: str, signed_quantity: float, **fields) -> dict:
+    """Build a BUY/SELL record from a quantity that is negative for sells."""
+    return {
+        "symbol": symbol,
+        "transaction_type": "sell" if signed_quantity < 0 else "buy",
+        "quantity": abs(signed_quantity),
+        **fields,
+    }
+
+
+@register_parser("generic")
+def parse_generic(record: dict) -> dict:
+    """Oracle's own format: the ImportTransactionRow fields, in snake_case or camelCase."""
+    row = {camel_to_snake(key): value for key, value in record.items()}
+    if "transaction_type" in row:
+        row["transaction_type"] = str(row["transaction_type"]).strip().lower()
+    return row
+
+
+@register_parser("ibkr")
+def parse_ibkr(record: dict) -> dict:
+    """Interactive Brokers Flex Query trade confirmations (Symbol, TradeDate, Quantity, TradePrice, ...)."""
+    trade_date = record["TradeDate"].replace("-", "")
+    commission = record.get("IBCommission")
+    # Flex Queries always write a decimal point
+    return _trade(
+        record["Symbol"].strip(),
+        _number(record["Quantity"], "."),
+        name=record.get("Description") or None,
+        currency=record.get("CurrencyPrimary") or None,
+        date=datetime.strptime(trade_date, "%Y%m%d").date(),
+        price_per_unit=_number(record["TradePrice"], "."),
+        # Commissions are reported as negative amounts
+        fees=abs(_number(commission, ".")) if commission else None,
+        note=f"IBKR trade {record['TradeID']}" if record.get("TradeID") else None,
+    )
+
+
+@register_parser("degiro")
+def parse_degiro(record: dict) -> dict:
+    """DEGIRO account transaction exports (Date, Product, ISIN, Quantity, Price, ...)."""
+    fees = record.get("Transaction and/or third party fees") or record.get("Transaction costs")
+    return _trade(
+        record["ISIN"].strip(),
+        _number(record["Quantity"]),
+        name=record.get("Product") or None,
+        date=datetime.strptime(record["Date"], "%d-%m-%Y").date(),
+        price_per_unit=_number(record["Price"]),
+        fees=abs(_number(fees)) if fees else None,
+        note=f"DEGIRO order {record['Order ID']}" if record.get("Order ID") else None,
+    )
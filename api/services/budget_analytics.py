@@ -0,0 +1,173 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy import Float, Integer, case, column, func, literal, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.engine import get_async_db
+from models.expense_category import ExpenseCategory
+from models.monthly_budget import MonthlyBudget
+from models.monthly_category_spend import MonthlyCategorySpend
+
+
+async def add_category_spend(db: AsyncSession, deltas: Iterable[tuple[int, int, float, int]]) -> None:
+    """
+    Add (monthly_budget_id, category_id, amount, count) deltas to the monthly category aggregates in the
+    current DB transaction. Call it from every expense write, with negative deltas for removed expenses.
+    """
+    merged: dict[tuple[int, int], list] = defaultdict(lambda: [0.0, 0])
+    for monthly_budget_id, category_id, amount, count in deltas:
+        merged[monthly_budget_id, category_id][0] += amount
+        merged[monthly_budget_id, category_id][1] += count
+    if not merged:
+        return
+
+    # A single upsert may not touch a row twice, hence the merge above. Rows go in as arrays, so any number of
+    # them takes a fixed number of parameters.
+    rows = (
+        func.unnest(
+            literal([monthly_budget_id for monthly_budget_id, _ in merged], ARRAY(Integer)),
+            literal([category_id for _, category_id in merged], ARRAY(Integer)),
+            literal([total for total, _ in merged.values()], ARRAY(Float)),
+            literal([count for _, count in merged.values()], ARRAY(Integer)),
+        )
+        .table_valued(
+            column("monthly_budget_id", Integer),
+            column("category_id", Integer),
+            column("total", Float),
+            column("count", Integer),
+        )
+        .render_derived("rows")
+    )
+    now = datetime.now()
+    statement = insert(MonthlyCategorySpend).from_select(
+        ["monthly_budget_id", "category_id", "total", "count", "created_at", "updated_at"],
+        select(rows, literal(now), literal(now)),
+    )
+    await db.execute(
+        statement.on_conflict_do_update(
+            constraint="uq_monthly_category_spend_monthly_budget_id_category_id",
+            set_={
+                "total": MonthlyCategorySpend.total + statement.excluded.total,
+                "count": MonthlyCategorySpend.count + statement.excluded.count,
+                "updated_at": now,
+            },
+        )
+    )
+
+
+def _month_index(year, month):
+    """Months since year 0, so consecutive months are consecutive integers. Works on columns and ints."""
+    return year * 12 + month - 1
+
+
+def _percent_change(current: float, previous: Optional[float]) -> Optional[float]:
+    return (current - previous) / previous * 100 if previous else None
+
+
+class BudgetAnalyticsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_analytics(self, household_id: int, month_from: date, month_to: date) -> list[dict]:
+        """
+        Get a household's spending per month from month_from to month_to (only their year and month count),
+        in total and per category, with rolling 3 and 12 month averages, the change from the same month a
+        year earlier and each category's share of the month. Computed with window functions over the monthly
+        category aggregates in one query; months without spending count as zero from the first month with any.
+        """
+        first = _month_index(month_from.year, month_from.month)
+        last = _month_index(month_to.year, month_to.month)
+
+        # Per category and, through ROLLUP, per month (category_id NULL), reaching back a year for the windows
+        budget_month = _month_index(MonthlyBudget.year, MonthlyBudget.month)
+        spend = (
+            select(
+                budget_month.label("month_index"),
+                MonthlyCategorySpend.category_id,
+                func.sum(MonthlyCategorySpend.total).label("total"),
+                func.sum(MonthlyCategorySpend.count).label("count"),
+            )
+            .join(MonthlyBudget, MonthlyCategorySpend.monthly_budget_id == MonthlyBudget.id)
+            .where(
+                MonthlyBudget.household_id == household_id,
+                budget_month.between(first - 12, last),
+                MonthlyCategorySpend.count > 0,
+            )
+            .group_by(budget_month, func.rollup(MonthlyCategorySpend.category_id))
+            .cte("spend")
+        )
+
+        # Dense month x category grid, so the windows below can count rows as months
+        months = select(
+            func.generate_series(select(func.min(spend.c.month_index)).scalar_subquery(), last).label("month_index")
+        ).subquery("months")
+        categories = select(spend.c.category_id).distinct().subquery("categories")
+        total = func.coalesce(spend.c.total, 0.0)
+        by_category = {"partition_by": categories.c.category_id, "order_by": months.c.month_index}
+        trends = (
+            select(
+                months.c.month_index,
+                categories.c.category_id,
+                total.label("total"),
+                func.coalesce(spend.c.count, 0).label("count"),
+                func.avg(total).over(**by_category, rows=(-2, 0)).label("rolling_3_month_average"),
+                func.avg(total).over(**by_category, rows=(-11, 0)).label("rolling_12_month_average"),
+                func.lag(total, 12).over(**by_category).label("previous_year_total"),
+                func.max(case((categories.c.category_id.is_(None), total)))
+                .over(partition_by=months.c.month_index)
+                .label("month_total"),
+            )
+            .select_from(months)
+            .join(categories, true())
+            .outerjoin(
+                spend,
+                (spend.c.month_index == months.c.month_index)
+                & spend.c.category_id.is_not_distinct_from(categories.c.category_id),
+            )
+            .subquery("trends")
+        )
+        # Each month's total row comes first, then its categories from the largest
+        result = await self.db.execute(
+            select(trends, ExpenseCategory.name, ExpenseCategory.color, ExpenseCategory.color_code)
+            .outerjoin(ExpenseCategory, ExpenseCategory.id == trends.c.category_id)
+            .where(trends.c.month_index >= first)
+            .order_by(trends.c.month_index, trends.c.category_id.is_not(None), trends.c.total.desc())
+        )
+
+        months_out: list[dict] = []
+        for row in result:
+            trend = {
+                "total": row.total,
+                "count": row.count,
+                "rolling_3_month_average": row.rolling_3_month_average,
+                "rolling_12_month_average": row.rolling_12_month_average,
+                "previous_year_total": row.previous_year_total,
+                "year_over_year_change": (
+                    row.total - row.previous_year_total if row.previous_year_total is not None else None
+                ),
+                "year_over_year_percentage": _percent_change(row.total, row.previous_year_total),
+            }
+            if row.category_id is None:
+                year, month = divmod(row.month_index, 12)
+                months_out.append({"year": year, "month": month + 1, **trend, "categories": []})
+            else:
+                months_out[-1]["categories"].append(
+                    {
+                        "category_id": row.category_id,
+                        "name": row.name,
+                        "color": row.color.value,
+                        "color_code": row.color_code,
+                        "share_percentage": row.total / row.month_total * 100 if row.month_total else 0.0,
+                        **trend,
+                    }
+                )
+        return months_out
+
+
+def get_budget_analytics_service(db: AsyncSession = Depends(get_async_db)) -> BudgetAnalyticsService:
+    return BudgetAnalyticsService(db)
@@ -0,0 +1,150 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Optional
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from middleware.case_conversion import camel_to_snake
+
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class ImportReport:
+    """Outcome of a bulk import: how many rows were written and why the others were not."""
+
+    def __init__(self):
+        self.inserted = 0
+        self.errors: list[tuple[int, list[str]]] = []
+
+    def add_error(self, row: int, *messages: str) -> None:
+        self.errors.append((row, list(messages)))
+
+
+def is_supported_content_type(content_type: str) -> bool:
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type in CSV_CONTENT_TYPES or media_type in NDJSON_CONTENT_TYPES
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes],
+    content_type: str,
+    normalize_keys: bool = True,
+) -> AsyncIterator[tuple[int, dict | None]]:
+    """
+    Parse a streamed CSV (with a header row) or NDJSON body into (row number, record) pairs.
+    Keys are converted to snake_case unless normalize_keys is False. Records that cannot be parsed are yielded as None.
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    key = camel_to_snake if normalize_keys else str.strip
+    lines = _iter_lines(chunks)
+    records = _iter_csv_records(lines, key) if media_type in CSV_CONTENT_TYPES else _iter_ndjson_records(lines, key)
+    async for row, record in records:
+        yield row, record
+
+
+async def copy_rows(
+    db: AsyncSession,
+    table: str,
+    columns: tuple[str, ...],
+    rows: Iterable[tuple],
+    types: Optional[tuple[str, ...]] = None,
+) -> None:
+    """
+    COPY rows into a table on the session's own connection, so they commit or roll back with the session.
+    Passing the Postgres type of every column switches to binary COPY, which is much cheaper to encode.
+    """
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    copy_sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    if types:
+        copy_sql += " (FORMAT BINARY)"
+    async with raw_connection.driver_connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+        if types:
+            copy.set_types(types)
+        for row in rows:
+            await copy.write_row(row)
+
+
+def validate_record(model: type[BaseModel], record: dict | None) -> tuple[BaseModel | None, list[str]]:
+    """Validate a parsed record, returning the model or the list of error messages."""
+    if record is None:
+        return None, ["Could not parse row"]
+    try:
+        return model.model_validate(record), []
+    except ValidationError as e:
+        return None, [f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()]
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    # Incremental decoder so multi-byte characters split across chunks survive
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def _iter_ndjson_records(
+    lines: AsyncIterator[str],
+    key: Callable[[str], str],
+) -> AsyncIterator[tuple[int, dict | None]]:
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield row, None
+            continue
+        if not isinstance(record, dict):
+            yield row, None
+            continue
+        yield row, {key(name): value for name, value in record.items()}
+
+
+async def _iter_csv_records(
+    lines: AsyncIterator[str],
+    key: Callable[[str], str],
+) -> AsyncIterator[tuple[int, dict | None]]:
+    header: list[str] | None = None
+    row = 0
+    async for record in _join_quoted_lines(lines):
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [key(name.strip()) for name in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, None
+            continue
+        # Empty cells mean "not provided" so optional fields fall back to their defaults
+        yield row, {name: value for name, value in zip(header, values, strict=True) if value != ""}
+
+
+async def _join_quoted_lines(lines: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Rejoin physical lines into CSV records, since quoted fields may contain newlines."""
+    parts: list[str] = []
+    in_quotes = False
+    async for line in lines:
+        parts.append(line)
+        # An odd number of quote characters toggles whether we are inside a quoted field
+        if line.count('"') % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            yield "\n".join(parts)
+            parts = []
+    if parts:
+        yield "\n".join(parts)
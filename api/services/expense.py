@@ -1,31 +1,65 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Optional
 
+import psycopg
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.engine import get_db
+from core.config import settings
+from db.engine import get_async_db
 from models.expense import Expense
+from schemas.expense import BulkExpenseRow, ImportExpenseRow
+from services.budget_analytics import add_category_spend
+from services.bulk_import import ImportReport, copy_rows, validate_record
+from services.expense_category import ExpenseCategoryService
+from services.monthly_budget import MonthlyBudgetService
+from services.net_worth import budget_household_id, mark_rollup_stale
+from services.pagination import apply_keyset, split_page
+
+# Column order of the rows bulk_create streams with COPY
+COPY_COLUMNS = ("monthly_budget_id", "amount", "description", "category_id", "date", "created_at", "updated_at")
 
 
 class ExpenseService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_by_budget(self, monthly_budget_id: int) -> list[Expense]:
-        """Get all expenses for a monthly budget."""
-        return (
-            self.db.query(Expense)
-            .filter(Expense.monthly_budget_id == monthly_budget_id)
-            .order_by(Expense.date.desc())
-            .all()
-        )
+    async def get_by_budget(
+        self,
+        monthly_budget_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        category_id: Optional[int] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+    ) -> tuple[list[Expense], Optional[str]]:
+        """Get a page of expenses for a monthly budget, newest first, and the cursor for the next page."""
+        query = select(Expense).where(Expense.monthly_budget_id == monthly_budget_id)
+        if date_from is not None:
+            query = query.where(Expense.date >= date_from)
+        if date_to is not None:
+            query = query.where(Expense.date < date_to)
+        if category_id is not None:
+            query = query.where(Expense.category_id == category_id)
+        if min_amount is not None:
+            query = query.where(Expense.amount >= min_amount)
+        if max_amount is not None:
+            query = query.where(Expense.amount <= max_amount)
 
-    def get_by_id(self, expense_id: int) -> Optional[Expense]:
+        result = await self.db.execute(apply_keyset(query, Expense.date, Expense.id, limit, cursor))
+        return split_page(list(result.scalars().all()), limit, "date")
+
+    async def get_by_id(self, expense_id: int) -> Optional[Expense]:
         """Get a single expense by ID."""
-        return self.db.query(Expense).filter(Expense.id == expense_id).first()
+        result = await self.db.execute(select(Expense).where(Expense.id == expense_id))
+        return result.scalars().first()
 
-    def create(
+    async def create(
         self,
         monthly_budget_id: int,
         amount: float,
@@ -42,11 +76,83 @@ class ExpenseService:
             date=date or datetime.now(),
         )
         self.db.add(expense)
-        self.db.commit()
-        self.db.refresh(expense)
+        await add_category_spend(self.db, [(monthly_budget_id, category_id, amount, 1)])
+        await mark_rollup_stale(self.db, budget_household_id(monthly_budget_id), expense.date)
+        await self.db.commit()
+        await self.db.refresh(expense)
         return expense
 
-    def update(
+    async def bulk_create(
+        self,
+        records: AsyncIterator[tuple[int, dict | None]],
+        monthly_budget_id: Optional[int] = None,
+        household_id: Optional[int] = None,
+    ) -> ImportReport:
+        """
+        Validate and insert streamed expense rows, one transaction per chunk.
+        Rows go to monthly_budget_id, or for a household import to the household's budget for each row's month.
+        """
+        report = ImportReport()
+        row_model = ImportExpenseRow if household_id is not None else BulkExpenseRow
+        category_ids = {category.id for category in await ExpenseCategoryService(self.db).get_all()}
+        budget_ids: dict[tuple[int, int], int] = {}
+        now = datetime.now()
+
+        chunk: list[tuple[int, tuple]] = []
+        async for row, record in records:
+            expense, errors = validate_record(row_model, record)
+            if expense is not None and expense.category_id not in category_ids:
+                errors = [f"category_id: Unknown category {expense.category_id}"]
+            if errors:
+                report.add_error(row, *errors)
+                continue
+
+            target_budget_id = monthly_budget_id
+            if household_id is not None:
+                month_key = (expense.date.year, expense.date.month)
+                if month_key not in budget_ids:
+                    budget = await MonthlyBudgetService(self.db).get_or_create(household_id, *month_key)
+                    budget_ids[month_key] = budget.id
+                target_budget_id = budget_ids[month_key]
+
+            chunk.append(
+                (
+                    row,
+                    (
+                        target_budget_id,
+                        expense.amount,
+                        expense.description,
+                        expense.category_id,
+                        expense.date or now,
+                        now,
+                        now,
+                    ),
+                )
+            )
+            if len(chunk) >= settings.bulk_import_chunk_size:
+                await self._insert_chunk(chunk, report)
+                chunk = []
+
+        if chunk:
+            await self._insert_chunk(chunk, report)
+        return report
+
+    async def _insert_chunk(self, chunk: list[tuple[int, tuple]], report: ImportReport) -> None:
+        try:
+            await copy_rows(self.db, Expense.__tablename__, COPY_COLUMNS, (values for _, values in chunk))
+            await add_category_spend(self.db, ((values[0], values[3], values[1], 1) for _, values in chunk))
+            # Every budget in a chunk belongs to the same household
+            changed_on = min(values[4].date() for _, values in chunk)
+            await mark_rollup_stale(self.db, budget_household_id(chunk[0][1][0]), changed_on)
+            await self.db.commit()
+        except (DBAPIError, psycopg.Error) as e:
+            await self.db.rollback()
+            for row, _ in chunk:
+                report.add_error(row, f"Database error: {getattr(e, 'orig', e)}")
+            return
+        report.inserted += len(chunk)
+
+    async def update(
         self,
         expense_id: int,
         amount: Optional[float] = None,
@@ -55,34 +161,44 @@ class ExpenseService:
         date: Optional[datetime] = None,
     ) -> Optional[Expense]:
         """Update an existing expense."""
-        expense = self.get_by_id(expense_id)
+        expense = await self.get_by_id(expense_id)
         if not expense:
             return None
 
+        previous_spend = (expense.monthly_budget_id, expense.category_id, -expense.amount, -1)
         if amount is not None:
             expense.amount = amount
         if description is not None:
             expense.description = description
         if category_id is not None:
             expense.category_id = category_id
+        # Compare days: the stored date is naive, while a requested one may carry an offset
+        changed_on = expense.date.date()
         if date is not None:
+            changed_on = min(changed_on, date.date())
             expense.date = date
 
         expense.updated_at = datetime.now()
-        self.db.commit()
-        self.db.refresh(expense)
+        await add_category_spend(
+            self.db, [previous_spend, (expense.monthly_budget_id, expense.category_id, expense.amount, 1)]
+        )
+        await mark_rollup_stale(self.db, budget_household_id(expense.monthly_budget_id), changed_on)
+        await self.db.commit()
+        await self.db.refresh(expense)
         return expense
 
-    def delete(self, expense_id: int) -> bool:
+    async def delete(self, expense_id: int) -> bool:
         """Delete an expense. Returns True if deleted, False if not found."""
-        expense = self.get_by_id(expense_id)
+        expense = await self.get_by_id(expense_id)
         if not expense:
             return False
 
-        self.db.delete(expense)
-        self.db.commit()
+        await self.db.delete(expense)
+        await add_category_spend(self.db, [(expense.monthly_budget_id, expense.category_id, -expense.amount, -1)])
+        await mark_rollup_stale(self.db, budget_household_id(expense.monthly_budget_id), expense.date)
+        await self.db.commit()
         return True
 
 
-def get_expense_service(db: Session = Depends(get_db)) -> ExpenseService:
+def get_expense_service(db: AsyncSession = Depends(get_async_db)) -> ExpenseService:
     return ExpenseService(db)
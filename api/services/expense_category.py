@@ -1,65 +1,57 @@
+import hashlib
 from datetime import datetime
 from typing import Optional
 
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.engine import get_db
+from core.cache import TTLCache
+from core.config import settings
+from db.engine import get_async_db
 from models.expense_category import Color, ExpenseCategory
 
-# Default categories that should exist for all users
-DEFAULT_CATEGORIES = [
-    {"name": "Matvörur (Groceries)", "color": Color.GREEN},
-    {"name": "Samgöngur (Transportation)", "color": Color.BLUE},
-    {"name": "Afþreying (Entertainment)", "color": Color.PURPLE},
-    {"name": "Útvegingar (Dining Out)", "color": Color.ORANGE},
-    {"name": "Gjald (Utilities)", "color": Color.YELLOW},
-    {"name": "Heilsa (Healthcare)", "color": Color.RED},
-    {"name": "Verslun (Shopping)", "color": Color.PINK},
-    {"name": "Annað (Other)", "color": Color.GRAY},
-]
+# The full category list with its ETag. Default categories are seeded by migration,
+# and custom category writes invalidate the entry.
+category_cache = TTLCache(max_size=1, ttl=settings.category_cache_ttl)
+ALL_CATEGORIES_KEY = "all"
 
 
 class ExpenseCategoryService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_all(self) -> list[ExpenseCategory]:
+    async def get_all(self) -> list[ExpenseCategory]:
         """Get all expense categories."""
-        # Ensure default categories exist
-        self._ensure_default_categories()
-        return self.db.query(ExpenseCategory).order_by(ExpenseCategory.name).all()
-
-    def get_by_id(self, category_id: int) -> Optional[ExpenseCategory]:
+        categories, _ = await self.get_all_with_etag()
+        return categories
+
+    async def get_all_with_etag(self) -> tuple[list[ExpenseCategory], str]:
+        """Get all expense categories and an ETag for their current content."""
+        cached = category_cache.get(ALL_CATEGORIES_KEY)
+        if cached is not None:
+            return cached
+
+        result = await self.db.execute(select(ExpenseCategory).order_by(ExpenseCategory.name))
+        categories = list(result.scalars().all())
+        entry = (categories, self._etag(categories))
+        category_cache.set(ALL_CATEGORIES_KEY, entry)
+        return entry
+
+    @staticmethod
+    def _etag(categories: list[ExpenseCategory]) -> str:
+        # Derived from content rather than a counter so every worker process agrees on it
+        digest = hashlib.sha256()
+        for c in categories:
+            digest.update(f"{c.id}|{c.name}|{c.is_custom}|{c.color.value}|{c.color_code}\n".encode())
+        return f'"{digest.hexdigest()[:32]}"'
+
+    async def get_by_id(self, category_id: int) -> Optional[ExpenseCategory]:
         """Get a single category by ID."""
-        return self.db.query(ExpenseCategory).filter(ExpenseCategory.id == category_id).first()
-
-    def _ensure_default_categories(self) -> None:
-        """Create default categories if they don't exist, or update existing ones."""
-        existing_defaults = self.db.query(ExpenseCategory).filter(not ExpenseCategory.is_custom).all()
-
-        # If no default categories exist, create them
-        if len(existing_defaults) == 0:
-            for cat_data in DEFAULT_CATEGORIES:
-                category = ExpenseCategory(
-                    name=cat_data["name"],
-                    color=cat_data["color"],
-                    is_custom=False,
-                )
-                self.db.add(category)
-            self.db.commit()
-        # If default categories exist, update them to ensure they have the correct names
-        elif len(existing_defaults) > 0:
-            # Update existing categories with new names if needed
-            for i, existing_cat in enumerate(existing_defaults):
-                if i < len(DEFAULT_CATEGORIES):
-                    new_data = DEFAULT_CATEGORIES[i]
-                    if existing_cat.name != new_data["name"] or existing_cat.color != new_data["color"]:
-                        existing_cat.name = new_data["name"]
-                        existing_cat.color = new_data["color"]
-            self.db.commit()
-
-    def create(
+        result = await self.db.execute(select(ExpenseCategory).where(ExpenseCategory.id == category_id))
+        return result.scalars().first()
+
+    async def create(
         self,
         name: str,
         color: Color,
@@ -73,11 +65,12 @@ class ExpenseCategoryService:
             is_custom=True,
         )
         self.db.add(category)
-        self.db.commit()
-        self.db.refresh(category)
+        await self.db.commit()
+        category_cache.invalidate(ALL_CATEGORIES_KEY)
+        await self.db.refresh(category)
         return category
 
-    def update(
+    async def update(
         self,
         category_id: int,
         name: Optional[str] = None,
@@ -85,7 +78,7 @@ class ExpenseCategoryService:
         color_code: Optional[str] = None,
     ) -> Optional[ExpenseCategory]:
         """Update an existing category."""
-        category = self.get_by_id(category_id)
+        category = await self.get_by_id(category_id)
         if not category:
             return None
 
@@ -101,13 +94,14 @@ class ExpenseCategoryService:
             category.color_code = color_code
 
         category.updated_at = datetime.now()
-        self.db.commit()
-        self.db.refresh(category)
+        await self.db.commit()
+        category_cache.invalidate(ALL_CATEGORIES_KEY)
+        await self.db.refresh(category)
         return category
 
-    def delete(self, category_id: int) -> bool:
+    async def delete(self, category_id: int) -> bool:
         """Delete a category. Only custom categories can be deleted."""
-        category = self.get_by_id(category_id)
+        category = await self.get_by_id(category_id)
         if not category:
             return False
 
@@ -115,12 +109,13 @@ class ExpenseCategoryService:
         if not category.is_custom:
             raise ValueError("Cannot delete default categories")
 
-        self.db.delete(category)
-        self.db.commit()
+        await self.db.delete(category)
+        await self.db.commit()
+        category_cache.invalidate(ALL_CATEGORIES_KEY)
         return True
 
 
 def get_expense_category_service(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ExpenseCategoryService:
     return ExpenseCategoryService(db)
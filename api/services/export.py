@@ -0,0 +1,171 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from enum import Enum
+
+from fastapi import Depends
+from sqlalchemy import Select, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from db.engine import get_async_db
+from models.expense import Expense
+from models.expense_category import ExpenseCategory
+from models.income import Income
+from models.investment_asset import InvestmentAsset
+from models.investment_transaction import InvestmentTransaction
+from models.investment_valuation_snapshot import InvestmentValuationSnapshot
+from models.loan import Loan
+from models.loan_payment import LoanPayment
+from models.monthly_budget import MonthlyBudget
+from schemas.export import ExportFormat
+
+# Every exported record has a subset of these fields; CSV exports use them as the header row
+EXPORT_COLUMNS = (
+    "record_type",
+    "id",
+    "short_id",
+    "date",
+    "amount",
+    "description",
+    "category",
+    "source",
+    "member_id",
+    "symbol",
+    "transaction_type",
+    "quantity",
+    "price_per_unit",
+    "fees",
+    "note",
+    "valuation",
+    "loan",
+    "interest_amount",
+    "principal_amount",
+    "remaining_balance",
+)
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+class ExportService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def stream_household(self, household_id: int, export_format: ExportFormat) -> AsyncIterator[str]:
+        """
+        Stream a household's expenses, income, investment transactions, valuations and loan payments.
+        Rows are read through a server-side cursor and written out one batch at a time, so memory use
+        does not grow with the size of the history.
+        """
+        if export_format == ExportFormat.CSV:
+            yield _csv_lines([EXPORT_COLUMNS])
+
+        for query in self._queries(household_id):
+            result = await self.db.stream(query.execution_options(yield_per=settings.export_batch_size))
+            async for batch in result.mappings().partitions():
+                if export_format == ExportFormat.CSV:
+                    yield _csv_lines([[_csv_value(row.get(column)) for column in EXPORT_COLUMNS] for row in batch])
+                else:
+                    yield "".join(json.dumps(_json_record(row)) + "\n" for row in batch)
+
+    def _queries(self, household_id: int) -> list[Select]:
+        return [
+            select(
+                literal("expense").label("record_type"),
+                Expense.id,
+                Expense.short_id,
+                Expense.date,
+                Expense.amount,
+                Expense.description,
+                ExpenseCategory.name.label("category"),
+            )
+            .join(MonthlyBudget, Expense.monthly_budget_id == MonthlyBudget.id)
+            .join(ExpenseCategory, Expense.category_id == ExpenseCategory.id)
+            .where(MonthlyBudget.household_id == household_id)
+            .order_by(Expense.date, Expense.id),
+            select(
+                literal("income").label("record_type"),
+                Income.id,
+                Income.short_id,
+                Income.created_at.label("date"),
+                Income.amount,
+                Income.source,
+            )
+            .join(MonthlyBudget, Income.monthly_budget_id == MonthlyBudget.id)
+            .where(MonthlyBudget.household_id == household_id)
+            .order_by(Income.created_at, Income.id),
+            select(
+                literal("investment_transaction").label("record_type"),
+                InvestmentTransaction.id,
+                InvestmentTransaction.short_id,
+                InvestmentTransaction.date,
+                InvestmentTransaction.member_id,
+                InvestmentAsset.symbol,
+                InvestmentTransaction.transaction_type,
+                InvestmentTransaction.quantity,
+                InvestmentTransaction.price_per_unit,
+                InvestmentTransaction.fees,
+                InvestmentTransaction.note,
+            )
+            .join(InvestmentAsset, InvestmentTransaction.asset_id == InvestmentAsset.id)
+            .where(InvestmentTransaction.household_id == household_id)
+            .order_by(InvestmentTransaction.date, InvestmentTransaction.id),
+            select(
+                literal("valuation").label("record_type"),
+                InvestmentValuationSnapshot.id,
+                InvestmentValuationSnapshot.short_id,
+                InvestmentValuationSnapshot.date,
+                InvestmentAsset.member_id,
+                InvestmentAsset.symbol,
+                InvestmentValuationSnapshot.valuation,
+                InvestmentValuationSnapshot.source,
+            )
+            .join(InvestmentAsset, InvestmentValuationSnapshot.asset_id == InvestmentAsset.id)
+            .where(InvestmentAsset.household_id == household_id)
+            .order_by(InvestmentValuationSnapshot.date, InvestmentValuationSnapshot.id),
+            select(
+                literal("loan_payment").label("record_type"),
+                LoanPayment.id,
+                LoanPayment.short_id,
+                LoanPayment.date,
+                LoanPayment.amount,
+                Loan.name.label("loan"),
+                LoanPayment.interest_amount,
+                LoanPayment.principal_amount,
+                LoanPayment.remaining_balance,
+            )
+            .join(Loan, LoanPayment.loan_id == Loan.id)
+            .where(Loan.household_id == household_id)
+            .order_by(LoanPayment.date, LoanPayment.id),
+        ]
+
+
+def _json_record(row) -> dict:
+    return {column: _json_value(value) for column, value in row.items()}
+
+
+def _json_value(value):
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _csv_value(value):
+    return "" if value is None else _json_value(value)
+
+
+def _csv_lines(rows: list) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+def get_export_service(db: AsyncSession = Depends(get_async_db)) -> ExportService:
+    return ExportService(db)
@@ -1,20 +1,20 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.engine import get_db
+from db.engine import get_async_db
 from models.household import Household
 
 
 class HouseholdService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_household(self, name: str, owner_id: int) -> Household:
+    async def create_household(self, name: str, owner_id: int) -> Household:
         household = Household(name=name, owner_id=owner_id)
         self.db.add(household)
-        self.db.commit()
+        await self.db.commit()
         return household
 
 
-def get_household_service(db: Session = Depends(get_db)) -> HouseholdService:
+def get_household_service(db: AsyncSession = Depends(get_async_db)) -> HouseholdService:
     return HouseholdService(db)
@@ -1,26 +1,53 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.engine import get_db
+from db.engine import get_async_db
 from models.income import Income
+from services.net_worth import budget_household_id, mark_rollup_stale
+from services.pagination import apply_keyset, split_page
 
 
 class IncomeService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_by_budget(self, monthly_budget_id: int) -> list[Income]:
-        """Get all income entries for a monthly budget."""
-        return self.db.query(Income).filter(Income.monthly_budget_id == monthly_budget_id).all()
+    async def get_by_budget(
+        self,
+        monthly_budget_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+    ) -> tuple[list[Income], Optional[str]]:
+        """
+        Get a page of income entries for a monthly budget, newest first, and the cursor for the next page.
+        Income has no date of its own, so ordering and date filters use created_at.
+        """
+        query = select(Income).where(Income.monthly_budget_id == monthly_budget_id)
+        if date_from is not None:
+            query = query.where(Income.created_at >= date_from)
+        if date_to is not None:
+            query = query.where(Income.created_at < date_to)
+        if min_amount is not None:
+            query = query.where(Income.amount >= min_amount)
+        if max_amount is not None:
+            query = query.where(Income.amount <= max_amount)
+
+        result = await self.db.execute(apply_keyset(query, Income.created_at, Income.id, limit, cursor))
+        return split_page(list(result.scalars().all()), limit, "created_at")
 
-    def get_by_id(self, income_id: int) -> Optional[Income]:
+    async def get_by_id(self, income_id: int) -> Optional[Income]:
         """Get a single income entry by ID."""
-        return self.db.query(Income).filter(Income.id == income_id).first()
+        result = await self.db.execute(select(Income).where(Income.id == income_id))
+        return result.scalars().first()
 
-    def create(
+    async def create(
         self,
         monthly_budget_id: int,
         amount: float,
@@ -33,18 +60,19 @@ class IncomeService:
             source=source,
         )
         self.db.add(income)
-        self.db.commit()
-        self.db.refresh(income)
+        await mark_rollup_stale(self.db, budget_household_id(monthly_budget_id), date.today())
+        await self.db.commit()
+        await self.db.refresh(income)
         return income
 
-    def update(
+    async def update(
         self,
         income_id: int,
         amount: Optional[float] = None,
         source: Optional[str] = None,
     ) -> Optional[Income]:
         """Update an existing income entry."""
-        income = self.get_by_id(income_id)
+        income = await self.get_by_id(income_id)
         if not income:
             return None
 
@@ -54,20 +82,22 @@ class IncomeService:
             income.source = source
 
         income.updated_at = datetime.now()
-        self.db.commit()
-        self.db.refresh(income)
+        await mark_rollup_stale(self.db, budget_household_id(income.monthly_budget_id), income.created_at)
+        await self.db.commit()
+        await self.db.refresh(income)
         return income
 
-    def delete(self, income_id: int) -> bool:
+    async def delete(self, income_id: int) -> bool:
         """Delete an income entry. Returns True if deleted, False if not found."""
-        income = self.get_by_id(income_id)
+        income = await self.get_by_id(income_id)
         if not income:
             return False
 
-        self.db.delete(income)
-        self.db.commit()
+        await self.db.delete(income)
+        await mark_rollup_stale(self.db, budget_household_id(income.monthly_budget_id), income.created_at)
+        await self.db.commit()
         return True
 
 
-def get_income_service(db: Session = Depends(get_db)) -> IncomeService:
+def get_income_service(db: AsyncSession = Depends(get_async_db)) -> IncomeService:
     return IncomeService(db)
@@ -1,49 +1,85 @@
+import math
+from collections.abc import AsyncIterator
 from datetime import date, datetime
 from typing import Optional
 
+import numpy as np
+import psycopg
 from fastapi import Depends
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import case, delete, desc, func, insert, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.engine import get_db
+from core.cache import TTLCache
+from core.config import settings
+from db.engine import get_async_db
 from models.investment_asset import InvestmentAsset, ValuationMode
+from models.investment_position import InvestmentPosition
 from models.investment_transaction import InvestmentTransaction, TransactionType
 from models.investment_valuation_snapshot import InvestmentValuationSnapshot
+from schemas.investment import ImportTransactionRow
+from services.broker_parsers import BrokerParser
+from services.bulk_import import ImportReport, copy_rows, validate_record
+from services.net_worth import mark_rollup_stale
+from services.pagination import apply_keyset, split_page
+from services.returns import annualize, twr, xirr
+from services.valuation_history import load_holdings_history
+
+# Column order of the rows import_transactions streams with COPY
+TRANSACTION_COPY_COLUMNS = (
+    "household_id",
+    "member_id",
+    "asset_id",
+    "transaction_type",
+    "quantity",
+    "date",
+    "price_per_unit",
+    "fees",
+    "note",
+    "created_at",
+    "updated_at",
+)
+
+# Returns per household, invalidated by this process's investment writes. The TTL bounds how long
+# other worker processes may serve a result from before a write they did not see.
+returns_cache = TTLCache(max_size=settings.returns_cache_max_size, ttl=settings.returns_cache_ttl)
 
 
 class InvestmentService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     # ==================== Asset Methods ====================
 
-    def get_assets_by_household(self, household_id: int) -> list[InvestmentAsset]:
+    async def get_assets_by_household(self, household_id: int) -> list[InvestmentAsset]:
         """Get all investment assets for a household."""
-        return (
-            self.db.query(InvestmentAsset)
-            .filter(InvestmentAsset.household_id == household_id)
+        result = await self.db.execute(
+            select(InvestmentAsset)
+            .where(InvestmentAsset.household_id == household_id)
             .order_by(InvestmentAsset.created_at.desc())
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_assets_by_member(self, member_id: int) -> list[InvestmentAsset]:
+    async def get_assets_by_member(self, member_id: int) -> list[InvestmentAsset]:
         """Get all investment assets for a specific member."""
-        return (
-            self.db.query(InvestmentAsset)
-            .filter(InvestmentAsset.member_id == member_id)
+        result = await self.db.execute(
+            select(InvestmentAsset)
+            .where(InvestmentAsset.member_id == member_id)
             .order_by(InvestmentAsset.created_at.desc())
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_asset_by_id(self, asset_id: int) -> Optional[InvestmentAsset]:
+    async def get_asset_by_id(self, asset_id: int) -> Optional[InvestmentAsset]:
         """Get a single asset by ID."""
-        return self.db.query(InvestmentAsset).filter(InvestmentAsset.id == asset_id).first()
+        result = await self.db.execute(select(InvestmentAsset).where(InvestmentAsset.id == asset_id))
+        return result.scalars().first()
 
-    def get_asset_by_short_id(self, short_id: str) -> Optional[InvestmentAsset]:
+    async def get_asset_by_short_id(self, short_id: str) -> Optional[InvestmentAsset]:
         """Get a single asset by short_id."""
-        return self.db.query(InvestmentAsset).filter(InvestmentAsset.short_id == short_id).first()
+        result = await self.db.execute(select(InvestmentAsset).where(InvestmentAsset.short_id == short_id))
+        return result.scalars().first()
 
-    def create_asset(
+    async def create_asset(
         self,
         household_id: int,
         member_id: int,
@@ -70,7 +106,7 @@ class InvestmentService:
             valuation_mode=ValuationMode.MANUAL,
         )
         self.db.add(asset)
-        self.db.flush()  # Get the asset ID
+        await self.db.flush()  # Get the asset ID
 
         # Create initial BUY transaction
         transaction = InvestmentTransaction(
@@ -94,11 +130,17 @@ class InvestmentService:
         )
         self.db.add(valuation)
 
-        self.db.commit()
-        self.db.refresh(asset)
+        # Seed the materialized position from the initial transaction
+        position = InvestmentPosition(asset_id=asset.id, **self._position_deltas(transaction))
+        self.db.add(position)
+
+        await mark_rollup_stale(self.db, household_id, initial_date)
+        await self.db.commit()
+        returns_cache.invalidate(household_id)
+        await self.db.refresh(asset)
         return asset
 
-    def update_asset(
+    async def update_asset(
         self,
         asset_id: int,
         name: Optional[str] = None,
@@ -107,7 +149,7 @@ class InvestmentService:
         custom_type: Optional[str] = None,
     ) -> Optional[InvestmentAsset]:
         """Update an existing asset."""
-        asset = self.get_asset_by_id(asset_id)
+        asset = await self.get_asset_by_id(asset_id)
         if not asset:
             return None
 
@@ -122,43 +164,72 @@ class InvestmentService:
                 asset.asset_type = asset_type
 
         asset.updated_at = datetime.now()
-        self.db.commit()
-        self.db.refresh(asset)
+        await self.db.commit()
+        returns_cache.invalidate(asset.household_id)
+        await self.db.refresh(asset)
         return asset
 
-    def delete_asset(self, asset_id: int) -> bool:
+    async def delete_asset(self, asset_id: int) -> bool:
         """Delete an asset and all related transactions/valuations."""
-        asset = self.get_asset_by_id(asset_id)
+        asset = await self.get_asset_by_id(asset_id)
         if not asset:
             return False
 
+        first_transaction = await self.db.execute(
+            select(func.min(InvestmentTransaction.date)).where(InvestmentTransaction.asset_id == asset_id)
+        )
+        first_date = first_transaction.scalar()
+        if first_date is not None:
+            await mark_rollup_stale(self.db, asset.household_id, first_date)
+
         # Delete related transactions
-        self.db.query(InvestmentTransaction).filter(InvestmentTransaction.asset_id == asset_id).delete()
+        await self.db.execute(delete(InvestmentTransaction).where(InvestmentTransaction.asset_id == asset_id))
 
         # Delete related valuations
-        self.db.query(InvestmentValuationSnapshot).filter(InvestmentValuationSnapshot.asset_id == asset_id).delete()
+        await self.db.execute(
+            delete(InvestmentValuationSnapshot).where(InvestmentValuationSnapshot.asset_id == asset_id)
+        )
+
+        # Delete the materialized position
+        await self.db.execute(delete(InvestmentPosition).where(InvestmentPosition.asset_id == asset_id))
 
         # Delete the asset
-        self.db.delete(asset)
-        self.db.commit()
+        await self.db.delete(asset)
+        await self.db.commit()
+        returns_cache.invalidate(asset.household_id)
         return True
 
     # ==================== Transaction Methods ====================
 
-    def get_transactions_by_asset(self, asset_id: int) -> list[InvestmentTransaction]:
-        """Get all transactions for an asset, ordered by date descending."""
-        return (
-            self.db.query(InvestmentTransaction)
-            .filter(InvestmentTransaction.asset_id == asset_id)
-            .order_by(desc(InvestmentTransaction.date), desc(InvestmentTransaction.created_at))
-            .all()
+    async def get_transactions_by_asset(
+        self,
+        asset_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        transaction_type: Optional[TransactionType] = None,
+    ) -> tuple[list[InvestmentTransaction], Optional[str]]:
+        """Get a page of transactions for an asset, newest first, and the cursor for the next page."""
+        query = select(InvestmentTransaction).where(InvestmentTransaction.asset_id == asset_id)
+        if date_from is not None:
+            query = query.where(InvestmentTransaction.date >= date_from)
+        if date_to is not None:
+            query = query.where(InvestmentTransaction.date <= date_to)
+        if transaction_type is not None:
+            query = query.where(InvestmentTransaction.transaction_type == transaction_type)
+
+        result = await self.db.execute(
+            apply_keyset(query, InvestmentTransaction.date, InvestmentTransaction.id, limit, cursor)
         )
+        return split_page(list(result.scalars().all()), limit, "date")
 
-    def get_transaction_by_id(self, transaction_id: int) -> Optional[InvestmentTransaction]:
+    async def get_transaction_by_id(self, transaction_id: int) -> Optional[InvestmentTransaction]:
         """Get a single transaction by ID."""
-        return self.db.query(InvestmentTransaction).filter(InvestmentTransaction.id == transaction_id).first()
+        result = await self.db.execute(select(InvestmentTransaction).where(InvestmentTransaction.id == transaction_id))
+        return result.scalars().first()
 
-    def create_transaction(
+    async def create_transaction(
         self,
         asset_id: int,
         household_id: int,
@@ -183,22 +254,18 @@ class InvestmentService:
             note=note,
         )
         self.db.add(transaction)
+        await self.db.flush()
 
-        # Update asset quantity
-        asset = self.get_asset_by_id(asset_id)
-        if asset:
-            current_qty = self._calculate_current_quantity(asset)
-            if transaction_type == TransactionType.BUY:
-                asset.quantity = int(current_qty + quantity)
-            elif transaction_type == TransactionType.SELL:
-                asset.quantity = int(max(0, current_qty - quantity))
-            # DIVIDEND and INTEREST don't affect quantity
-
-        self.db.commit()
-        self.db.refresh(transaction)
+        # Update position and asset quantity
+        await self._apply_position_delta(asset_id, self._position_deltas(transaction))
+
+        await mark_rollup_stale(self.db, household_id, transaction_date)
+        await self.db.commit()
+        returns_cache.invalidate(household_id)
+        await self.db.refresh(transaction)
         return transaction
 
-    def update_transaction(
+    async def update_transaction(
         self,
         transaction_id: int,
         transaction_type: Optional[TransactionType] = None,
@@ -209,15 +276,19 @@ class InvestmentService:
         note: Optional[str] = None,
     ) -> Optional[InvestmentTransaction]:
         """Update an existing transaction."""
-        transaction = self.get_transaction_by_id(transaction_id)
+        transaction = await self.get_transaction_by_id(transaction_id)
         if not transaction:
             return None
 
+        previous_deltas = self._position_deltas(transaction)
+        changed_on = transaction.date
+
         if transaction_type is not None:
             transaction.transaction_type = transaction_type
         if quantity is not None:
             transaction.quantity = int(quantity)
         if transaction_date is not None:
+            changed_on = min(changed_on, transaction_date)
             transaction.date = transaction_date
         if price_per_unit is not None:
             transaction.price_per_unit = price_per_unit
@@ -227,58 +298,244 @@ class InvestmentService:
             transaction.note = note
 
         transaction.updated_at = datetime.now()
+        await self.db.flush()
 
-        # Recalculate asset quantity
-        asset = self.get_asset_by_id(transaction.asset_id)
-        if asset:
-            asset.quantity = int(self._calculate_current_quantity(asset))
+        # Replace the old transaction's contribution to the position with the new one
+        new_deltas = self._position_deltas(transaction)
+        await self._apply_position_delta(
+            transaction.asset_id,
+            {key: new_deltas[key] - previous_deltas[key] for key in new_deltas},
+        )
 
-        self.db.commit()
-        self.db.refresh(transaction)
+        await mark_rollup_stale(self.db, transaction.household_id, changed_on)
+        await self.db.commit()
+        returns_cache.invalidate(transaction.household_id)
+        await self.db.refresh(transaction)
         return transaction
 
-    def delete_transaction(self, transaction_id: int) -> bool:
+    async def delete_transaction(self, transaction_id: int) -> bool:
         """Delete a transaction and update asset quantity."""
-        transaction = self.get_transaction_by_id(transaction_id)
+        transaction = await self.get_transaction_by_id(transaction_id)
         if not transaction:
             return False
 
         asset_id = transaction.asset_id
-        self.db.delete(transaction)
-
-        # Recalculate asset quantity
-        asset = self.get_asset_by_id(asset_id)
-        if asset:
-            # Need to commit first to exclude deleted transaction
-            self.db.commit()
-            asset.quantity = int(self._calculate_current_quantity(asset))
-            self.db.commit()
-        else:
-            self.db.commit()
+        deltas = self._position_deltas(transaction)
+        await self.db.delete(transaction)
+        await self.db.flush()
+
+        # Remove the transaction's contribution from the position
+        await self._apply_position_delta(asset_id, {key: -value for key, value in deltas.items()})
 
+        await mark_rollup_stale(self.db, transaction.household_id, transaction.date)
+        await self.db.commit()
+        returns_cache.invalidate(transaction.household_id)
         return True
 
+    # ==================== Import Methods ====================
+
+    async def import_transactions(
+        self,
+        records: AsyncIterator[tuple[int, dict | None]],
+        household_id: int,
+        member_id: int,
+        parser: BrokerParser,
+        default_currency: str = "ISK",
+    ) -> ImportReport:
+        """
+        Import transactions across many assets in one database transaction.
+        Rows are matched to the member's assets by symbol; unknown symbols create a new asset
+        for the member. Positions are rebuilt once per affected asset instead of once per row.
+        """
+        report = ImportReport()
+        rows_by_symbol: dict[str, list[tuple[int, ImportTransactionRow]]] = {}
+        async for row, record in records:
+            try:
+                parsed = parser(record) if record is not None else None
+            except (KeyError, ValueError) as e:
+                report.add_error(row, f"Could not parse row: {e}")
+                continue
+            transaction, errors = validate_record(ImportTransactionRow, parsed)
+            if errors:
+                report.add_error(row, *errors)
+                continue
+            rows_by_symbol.setdefault(transaction.symbol.strip().upper(), []).append((row, transaction))
+        if not rows_by_symbol:
+            return report
+
+        # Rows go to the member's own asset for each symbol. A symbol the member holds more than once cannot be
+        # matched, so its rows are rejected.
+        assets: dict[str, InvestmentAsset] = {}
+        ambiguous: set[str] = set()
+        for asset in await self.get_assets_by_member(member_id):
+            symbol = asset.symbol.upper()
+            if symbol in rows_by_symbol:
+                if symbol in assets:
+                    ambiguous.add(symbol)
+                assets[symbol] = asset
+        # Signed unit changes of the assets' existing history, to replay together with the imported rows
+        existing_changes: dict[int, list[tuple[date, int]]] = {}
+        signed_quantity = case(
+            (InvestmentTransaction.transaction_type == TransactionType.SELL, -InvestmentTransaction.quantity),
+            else_=InvestmentTransaction.quantity,
+        )
+        history = await self.db.execute(
+            select(InvestmentTransaction.asset_id, InvestmentTransaction.date, signed_quantity).where(
+                InvestmentTransaction.asset_id.in_([asset.id for asset in assets.values()]),
+                InvestmentTransaction.transaction_type.in_([TransactionType.BUY, TransactionType.SELL]),
+            )
+        )
+        for asset_id, day, change in history:
+            existing_changes.setdefault(asset_id, []).append((day, change))
+
+        # A symbol whose imported rows would leave a negative holding on any date is rejected as a whole
+        accepted: dict[str, list[tuple[int, ImportTransactionRow]]] = {}
+        for symbol, symbol_rows in rows_by_symbol.items():
+            if symbol in ambiguous:
+                for row, _ in symbol_rows:
+                    report.add_error(row, f"symbol: The member holds more than one {symbol} asset")
+                continue
+            asset = assets.get(symbol)
+            changes = list(existing_changes.get(asset.id, [])) if asset else []
+            for _, transaction in symbol_rows:
+                if transaction.transaction_type.value == "buy":
+                    changes.append((transaction.date, transaction.quantity))
+                elif transaction.transaction_type.value == "sell":
+                    changes.append((transaction.date, -transaction.quantity))
+            # Stable sort: on a shared date, existing history comes before imported rows, in file order
+            changes.sort(key=lambda change: change[0])
+            quantity = 0
+            for _, change in changes:
+                quantity += change
+                if quantity < 0:
+                    break
+            if quantity < 0:
+                for row, _ in symbol_rows:
+                    report.add_error(row, f"symbol: Would sell more {symbol} units than are held")
+                continue
+            accepted[symbol] = symbol_rows
+        if not accepted:
+            return report
+
+        try:
+            asset_ids = {symbol: asset.id for symbol, asset in assets.items() if symbol in accepted}
+            asset_ids |= await self._create_import_assets(
+                household_id,
+                member_id,
+                {symbol: symbol_rows for symbol, symbol_rows in accepted.items() if symbol not in asset_ids},
+                default_currency,
+            )
+
+            # Insert in (asset, date) order so each asset's history lands together on disk
+            ordered = [
+                (asset_ids[symbol], transaction)
+                for symbol, symbol_rows in accepted.items()
+                for _, transaction in symbol_rows
+            ]
+            ordered.sort(key=lambda item: (item[0], item[1].date))
+            now = datetime.now()
+            await copy_rows(
+                self.db,
+                InvestmentTransaction.__tablename__,
+                TRANSACTION_COPY_COLUMNS,
+                (
+                    (
+                        household_id,
+                        member_id,
+                        asset_id,
+                        TransactionType(transaction.transaction_type.value).name,
+                        transaction.quantity,
+                        transaction.date,
+                        transaction.price_per_unit,
+                        transaction.fees,
+                        transaction.note,
+                        now,
+                        now,
+                    )
+                    for asset_id, transaction in ordered
+                ),
+            )
+            await self._rebuild_positions(list(asset_ids.values()))
+            await mark_rollup_stale(self.db, household_id, min(transaction.date for _, transaction in ordered))
+            await self.db.commit()
+            returns_cache.invalidate(household_id)
+        except (DBAPIError, psycopg.Error) as e:
+            await self.db.rollback()
+            for symbol_rows in accepted.values():
+                for row, _ in symbol_rows:
+                    report.add_error(row, f"Database error: {getattr(e, 'orig', e)}")
+            report.errors.sort()
+            return report
+
+        report.inserted = len(ordered)
+        report.errors.sort()
+        return report
+
+    async def _create_import_assets(
+        self,
+        household_id: int,
+        member_id: int,
+        rows_by_symbol: dict[str, list[tuple[int, ImportTransactionRow]]],
+        default_currency: str,
+    ) -> dict[str, int]:
+        """Create assets for imported symbols the household doesn't hold yet, valued at their latest price."""
+        if not rows_by_symbol:
+            return {}
+
+        latest = {symbol: max((t for _, t in rows), key=lambda t: t.date) for symbol, rows in rows_by_symbol.items()}
+        result = await self.db.execute(
+            insert(InvestmentAsset).returning(InvestmentAsset.id, InvestmentAsset.symbol),
+            [
+                {
+                    "household_id": household_id,
+                    "member_id": member_id,
+                    "name": transaction.name or symbol,
+                    "symbol": symbol,
+                    "asset_type": "stocks",
+                    "currency": transaction.currency or default_currency,
+                    "quantity": 0,
+                    "valuation_mode": ValuationMode.MANUAL,
+                }
+                for symbol, transaction in latest.items()
+            ],
+        )
+        asset_ids = {symbol: asset_id for asset_id, symbol in result.all()}
+
+        await self.db.execute(
+            insert(InvestmentValuationSnapshot),
+            [
+                {
+                    "asset_id": asset_ids[symbol],
+                    "valuation": transaction.price_per_unit,
+                    "source": "import",
+                    "date": transaction.date,
+                }
+                for symbol, transaction in latest.items()
+            ],
+        )
+        return asset_ids
+
     # ==================== Valuation Methods ====================
 
-    def get_valuations_by_asset(self, asset_id: int) -> list[InvestmentValuationSnapshot]:
+    async def get_valuations_by_asset(self, asset_id: int) -> list[InvestmentValuationSnapshot]:
         """Get all valuations for an asset, ordered by date descending."""
-        return (
-            self.db.query(InvestmentValuationSnapshot)
-            .filter(InvestmentValuationSnapshot.asset_id == asset_id)
+        result = await self.db.execute(
+            select(InvestmentValuationSnapshot)
+            .where(InvestmentValuationSnapshot.asset_id == asset_id)
             .order_by(desc(InvestmentValuationSnapshot.date))
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_latest_valuation(self, asset_id: int) -> Optional[InvestmentValuationSnapshot]:
+    async def get_latest_valuation(self, asset_id: int) -> Optional[InvestmentValuationSnapshot]:
         """Get the most recent valuation for an asset."""
-        return (
-            self.db.query(InvestmentValuationSnapshot)
-            .filter(InvestmentValuationSnapshot.asset_id == asset_id)
+        result = await self.db.execute(
+            select(InvestmentValuationSnapshot)
+            .where(InvestmentValuationSnapshot.asset_id == asset_id)
             .order_by(desc(InvestmentValuationSnapshot.date))
-            .first()
         )
+        return result.scalars().first()
 
-    def create_valuation(
+    async def create_valuation(
         self,
         asset_id: int,
         valuation: float,
@@ -293,41 +550,163 @@ class InvestmentService:
             date=valuation_date,
         )
         self.db.add(snapshot)
-        self.db.commit()
-        self.db.refresh(snapshot)
+        result = await self.db.execute(select(InvestmentAsset.household_id).where(InvestmentAsset.id == asset_id))
+        household_id = result.scalar_one()
+        await mark_rollup_stale(self.db, household_id, valuation_date)
+        await self.db.commit()
+        returns_cache.invalidate(household_id)
+        await self.db.refresh(snapshot)
         return snapshot
 
-    # ==================== Calculation Methods ====================
+    # ==================== Position Methods ====================
+
+    @staticmethod
+    def _position_deltas(transaction: InvestmentTransaction) -> dict:
+        """Get how much a single transaction contributes to its asset's position."""
+        gross = transaction.quantity * transaction.price_per_unit
+        fees = transaction.fees or 0.0
+
+        if transaction.transaction_type == TransactionType.BUY:
+            return {
+                "quantity": transaction.quantity,
+                "buy_total": gross,
+                "sell_total": 0.0,
+                "fee_total": fees,
+                "realized_income": 0.0,
+            }
+        if transaction.transaction_type == TransactionType.SELL:
+            return {
+                "quantity": -transaction.quantity,
+                "buy_total": 0.0,
+                "sell_total": gross,
+                "fee_total": fees,
+                "realized_income": 0.0,
+            }
+        # DIVIDEND and INTEREST don't affect quantity or cost basis
+        return {"quantity": 0, "buy_total": 0.0, "sell_total": 0.0, "fee_total": 0.0, "realized_income": gross - fees}
+
+    async def _apply_position_delta(self, asset_id: int, deltas: dict) -> None:
+        """
+        Add deltas to an asset's position in the current DB transaction and sync the asset quantity.
+        Falls back to a rebuild from history if the asset has no position row yet.
+        """
+        result = await self.db.execute(
+            update(InvestmentPosition)
+            .where(InvestmentPosition.asset_id == asset_id)
+            .values(
+                quantity=InvestmentPosition.quantity + deltas["quantity"],
+                buy_total=InvestmentPosition.buy_total + deltas["buy_total"],
+                sell_total=InvestmentPosition.sell_total + deltas["sell_total"],
+                fee_total=InvestmentPosition.fee_total + deltas["fee_total"],
+                realized_income=InvestmentPosition.realized_income + deltas["realized_income"],
+                updated_at=datetime.now(),
+            )
+            .returning(InvestmentPosition.quantity)
+        )
+        quantity = result.scalar_one_or_none()
+
+        if quantity is None:
+            await self._rebuild_positions([asset_id])
+            return
+
+        await self.db.execute(update(InvestmentAsset).where(InvestmentAsset.id == asset_id).values(quantity=quantity))
+
+    async def _aggregate_transactions(self, *criteria) -> dict[int, dict]:
+        """Aggregate position totals per asset from transaction history in a single GROUP BY query."""
+        fees = func.coalesce(InvestmentTransaction.fees, 0)
+        gross = InvestmentTransaction.quantity * InvestmentTransaction.price_per_unit
+        is_buy = InvestmentTransaction.transaction_type == TransactionType.BUY
+        is_sell = InvestmentTransaction.transaction_type == TransactionType.SELL
+        is_income = InvestmentTransaction.transaction_type.in_([TransactionType.DIVIDEND, TransactionType.INTEREST])
+
+        result = await self.db.execute(
+            select(
+                InvestmentTransaction.asset_id,
+                func.sum(
+                    case(
+                        (is_buy, InvestmentTransaction.quantity),
+                        (is_sell, -InvestmentTransaction.quantity),
+                        else_=0,
+                    )
+                ).label("quantity"),
+                func.sum(case((is_buy, gross), else_=0)).label("buy_total"),
+                func.sum(case((is_sell, gross), else_=0)).label("sell_total"),
+                func.sum(case((is_buy | is_sell, fees), else_=0)).label("fee_total"),
+                func.sum(case((is_income, gross - fees), else_=0)).label("realized_income"),
+            )
+            .where(*criteria)
+            .group_by(InvestmentTransaction.asset_id)
+        )
+        return {
+            row.asset_id: {
+                "quantity": row.quantity,
+                "buy_total": row.buy_total,
+                "sell_total": row.sell_total,
+                "fee_total": row.fee_total,
+                "realized_income": row.realized_income,
+            }
+            for row in result
+        }
+
+    async def _rebuild_positions(self, asset_ids: Optional[list[int]] = None) -> int:
+        """Recompute positions from transaction history without committing."""
+        asset_query = select(InvestmentAsset.id)
+        if asset_ids is not None:
+            asset_query = asset_query.where(InvestmentAsset.id.in_(asset_ids))
+        scoped_asset_ids = list((await self.db.execute(asset_query)).scalars().all())
+        if not scoped_asset_ids:
+            return 0
+
+        totals = await self._aggregate_transactions(InvestmentTransaction.asset_id.in_(scoped_asset_ids))
+        empty = {"quantity": 0, "buy_total": 0.0, "sell_total": 0.0, "fee_total": 0.0, "realized_income": 0.0}
+        positions = [{"asset_id": asset_id, **totals.get(asset_id, empty)} for asset_id in scoped_asset_ids]
+
+        await self.db.execute(delete(InvestmentPosition).where(InvestmentPosition.asset_id.in_(scoped_asset_ids)))
+        await self.db.execute(insert(InvestmentPosition), positions)
+        await self.db.execute(
+            update(InvestmentAsset),
+            [{"id": position["asset_id"], "quantity": position["quantity"]} for position in positions],
+        )
+        return len(positions)
 
-    def _calculate_current_quantity(self, asset: InvestmentAsset) -> float:
-        """Calculate current quantity from transactions."""
-        transactions = self.get_transactions_by_asset(asset.id)
-        buy_qty = sum(t.quantity for t in transactions if t.transaction_type == TransactionType.BUY)
-        sell_qty = sum(t.quantity for t in transactions if t.transaction_type == TransactionType.SELL)
-        return buy_qty - sell_qty
+    async def rebuild_positions(self, asset_ids: Optional[list[int]] = None) -> int:
+        """Rebuild materialized positions from transaction history. Rebuilds every asset if no IDs are given."""
+        count = await self._rebuild_positions(asset_ids)
+        await self.db.commit()
+        return count
 
-    def calculate_asset_metrics(self, asset: InvestmentAsset) -> dict:
-        """Calculate all metrics for an asset."""
-        transactions = self.get_transactions_by_asset(asset.id)
-        latest_valuation = self.get_latest_valuation(asset.id)
+    async def _get_positions(self, *criteria) -> dict[int, InvestmentPosition]:
+        """Get materialized positions keyed by asset ID."""
+        result = await self.db.execute(select(InvestmentPosition).where(*criteria))
+        return {position.asset_id: position for position in result.scalars()}
 
-        # Calculate quantities
-        buy_qty = sum(t.quantity for t in transactions if t.transaction_type == TransactionType.BUY)
-        sell_qty = sum(t.quantity for t in transactions if t.transaction_type == TransactionType.SELL)
-        current_quantity = buy_qty - sell_qty
-
-        # Calculate cost basis (total invested)
-        buy_total = sum(
-            t.quantity * t.price_per_unit + (t.fees or 0)
-            for t in transactions
-            if t.transaction_type == TransactionType.BUY
-        )
-        sell_total = sum(
-            t.quantity * t.price_per_unit - (t.fees or 0)
-            for t in transactions
-            if t.transaction_type == TransactionType.SELL
+    # ==================== Calculation Methods ====================
+
+    async def _latest_valuations(self, *criteria) -> dict[int, InvestmentValuationSnapshot]:
+        """Get the most recent valuation per asset using DISTINCT ON."""
+        result = await self.db.execute(
+            select(InvestmentValuationSnapshot)
+            .where(*criteria)
+            .distinct(InvestmentValuationSnapshot.asset_id)
+            .order_by(
+                InvestmentValuationSnapshot.asset_id,
+                desc(InvestmentValuationSnapshot.date),
+                desc(InvestmentValuationSnapshot.id),
+            )
         )
-        total_invested = buy_total - sell_total
+        return {snapshot.asset_id: snapshot for snapshot in result.scalars()}
+
+    @staticmethod
+    def _build_asset_metrics(
+        position: Optional[InvestmentPosition],
+        latest_valuation: Optional[InvestmentValuationSnapshot],
+    ) -> dict:
+        """Build the metrics dict for an asset from its position and latest valuation."""
+        # Calculate quantities
+        current_quantity = position.quantity if position else 0
+
+        # Calculate cost basis (total invested): buys plus fees, minus sale proceeds
+        total_invested = position.buy_total - position.sell_total + position.fee_total if position else 0.0
 
         # Calculate current value
         current_value = None
@@ -352,9 +731,35 @@ class InvestmentService:
             "is_fully_sold": current_quantity <= 0,
         }
 
-    def calculate_portfolio_summary(self, household_id: int) -> dict:
+    async def calculate_asset_metrics(self, asset: InvestmentAsset) -> dict:
+        """Calculate all metrics for an asset."""
+        positions = await self._get_positions(InvestmentPosition.asset_id == asset.id)
+        latest_valuations = await self._latest_valuations(InvestmentValuationSnapshot.asset_id == asset.id)
+        return self._build_asset_metrics(positions.get(asset.id), latest_valuations.get(asset.id))
+
+    async def calculate_household_metrics(self, household_id: int) -> list[tuple[InvestmentAsset, dict]]:
+        """
+        Calculate metrics for every asset in a household.
+        Uses a fixed number of queries regardless of how many assets the household holds.
+        """
+        assets = await self.get_assets_by_household(household_id)
+        if not assets:
+            return []
+
+        household_asset_ids = (
+            select(InvestmentAsset.id).where(InvestmentAsset.household_id == household_id).scalar_subquery()
+        )
+        positions = await self._get_positions(InvestmentPosition.asset_id.in_(household_asset_ids))
+        latest_valuations = await self._latest_valuations(InvestmentValuationSnapshot.asset_id.in_(household_asset_ids))
+
+        return [
+            (asset, self._build_asset_metrics(positions.get(asset.id), latest_valuations.get(asset.id)))
+            for asset in assets
+        ]
+
+    async def calculate_portfolio_summary(self, household_id: int) -> dict:
         """Calculate portfolio summary for a household."""
-        assets = self.get_assets_by_household(household_id)
+        assets_with_metrics = await self.calculate_household_metrics(household_id)
 
         total_invested = 0.0
         current_value = 0.0
@@ -362,9 +767,7 @@ class InvestmentService:
         active_count = 0
         sold_count = 0
 
-        for asset in assets:
-            metrics = self.calculate_asset_metrics(asset)
-
+        for asset, metrics in assets_with_metrics:
             # Update totals
             total_invested += metrics["total_invested"]
             if metrics["current_value"] is not None:
@@ -403,11 +806,163 @@ class InvestmentService:
             "total_growth": total_growth,
             "growth_percentage": growth_percentage,
             "assets_by_type": assets_by_type,
-            "total_assets": len(assets),
+            "total_assets": len(assets_with_metrics),
             "active_assets": active_count,
             "sold_assets": sold_count,
         }
 
+    # ==================== History Methods ====================
+
+    async def get_portfolio_history(self, household_id: int, date_from: date, date_to: date, interval: str) -> dict:
+        """
+        Get the value of each asset and of the whole portfolio on every day, week end or month end in a
+        range, from the quantity held and the last valuation known on each date.
+        Assets not held at any point in the range are left out.
+        """
+        history = await load_holdings_history(self.db, household_id, date_from, date_to, interval)
+        assets = {asset.id: asset for asset in await self.get_assets_by_household(household_id)}
+
+        asset_histories = []
+        for asset_id, quantities, values in zip(history.asset_ids, history.quantities, history.values, strict=True):
+            if not quantities.any():
+                continue
+            asset_histories.append(
+                {
+                    "asset_id": asset_id,
+                    "name": assets[asset_id].name,
+                    "symbol": assets[asset_id].symbol or None,
+                    "quantities": quantities.tolist(),
+                    "values": [None if math.isnan(value) else value for value in values.round(2).tolist()],
+                }
+            )
+        return {
+            "dates": history.dates.tolist(),
+            "total_values": history.totals.round(2).tolist(),
+            "assets": asset_histories,
+        }
+
+    # ==================== Returns Methods ====================
+
+    async def calculate_returns(self, household_id: int) -> dict:
+        """
+        Calculate money-weighted (XIRR) and time-weighted returns per asset, per asset type and for the
+        whole household, from the first transaction until today. Buys, sales, dividends and interest are
+        the cash flows and holdings are valued from their snapshots. Every series is solved in one batch,
+        and the result is cached until the household's investments change.
+        """
+        cached = returns_cache.get(household_id)
+        if cached is not None:
+            return cached
+
+        today = date.today()
+        fees = func.coalesce(InvestmentTransaction.fees, 0)
+        gross = InvestmentTransaction.quantity * InvestmentTransaction.price_per_unit
+        # Signed from the investor's side: buying costs money, everything else brings it back
+        is_buy = InvestmentTransaction.transaction_type == TransactionType.BUY
+        cash_flow = case((is_buy, -(gross + fees)), else_=gross - fees)
+        result = await self.db.execute(
+            select(
+                InvestmentTransaction.asset_id,
+                InvestmentTransaction.date,
+                cash_flow,
+                InvestmentTransaction.transaction_type.in_([TransactionType.DIVIDEND, TransactionType.INTEREST]),
+            ).where(InvestmentTransaction.household_id == household_id, InvestmentTransaction.date <= today)
+        )
+        flow_rows = result.all()
+        if not flow_rows:
+            returns = {"as_of": today, "total": _series_returns(), "asset_types": [], "assets": []}
+            returns_cache.set(household_id, returns)
+            return returns
+
+        flow_assets, flow_dates, amounts, is_income = (np.array(column) for column in zip(*flow_rows, strict=True))
+        flow_dates = flow_dates.astype("datetime64[D]")
+        history = await load_holdings_history(self.db, household_id, flow_dates.min().item(), today)
+        assets = {asset.id: asset for asset in await self.get_assets_by_household(household_id)}
+
+        # One series per asset, then one per asset type, then the household
+        asset_ids = np.array(history.asset_ids)
+        asset_types = sorted({assets[asset_id].asset_type for asset_id in history.asset_ids})
+        type_index = {asset_type: i for i, asset_type in enumerate(asset_types)}
+        asset_count, type_count = len(asset_ids), len(asset_types)
+        series_count = asset_count + type_count + 1
+        type_rows = np.array([type_index[assets[asset_id].asset_type] for asset_id in history.asset_ids])
+        membership = np.zeros((type_count + 1, asset_count))
+        membership[type_rows, np.arange(asset_count)] = 1
+        membership[-1] = 1
+
+        rows = np.searchsorted(asset_ids, flow_assets)
+        days = (flow_dates - history.dates[0]).astype(int)
+        day_count = len(history.dates)
+        contributions = np.zeros((asset_count, day_count))
+        withdrawals = np.zeros((asset_count, day_count))
+        np.add.at(contributions, (rows, days), np.maximum(-amounts, 0))
+        np.add.at(withdrawals, (rows, days), np.maximum(amounts, 0))
+
+        # Holdings without a valuation count as zero in the type and household totals
+        known_values = np.nan_to_num(history.values)
+        values = np.vstack((history.values, membership @ known_values))
+        contributions = np.vstack((contributions, membership @ contributions))
+        withdrawals = np.vstack((withdrawals, membership @ withdrawals))
+        time_weighted = twr(values, contributions, withdrawals)
+        first_days = np.argmax((contributions + withdrawals) != 0, axis=1)
+        annualized = annualize(time_weighted, (day_count - 1 - first_days) / 365)
+
+        # Each flow counts towards its asset, its asset type and the household, closed by today's value
+        flow_series = np.concatenate(
+            (rows, asset_count + type_rows[rows], np.full(len(rows), series_count - 1), np.arange(series_count))
+        )
+        flow_days = np.concatenate((days, days, days, np.full(series_count, day_count - 1)))
+        current_values = values[:, -1]
+        flow_amounts = np.concatenate((amounts, amounts, amounts, np.nan_to_num(current_values)))
+        money_weighted = xirr(flow_series, flow_days / 365, flow_amounts, series_count)
+        money_weighted[np.isnan(current_values)] = np.nan
+
+        income = np.bincount(rows, np.where(is_income, amounts, 0), minlength=asset_count)
+        income = np.concatenate((income, membership @ income))
+
+        def series(i: int) -> dict:
+            return _series_returns(current_values[i], income[i], money_weighted[i], time_weighted[i], annualized[i])
+
+        returns = {
+            "as_of": today,
+            "total": series(series_count - 1),
+            "asset_types": [
+                {"asset_type": asset_type, **series(asset_count + i)} for i, asset_type in enumerate(asset_types)
+            ],
+            "assets": [
+                {
+                    "asset_id": asset_id,
+                    "name": assets[asset_id].name,
+                    "asset_type": assets[asset_id].asset_type,
+                    **series(i),
+                }
+                for i, asset_id in enumerate(history.asset_ids)
+            ],
+        }
+        returns_cache.set(household_id, returns)
+        return returns
+
+
+def _series_returns(
+    current_value: float = 0.0,
+    income: float = 0.0,
+    money_weighted: float = math.nan,
+    time_weighted: float = math.nan,
+    annualized: float = math.nan,
+) -> dict:
+    """Returns of one series, with None for whatever could not be determined."""
+
+    def known(value: float) -> Optional[float]:
+        return None if math.isnan(value) else float(value)
+
+    return {
+        "current_value": known(current_value),
+        "income": float(income),
+        "xirr": known(money_weighted),
+        "twr": known(time_weighted),
+        "annualized_twr": known(annualized),
+    }
+
 
-def get_investment_service(db: Session = Depends(get_db)) -> InvestmentService:
+def get_investment_service(db: AsyncSession = Depends(get_async_db)) -> InvestmentService:
     return InvestmentService(db)
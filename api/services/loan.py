@@ -0,0 +1,406 @@
+from datetime import date, datetime
+from itertools import repeat
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy import delete, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from db.engine import get_async_db
+from models.loan import Loan
+from models.loan_adjustment import AdjustmentType, LoanAdjustment
+from models.loan_member import LoanMember
+from models.loan_payment import LoanPayment
+from models.loan_snapshot import LoanSnapshot
+from models.member import Member
+from services.amortization import AmortizationSchedule, amortize
+from services.bulk_import import copy_rows
+from services.net_worth import mark_rollup_stale
+
+# Column order of the rows _write_schedules streams with COPY
+PAYMENT_COPY_COLUMNS = (
+    "loan_id",
+    "amount",
+    "interest_amount",
+    "principal_amount",
+    "remaining_balance",
+    "date",
+    "created_at",
+    "updated_at",
+)
+PAYMENT_COPY_TYPES = ("int4", "float8", "float8", "float8", "float8", "date", "timestamp", "timestamp")
+SNAPSHOT_COPY_COLUMNS = ("loan_id", "date", "outstanding_principal", "created_at", "updated_at")
+SNAPSHOT_COPY_TYPES = ("int4", "date", "float8", "timestamp", "timestamp")
+
+
+class LoanService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ==================== Loan Methods ====================
+
+    def _loan_query(self):
+        return select(Loan).options(selectinload(Loan.loan_members), selectinload(Loan.loan_adjustments))
+
+    async def get_loans_by_household(self, household_id: int) -> list[Loan]:
+        """Get all loans for a household with their members and adjustments."""
+        result = await self.db.execute(
+            self._loan_query().where(Loan.household_id == household_id).order_by(Loan.created_at.desc())
+        )
+        return list(result.scalars().all())
+
+    async def get_loan_by_id(self, loan_id: int) -> Optional[Loan]:
+        """Get a loan with its members and adjustments."""
+        result = await self.db.execute(
+            self._loan_query().where(Loan.id == loan_id).execution_options(populate_existing=True)
+        )
+        return result.scalars().first()
+
+    async def create_loan(
+        self,
+        household_id: int,
+        name: str,
+        loan_type: str,
+        currency: str,
+        principal: float,
+        interest_rate: float,
+        start_date: date,
+        end_date: date,
+        members: list[tuple[int, float]],
+    ) -> Loan:
+        """Create a loan shared between members, and write its payment schedule."""
+        if end_date <= start_date:
+            raise ValueError("end_date must be after start_date")
+        await self._validate_members(household_id, members)
+
+        loan = Loan(
+            household_id=household_id,
+            name=name,
+            loan_type=loan_type,
+            currency=currency,
+            principal=principal,
+            interest_rate=interest_rate,
+            start_date=start_date,
+            end_date=end_date,
+            loan_members=[LoanMember(member_id=member_id, share_percent=share) for member_id, share in members],
+            loan_adjustments=[],
+        )
+        self.db.add(loan)
+        await self.db.flush()
+        await self._write_schedules([loan])
+        await self.db.commit()
+        return await self.get_loan_by_id(loan.id)
+
+    async def update_loan(
+        self,
+        loan_id: int,
+        name: Optional[str] = None,
+        loan_type: Optional[str] = None,
+        currency: Optional[str] = None,
+        principal: Optional[float] = None,
+        interest_rate: Optional[float] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        members: Optional[list[tuple[int, float]]] = None,
+    ) -> Optional[Loan]:
+        """Update a loan's details and members. The schedule is rewritten when its terms change."""
+        loan = await self.get_loan_by_id(loan_id)
+        if not loan:
+            return None
+
+        if (end_date or loan.end_date) <= (start_date or loan.start_date):
+            raise ValueError("end_date must be after start_date")
+
+        if members is not None:
+            await self._validate_members(loan.household_id, members)
+            await self.db.execute(delete(LoanMember).where(LoanMember.loan_id == loan_id))
+            self.db.add_all(
+                LoanMember(loan_id=loan_id, member_id=member_id, share_percent=share) for member_id, share in members
+            )
+
+        if name is not None:
+            loan.name = name
+        if loan_type is not None:
+            loan.loan_type = loan_type
+        if currency is not None:
+            loan.currency = currency
+
+        terms = {"principal": principal, "interest_rate": interest_rate, "start_date": start_date, "end_date": end_date}
+        terms_changed = False
+        # Moving the start date later also changes the balances from the old start date
+        previous_start_date = loan.start_date
+        for field, value in terms.items():
+            if value is not None and value != getattr(loan, field):
+                setattr(loan, field, value)
+                terms_changed = True
+
+        loan.updated_at = datetime.now()
+        if terms_changed:
+            await self._write_schedules([loan])
+            await mark_rollup_stale(self.db, loan.household_id, previous_start_date)
+        await self.db.commit()
+        return await self.get_loan_by_id(loan_id)
+
+    async def delete_loan(self, loan_id: int) -> bool:
+        """Delete a loan with its members, adjustments, payments and snapshots."""
+        loan = await self.db.get(Loan, loan_id)
+        if not loan:
+            return False
+
+        for model in (LoanPayment, LoanSnapshot, LoanAdjustment, LoanMember):
+            await self.db.execute(delete(model).where(model.loan_id == loan_id))
+        await self.db.delete(loan)
+        await mark_rollup_stale(self.db, loan.household_id, loan.start_date)
+        await self.db.commit()
+        return True
+
+    async def _validate_members(self, household_id: int, members: list[tuple[int, float]]) -> None:
+        member_ids = [member_id for member_id, _ in members]
+        if len(set(member_ids)) != len(member_ids):
+            raise ValueError("Each member can only hold one share of a loan")
+        if sum(share for _, share in members) > 100:
+            raise ValueError("Member shares cannot add up to more than 100%")
+
+        result = await self.db.execute(
+            select(Member.id).where(Member.id.in_(member_ids), Member.household_id == household_id)
+        )
+        unknown = set(member_ids) - set(result.scalars().all())
+        if unknown:
+            raise ValueError(f"Members not in this household: {sorted(unknown)}")
+
+    # ==================== Adjustment Methods ====================
+
+    async def create_adjustment(
+        self,
+        loan: Loan,
+        adjustment_type: AdjustmentType,
+        adjustment_date: date,
+        value: float,
+    ) -> LoanAdjustment:
+        """Record an extra payment or rate change and rewrite the loan's schedule."""
+        adjustment = LoanAdjustment(
+            loan_id=loan.id,
+            adjustment_type=adjustment_type,
+            date=adjustment_date,
+            value=value,
+        )
+        loan.loan_adjustments.append(adjustment)
+        await self.db.flush()
+        await self._write_schedules([loan])
+        await self.db.commit()
+        await self.db.refresh(adjustment)
+        return adjustment
+
+    async def delete_adjustment(self, loan: Loan, adjustment_id: int) -> bool:
+        """Remove an adjustment and rewrite the loan's schedule."""
+        adjustment = next((item for item in loan.loan_adjustments if item.id == adjustment_id), None)
+        if not adjustment:
+            return False
+
+        loan.loan_adjustments.remove(adjustment)
+        await self.db.delete(adjustment)
+        await self._write_schedules([loan])
+        await self.db.commit()
+        return True
+
+    # ==================== Schedule Methods ====================
+
+    @staticmethod
+    def build_schedule(loan: Loan) -> AmortizationSchedule:
+        """Amortize a loan, applying its adjustments. The loan's adjustments must be loaded."""
+        extra_payments = []
+        rate_changes = []
+        for adjustment in loan.loan_adjustments:
+            if adjustment.adjustment_type == AdjustmentType.EXTRA_PAYMENT:
+                extra_payments.append((adjustment.date, adjustment.value))
+            else:
+                rate_changes.append((adjustment.date, adjustment.value))
+        return amortize(
+            loan.principal,
+            loan.interest_rate,
+            loan.start_date,
+            loan.end_date,
+            extra_payments=extra_payments,
+            rate_changes=rate_changes,
+        )
+
+    async def recalculate_household(self, household_id: int) -> tuple[int, int, int]:
+        """Rewrite the schedules of every loan in a household. Returns (loans, payments, snapshots) written."""
+        loans = await self.get_loans_by_household(household_id)
+        if not loans:
+            return 0, 0, 0
+        payments, snapshots = await self._write_schedules(loans)
+        await self.db.commit()
+        return len(loans), payments, snapshots
+
+    async def _write_schedules(self, loans: list[Loan]) -> tuple[int, int]:
+        """
+        Replace the LoanPayment and LoanSnapshot rows of the given loans with freshly computed ones.
+        Payments are streamed with COPY while snapshots (a year-end balance per year) are collected for
+        a second COPY. Marks the households' net worth rollups stale. Does not commit.
+        """
+        loan_ids = [loan.id for loan in loans]
+        await self.db.execute(delete(LoanPayment).where(LoanPayment.loan_id.in_(loan_ids)))
+        await self.db.execute(delete(LoanSnapshot).where(LoanSnapshot.loan_id.in_(loan_ids)))
+
+        now = datetime.now()
+        snapshot_rows: list[tuple] = []
+        payment_count = 0
+
+        def payment_rows():
+            nonlocal payment_count
+            for loan in loans:
+                schedule = self.build_schedule(loan)
+                payment_count += len(schedule)
+                snapshot_dates = _snapshot_dates(loan)
+                snapshot_rows.extend(
+                    zip(
+                        repeat(loan.id),
+                        snapshot_dates,
+                        schedule.balances_at(snapshot_dates).round(2).tolist(),
+                        repeat(now),
+                        repeat(now),
+                    )
+                )
+                yield from zip(
+                    repeat(loan.id),
+                    schedule.payments.round(2).tolist(),
+                    schedule.interest.round(2).tolist(),
+                    schedule.principal_paid.round(2).tolist(),
+                    schedule.balances.round(2).tolist(),
+                    schedule.dates.tolist(),
+                    repeat(now),
+                    repeat(now),
+                )
+
+        await copy_rows(
+            self.db, LoanPayment.__tablename__, PAYMENT_COPY_COLUMNS, payment_rows(), types=PAYMENT_COPY_TYPES
+        )
+        await copy_rows(
+            self.db, LoanSnapshot.__tablename__, SNAPSHOT_COPY_COLUMNS, snapshot_rows, types=SNAPSHOT_COPY_TYPES
+        )
+
+        first_start_dates: dict[int, date] = {}
+        for loan in loans:
+            first_start_dates[loan.household_id] = min(
+                loan.start_date, first_start_dates.get(loan.household_id, loan.start_date)
+            )
+        for household_id, start_date in first_start_dates.items():
+            await mark_rollup_stale(self.db, household_id, start_date)
+        return payment_count, len(snapshot_rows)
+
+    # ==================== Allocation Methods ====================
+
+    def _loan_states(self, household_id: int, on: date):
+        """
+        Per-loan outstanding principal, next installment and interest paid on a date, read from the
+        written schedule. Loans that had not started by then are left out.
+        """
+        last_payment = (
+            select(LoanPayment.remaining_balance)
+            .where(LoanPayment.loan_id == Loan.id, LoanPayment.date <= on)
+            .order_by(LoanPayment.date.desc())
+            .limit(1)
+            .lateral("last_payment")
+        )
+        next_payment = (
+            select(LoanPayment.amount, LoanPayment.interest_amount)
+            .where(LoanPayment.loan_id == Loan.id, LoanPayment.date > on)
+            .order_by(LoanPayment.date)
+            .limit(1)
+            .lateral("next_payment")
+        )
+        interest_paid = (
+            select(func.coalesce(func.sum(LoanPayment.interest_amount), 0.0).label("interest_paid"))
+            .where(LoanPayment.loan_id == Loan.id, LoanPayment.date <= on)
+            .lateral("interest_paid")
+        )
+        return (
+            select(
+                Loan.id.label("loan_id"),
+                func.coalesce(last_payment.c.remaining_balance, Loan.principal).label("outstanding_principal"),
+                func.coalesce(next_payment.c.amount, 0.0).label("monthly_payment"),
+                func.coalesce(next_payment.c.interest_amount, 0.0).label("monthly_interest"),
+                interest_paid.c.interest_paid,
+            )
+            .select_from(Loan)
+            .outerjoin(last_payment, true())
+            .outerjoin(next_payment, true())
+            .join(interest_paid, true())
+            .where(Loan.household_id == household_id, Loan.start_date <= on)
+            .cte("loan_state")
+        )
+
+    async def get_household_debt(self, household_id: int, on: date) -> dict:
+        """
+        Allocate every loan's outstanding principal, next installment and interest paid to members by
+        share percent, as of a date. Shares that add up to less than 100% leave the rest unallocated.
+        Runs two aggregate queries regardless of how many loans and members the household has.
+        """
+        loan_state = self._loan_states(household_id, on)
+        amounts = ("outstanding_principal", "monthly_payment", "monthly_interest", "interest_paid")
+
+        share = LoanMember.share_percent / 100
+        member_result = await self.db.execute(
+            select(
+                Member.id,
+                Member.name,
+                func.count(loan_state.c.loan_id).label("loan_count"),
+                *(func.sum(loan_state.c[amount] * share).label(amount) for amount in amounts),
+            )
+            .select_from(loan_state)
+            .join(LoanMember, LoanMember.loan_id == loan_state.c.loan_id)
+            .join(Member, Member.id == LoanMember.member_id)
+            .group_by(Member.id, Member.name)
+            .order_by(Member.id)
+        )
+
+        allocated = (
+            select(LoanMember.loan_id, func.sum(LoanMember.share_percent).label("share_percent"))
+            .join(loan_state, loan_state.c.loan_id == LoanMember.loan_id)
+            .group_by(LoanMember.loan_id)
+            .subquery()
+        )
+        unallocated_share = (100 - func.coalesce(allocated.c.share_percent, 0)) / 100
+        totals_result = await self.db.execute(
+            select(
+                func.count(loan_state.c.loan_id).label("loan_count"),
+                *(func.coalesce(func.sum(loan_state.c[amount]), 0.0).label(amount) for amount in amounts),
+                *(
+                    func.coalesce(func.sum(loan_state.c[amount] * unallocated_share), 0.0).label(
+                        f"unallocated_{amount}"
+                    )
+                    for amount in amounts
+                ),
+            )
+            .select_from(loan_state)
+            .outerjoin(allocated, allocated.c.loan_id == loan_state.c.loan_id)
+        )
+        totals = totals_result.one()._mapping
+
+        return {
+            "date": on,
+            "loan_count": totals["loan_count"],
+            "total": {amount: totals[amount] for amount in amounts},
+            "unallocated": {amount: totals[f"unallocated_{amount}"] for amount in amounts},
+            "members": [
+                {
+                    "member_id": row.id,
+                    "member_name": row.name,
+                    "loan_count": row.loan_count,
+                    **{amount: row._mapping[amount] for amount in amounts},
+                }
+                for row in member_result
+            ],
+        }
+
+
+def _snapshot_dates(loan: Loan) -> list[date]:
+    """The start date, each year end within the term, and the end date."""
+    year_ends = (date(year, 12, 31) for year in range(loan.start_date.year, loan.end_date.year))
+    return sorted({loan.start_date, *year_ends, loan.end_date})
+
+
+def get_loan_service(db: AsyncSession = Depends(get_async_db)) -> LoanService:
+    return LoanService(db)
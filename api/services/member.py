@@ -1,17 +1,18 @@
 from typing import Optional
 
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.engine import get_db
+from db.engine import get_async_db
 from models.member import Member
 
 
 class MemberService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_member(
+    async def create_member(
         self,
         name: str,
         household_id: int,
@@ -19,21 +20,23 @@ class MemberService:
     ) -> Member:
         member = Member(name=name, image_url=image_url, household_id=household_id)
         self.db.add(member)
-        self.db.commit()
+        await self.db.commit()
         return member
 
-    def delete_member(self, member_id: int) -> None:
-        member = self.db.query(Member).filter(Member.id == member_id).first()
+    async def delete_member(self, member_id: int) -> None:
+        member = await self.get_member(member_id)
         if member:
-            self.db.delete(member)
-            self.db.commit()
+            await self.db.delete(member)
+            await self.db.commit()
 
-    def get_member(self, member_id: int) -> Optional[Member]:
-        return self.db.query(Member).filter(Member.id == member_id).first()
+    async def get_member(self, member_id: int) -> Optional[Member]:
+        result = await self.db.execute(select(Member).where(Member.id == member_id))
+        return result.scalars().first()
 
-    def get_members(self, household_id: int) -> list[Member]:
-        return self.db.query(Member).filter(Member.household_id == household_id).all()
+    async def get_members(self, household_id: int) -> list[Member]:
+        result = await self.db.execute(select(Member).where(Member.household_id == household_id))
+        return list(result.scalars().all())
 
 
-def get_member_service(db: Session = Depends(get_db)) -> MemberService:
+def get_member_service(db: AsyncSession = Depends(get_async_db)) -> MemberService:
     return MemberService(db)
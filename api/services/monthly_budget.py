@@ -1,59 +1,173 @@
-from datetime import datetime
+from calendar import monthrange
+from datetime import date, datetime
 from typing import Optional
 
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, String, column, exists, func, literal, null, select, true, union_all
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from db.engine import get_db
+from core.config import settings
+from db.engine import get_async_db
+from models.expense import Expense
+from models.expense_category import ExpenseCategory
+from models.income import Income
 from models.monthly_budget import MonthlyBudget
 
 
 class MonthlyBudgetService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_or_create(
+    async def get_or_create(
         self,
         household_id: int,
         year: int,
         month: int,
     ) -> MonthlyBudget:
-        monthly_budget = (
-            self.db.query(MonthlyBudget)
-            .filter(MonthlyBudget.household_id == household_id)
-            .filter(MonthlyBudget.year == year)
-            .filter(MonthlyBudget.month == month)
-            .first()
+        """
+        Get a household's budget for a month, creating it with the currency and planned budget of the latest
+        budget if it does not exist yet. Lookup and insert are one statement and the insert does nothing on
+        conflict, so concurrent first loads of a month end up with the same budget.
+        """
+        existing = (
+            select(MonthlyBudget.__table__)
+            .where(
+                MonthlyBudget.household_id == household_id,
+                MonthlyBudget.year == year,
+                MonthlyBudget.month == month,
+            )
+            .cte("existing")
         )
-        if monthly_budget:
-            return monthly_budget
-        previous_monthly_budget = (
-            self.db.query(MonthlyBudget)
-            .filter(MonthlyBudget.household_id == household_id)
-            .order_by(MonthlyBudget.created_at.desc())
-            .first()
+        currency, planned_budget = _seed_columns(household_id)
+        now = datetime.now()
+        # Only tried when the month has no budget, so the common path writes nothing
+        seed = select(
+            literal(household_id),
+            literal(year),
+            literal(month),
+            literal(f"{year}-{month:02d}"),
+            currency,
+            planned_budget,
+            literal(now),
+            literal(now),
+        ).where(~exists(existing.select()))
+        inserted = (
+            insert(MonthlyBudget)
+            .from_select(
+                ["household_id", "year", "month", "name", "currency", "planned_budget", "created_at", "updated_at"],
+                seed,
+            )
+            .on_conflict_do_nothing(constraint="uq_monthly_budgets_household_id_year_month")
+            .returning(*MonthlyBudget.__table__.c)
+            .cte("inserted")
         )
-        currency = previous_monthly_budget.currency if previous_monthly_budget else "ISK"
-        planned_budget = previous_monthly_budget.planned_budget if previous_monthly_budget else 0
-        monthly_budget = MonthlyBudget(
-            household_id=household_id,
-            year=year,
-            month=month,
-            planned_budget=(planned_budget),
-            currency=currency,
-            name=f"{year}-{month:02d}",
-        )
-        self.db.add(monthly_budget)
-        self.db.commit()
+        rows = union_all(
+            select(existing, literal(False).label("created")),
+            select(inserted, literal(True).label("created")),
+        ).subquery()
+        result = await self.db.execute(select(aliased(MonthlyBudget, rows), rows.c.created))
+        row = result.first()
+        if row is None:
+            # Another transaction created the budget after this statement started; it is visible to the next one
+            result = await self.db.execute(
+                select(MonthlyBudget).where(
+                    MonthlyBudget.household_id == household_id,
+                    MonthlyBudget.year == year,
+                    MonthlyBudget.month == month,
+                )
+            )
+            return result.scalar_one()
+
+        monthly_budget, created = row
+        if created:
+            await self.db.commit()
+            # Imported here because recurring templates create their budgets through this service
+            from services.recurring import RecurringService, month_end
+
+            # Through the new month too, as budgets opened ahead of time are not materialized again when read. Rows
+            # written early no longer follow template changes, so this stops a few months ahead; later budgets get
+            # their occurrences once their month comes up.
+            today = date.today()
+            current = today.year * 12 + today.month - 1
+            last_year, last_month = divmod(
+                min(max(year * 12 + month - 1, current), current + settings.recurring_months_ahead), 12
+            )
+            through = month_end(date(last_year, last_month + 1, 1))
+            await RecurringService(self.db).materialize(through, household_ids=[household_id])
         return monthly_budget
 
-    def update(
+    async def ensure_budgets(self, months: set[tuple[int, int, int]]) -> dict[tuple[int, int, int], int]:
+        """
+        Get the IDs of (household_id, year, month) budgets, creating the missing ones the way get_or_create does,
+        in two statements however many there are. Does not commit.
+        """
+        if not months:
+            return {}
+        # Passed as four arrays rather than a VALUES list, so the parameter count stays fixed
+        household_ids, years, month_numbers = (list(part) for part in zip(*months, strict=True))
+        names = [f"{year}-{month:02d}" for year, month in zip(years, month_numbers, strict=True)]
+        wanted = (
+            func.unnest(
+                literal(household_ids, ARRAY(Integer)),
+                literal(years, ARRAY(Integer)),
+                literal(month_numbers, ARRAY(Integer)),
+                literal(names, ARRAY(String)),
+            )
+            .table_valued(
+                column("household_id", Integer),
+                column("year", Integer),
+                column("month", Integer),
+                column("name", String),
+            )
+            .render_derived("wanted")
+        )
+        existing = select(MonthlyBudget.id).where(
+            MonthlyBudget.household_id == wanted.c.household_id,
+            MonthlyBudget.year == wanted.c.year,
+            MonthlyBudget.month == wanted.c.month,
+        )
+        now = datetime.now()
+        await self.db.execute(
+            insert(MonthlyBudget)
+            .from_select(
+                ["household_id", "year", "month", "name", "currency", "planned_budget", "created_at", "updated_at"],
+                select(
+                    wanted.c.household_id,
+                    wanted.c.year,
+                    wanted.c.month,
+                    wanted.c.name,
+                    *_seed_columns(wanted.c.household_id),
+                    literal(now),
+                    literal(now),
+                ).where(~exists(existing)),
+            )
+            .on_conflict_do_nothing(constraint="uq_monthly_budgets_household_id_year_month")
+        )
+        result = await self.db.execute(
+            select(MonthlyBudget.id, MonthlyBudget.household_id, MonthlyBudget.year, MonthlyBudget.month).join(
+                wanted,
+                (MonthlyBudget.household_id == wanted.c.household_id)
+                & (MonthlyBudget.year == wanted.c.year)
+                & (MonthlyBudget.month == wanted.c.month),
+            )
+        )
+        return {(row.household_id, row.year, row.month): row.id for row in result}
+
+    async def get_by_id(self, monthly_budget_id: int) -> Optional[MonthlyBudget]:
+        """Get a single monthly budget by ID."""
+        result = await self.db.execute(select(MonthlyBudget).where(MonthlyBudget.id == monthly_budget_id))
+        return result.scalars().first()
+
+    async def update(
         self,
         monthly_budget_id: int,
         planned_budget: Optional[float] = None,
         currency: Optional[str] = None,
     ) -> MonthlyBudget:
-        monthly_budget = self.db.query(MonthlyBudget).filter(MonthlyBudget.id == monthly_budget_id).first()
+        result = await self.db.execute(select(MonthlyBudget).where(MonthlyBudget.id == monthly_budget_id))
+        monthly_budget = result.scalars().first()
         if not monthly_budget:
             raise ValueError("Monthly budget not found")
         if planned_budget:
@@ -61,9 +175,103 @@ class MonthlyBudgetService:
         if currency:
             monthly_budget.currency = currency
         monthly_budget.updated_at = datetime.now()
-        self.db.commit()
+        await self.db.commit()
         return monthly_budget
 
+    async def get_summary(self, monthly_budget_id: int, today: Optional[date] = None) -> Optional[dict]:
+        """
+        Summarize a monthly budget: planned versus actual spending, totals and counts per category, income,
+        remaining budget and daily burn rate. Expenses and income are aggregated together in one GROUP BY
+        query, so the cost does not grow with the number of line items returned.
+        """
+        lines = union_all(
+            select(literal("expense").label("kind"), Expense.category_id, Expense.amount).where(
+                Expense.monthly_budget_id == monthly_budget_id
+            ),
+            select(literal("income"), null(), Income.amount).where(Income.monthly_budget_id == monthly_budget_id),
+        ).subquery()
+        # The budget is outer joined so it comes back even without any lines, as a single row with no kind
+        result = await self.db.execute(
+            select(
+                MonthlyBudget.year,
+                MonthlyBudget.month,
+                MonthlyBudget.planned_budget,
+                MonthlyBudget.currency,
+                lines.c.kind,
+                lines.c.category_id,
+                ExpenseCategory.name.label("category_name"),
+                ExpenseCategory.color,
+                ExpenseCategory.color_code,
+                func.count(lines.c.amount).label("count"),
+                func.coalesce(func.sum(lines.c.amount), 0.0).label("total"),
+            )
+            .select_from(MonthlyBudget)
+            .outerjoin(lines, true())
+            .outerjoin(ExpenseCategory, ExpenseCategory.id == lines.c.category_id)
+            .where(MonthlyBudget.id == monthly_budget_id)
+            .group_by(MonthlyBudget.id, lines.c.kind, lines.c.category_id, ExpenseCategory.id)
+        )
+        rows = result.all()
+        if not rows:
+            return None
+
+        budget = rows[0]
+        categories = sorted(
+            (
+                {
+                    "category_id": row.category_id,
+                    "name": row.category_name,
+                    "color": row.color.value,
+                    "color_code": row.color_code,
+                    "total": row.total,
+                    "count": row.count,
+                }
+                for row in rows
+                if row.kind == "expense"
+            ),
+            key=lambda category: category["total"],
+            reverse=True,
+        )
+        income = next((row for row in rows if row.kind == "income"), None)
+        total_expenses = sum(category["total"] for category in categories)
+
+        # Burn rate over the days of the month that have passed: all of them for past months, none for future
+        today = today or date.today()
+        days_in_month = monthrange(budget.year, budget.month)[1]
+        if (today.year, today.month) == (budget.year, budget.month):
+            days_elapsed = today.day
+        else:
+            days_elapsed = days_in_month if (today.year, today.month) > (budget.year, budget.month) else 0
+        daily_burn_rate = total_expenses / days_elapsed if days_elapsed else 0.0
+
+        return {
+            "id": monthly_budget_id,
+            "year": budget.year,
+            "month": budget.month,
+            "currency": budget.currency,
+            "planned_budget": budget.planned_budget,
+            "total_expenses": total_expenses,
+            "expense_count": sum(category["count"] for category in categories),
+            "total_income": income.total if income else 0.0,
+            "income_count": income.count if income else 0,
+            "remaining_budget": budget.planned_budget - total_expenses,
+            "days_in_month": days_in_month,
+            "days_elapsed": days_elapsed,
+            "daily_burn_rate": daily_burn_rate,
+            "projected_expenses": daily_burn_rate * days_in_month,
+            "categories": categories,
+        }
+
+
+def _seed_columns(household_id):
+    """Currency and planned budget of a new budget: those of the household's latest budget, if it has any."""
+    latest = select(MonthlyBudget).where(MonthlyBudget.household_id == household_id)
+    latest = latest.order_by(MonthlyBudget.created_at.desc()).limit(1)
+    return (
+        func.coalesce(latest.with_only_columns(MonthlyBudget.currency).scalar_subquery(), "ISK"),
+        func.coalesce(latest.with_only_columns(MonthlyBudget.planned_budget).scalar_subquery(), 0.0),
+    )
+
 
-def get_monthly_budget_service(db: Session = Depends(get_db)) -> MonthlyBudgetService:
+def get_monthly_budget_service(db: AsyncSession = Depends(get_async_db)) -> MonthlyBudgetService:
     return MonthlyBudgetService(db)
@@ -0,0 +1,285 @@
+from datetime import date, datetime, timedelta
+from itertools import repeat
+from typing import Optional, Union
+
+import numpy as np
+from fastapi import Depends
+from sqlalchemy import Date, Integer, ScalarSelect, cast, column, delete, func, literal, select, union_all, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.engine import get_async_db
+from models.expense import Expense
+from models.household import Household
+from models.household_daily_rollup import HouseholdDailyRollup
+from models.income import Income
+from models.investment_transaction import InvestmentTransaction
+from models.loan import Loan
+from models.loan_payment import LoanPayment
+from models.monthly_budget import MonthlyBudget
+from schemas.net_worth import NetWorthInterval
+from services.bulk_import import copy_rows
+from services.valuation_history import load_holdings_history
+
+# Column order of the rows refresh streams with COPY
+ROLLUP_COPY_COLUMNS = (
+    "household_id",
+    "date",
+    "investment_value",
+    "loan_balance",
+    "income",
+    "expenses",
+    "savings",
+    "net_worth",
+    "created_at",
+    "updated_at",
+)
+ROLLUP_COPY_TYPES = (
+    "int4",
+    "date",
+    "float8",
+    "float8",
+    "float8",
+    "float8",
+    "float8",
+    "float8",
+    "timestamp",
+    "timestamp",
+)
+
+
+async def mark_rollup_stale(
+    db: AsyncSession,
+    household_id: Union[int, ScalarSelect],
+    changed_on: Union[date, datetime],
+) -> None:
+    """
+    Record that a household's daily rollups from a date onward are out of date. Call it in the same
+    transaction as the change; the rollups are rebuilt from the earliest stale date on the next read.
+    """
+    if isinstance(changed_on, datetime):
+        changed_on = changed_on.date()
+    # least() ignores NULL, so this also works when nothing was stale yet
+    await db.execute(
+        update(Household)
+        .where(Household.id == household_id)
+        .values(rollup_stale_from=func.least(Household.rollup_stale_from, changed_on))
+    )
+
+
+async def mark_rollups_stale(db: AsyncSession, changed_on: dict[int, date]) -> None:
+    """mark_rollup_stale for many households at once, given the earliest changed date per household ID."""
+    if not changed_on:
+        return
+    # One UPDATE joined to the changes passed in as arrays
+    changes = (
+        func.unnest(literal(list(changed_on), ARRAY(Integer)), literal(list(changed_on.values()), ARRAY(Date)))
+        .table_valued(column("household_id", Integer), column("changed_on", Date))
+        .render_derived("changes")
+    )
+    await db.execute(
+        update(Household)
+        .where(Household.id == changes.c.household_id)
+        .values(rollup_stale_from=func.least(Household.rollup_stale_from, changes.c.changed_on))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def budget_household_id(monthly_budget_id: int) -> ScalarSelect:
+    """The household owning a monthly budget, as a subquery for mark_rollup_stale."""
+    return select(MonthlyBudget.household_id).where(MonthlyBudget.id == monthly_budget_id).scalar_subquery()
+
+
+class NetWorthService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_series(
+        self,
+        household_id: int,
+        date_from: date,
+        date_to: date,
+        interval: NetWorthInterval,
+    ) -> list[dict]:
+        """
+        Get net worth between two dates, one point per day, week or month. Each point holds the balances
+        on the last day of its period and the income and expenses booked during it.
+        """
+        await self.refresh(household_id)
+
+        period = func.date_trunc(interval.value, HouseholdDailyRollup.date)
+        by_period = {"partition_by": period}
+        points = (
+            select(
+                HouseholdDailyRollup.date,
+                HouseholdDailyRollup.investment_value,
+                HouseholdDailyRollup.loan_balance,
+                HouseholdDailyRollup.savings,
+                HouseholdDailyRollup.net_worth,
+                func.sum(HouseholdDailyRollup.income).over(**by_period).label("income"),
+                func.sum(HouseholdDailyRollup.expenses).over(**by_period).label("expenses"),
+                func.row_number()
+                .over(**by_period, order_by=HouseholdDailyRollup.date.desc())
+                .label("position_from_end"),
+            )
+            .where(
+                HouseholdDailyRollup.household_id == household_id,
+                HouseholdDailyRollup.date >= date_from,
+                HouseholdDailyRollup.date <= date_to,
+            )
+            .subquery()
+        )
+        result = await self.db.execute(select(points).where(points.c.position_from_end == 1).order_by(points.c.date))
+        return [
+            {
+                "date": row.date,
+                "investment_value": row.investment_value,
+                "loan_balance": row.loan_balance,
+                "savings": row.savings,
+                "income": row.income,
+                "expenses": row.expenses,
+                "net_worth": row.net_worth,
+            }
+            for row in result
+        ]
+
+    async def refresh(self, household_id: int) -> int:
+        """
+        Bring a household's rollups up to today, rebuilding only from the earliest stale day (or the day after
+        the last rollup). When they are already current this only reads; otherwise the household row is locked
+        for the rebuild so concurrent changes wait for it. Returns the number of days written.
+        """
+        today = date.today()
+        stale_from, last_rollup = await self._rollup_state(household_id)
+        # Changes dated after today are covered once their day comes, as the day after the last rollup
+        if last_rollup is not None and last_rollup >= today and (stale_from is None or stale_from > today):
+            return 0
+
+        # Read again under the lock: another request may have rebuilt while this one waited for it
+        stale_from, last_rollup = await self._rollup_state(household_id, lock=True)
+        if last_rollup is None:
+            start = await self._first_activity(household_id)
+        else:
+            start = min(stale_from or today, last_rollup + timedelta(days=1))
+
+        written = 0
+        if start is not None and start <= today:
+            written = await self._rebuild(household_id, start, today)
+        await self.db.execute(update(Household).where(Household.id == household_id).values(rollup_stale_from=None))
+        await self.db.commit()
+        return written
+
+    async def _rollup_state(self, household_id: int, lock: bool = False) -> tuple[Optional[date], Optional[date]]:
+        """The household's earliest stale day and the date of its last rollup, optionally locking the household."""
+        last_rollup = (
+            select(func.max(HouseholdDailyRollup.date))
+            .where(HouseholdDailyRollup.household_id == household_id)
+            .scalar_subquery()
+        )
+        query = select(Household.rollup_stale_from, last_rollup).where(Household.id == household_id)
+        if lock:
+            query = query.with_for_update(of=Household)
+        result = await self.db.execute(query)
+        return tuple(result.one())
+
+    async def _first_activity(self, household_id: int) -> Optional[date]:
+        """The earliest date any investment, loan, income or expense of the household refers to."""
+        budget_ids = select(MonthlyBudget.id).where(MonthlyBudget.household_id == household_id)
+        first_dates = union_all(
+            select(func.min(InvestmentTransaction.date)).where(InvestmentTransaction.household_id == household_id),
+            select(func.min(Loan.start_date)).where(Loan.household_id == household_id),
+            select(func.min(cast(Expense.date, Date))).where(Expense.monthly_budget_id.in_(budget_ids)),
+            select(func.min(cast(Income.created_at, Date))).where(Income.monthly_budget_id.in_(budget_ids)),
+        ).subquery()
+        result = await self.db.execute(select(func.min(first_dates.c[0])))
+        return result.scalar()
+
+    async def _rebuild(self, household_id: int, start: date, end: date) -> int:
+        """
+        Recompute the rollups from start to end. Everything that happened before start is folded into an
+        opening day (start - 1), so running totals only need sums over the rebuilt range.
+        """
+        opening = start - timedelta(days=1)
+        days = np.arange(np.datetime64(opening, "D"), np.datetime64(end, "D") + 1)
+
+        investment_value = (await load_holdings_history(self.db, household_id, opening, end)).totals
+
+        loan_day = _day_of(Loan.start_date, opening)
+        payment_day = _day_of(LoanPayment.date, opening)
+        loan_deltas = await self.db.execute(
+            union_all(
+                select(loan_day, func.sum(Loan.principal))
+                .where(Loan.household_id == household_id, Loan.start_date <= end)
+                .group_by(loan_day),
+                select(payment_day, -func.sum(LoanPayment.principal_amount))
+                .join(Loan, LoanPayment.loan_id == Loan.id)
+                .where(Loan.household_id == household_id, LoanPayment.date <= end)
+                .group_by(payment_day),
+            )
+        )
+        loan_balance = np.maximum(np.cumsum(_daily_totals(loan_deltas.all(), days)), 0.0)
+
+        budget_ids = select(MonthlyBudget.id).where(MonthlyBudget.household_id == household_id)
+        income_date = cast(Income.created_at, Date)
+        income_day = _day_of(income_date, opening)
+        income_rows = await self.db.execute(
+            select(income_day, func.sum(Income.amount))
+            .where(Income.monthly_budget_id.in_(budget_ids), income_date <= end)
+            .group_by(income_day)
+        )
+        income = _daily_totals(income_rows.all(), days)
+        expense_date = cast(Expense.date, Date)
+        expense_day = _day_of(expense_date, opening)
+        expense_rows = await self.db.execute(
+            select(expense_day, func.sum(Expense.amount))
+            .where(Expense.monthly_budget_id.in_(budget_ids), expense_date <= end)
+            .group_by(expense_day)
+        )
+        expenses = _daily_totals(expense_rows.all(), days)
+
+        savings = np.cumsum(income - expenses)
+        net_worth = investment_value + savings - loan_balance
+
+        await self.db.execute(
+            delete(HouseholdDailyRollup).where(
+                HouseholdDailyRollup.household_id == household_id, HouseholdDailyRollup.date >= start
+            )
+        )
+        now = datetime.now()
+        # Skip the opening day, which only carries the history before start
+        rows = zip(
+            repeat(household_id),
+            days[1:].tolist(),
+            investment_value[1:].round(2).tolist(),
+            loan_balance[1:].round(2).tolist(),
+            income[1:].round(2).tolist(),
+            expenses[1:].round(2).tolist(),
+            savings[1:].round(2).tolist(),
+            net_worth[1:].round(2).tolist(),
+            repeat(now),
+            repeat(now),
+        )
+        await copy_rows(self.db, HouseholdDailyRollup.__tablename__, ROLLUP_COPY_COLUMNS, rows, types=ROLLUP_COPY_TYPES)
+        return len(days) - 1
+
+
+def _day_of(column, opening: date):
+    """A date column with every day before the rebuilt range collapsed onto the opening day."""
+    return func.greatest(column, opening)
+
+
+def _offsets(day_values, days: np.ndarray) -> np.ndarray:
+    return (np.array(day_values, dtype="datetime64[D]") - days[0]).astype(int)
+
+
+def _daily_totals(rows, days: np.ndarray) -> np.ndarray:
+    """Sum (day, amount) rows into one total per day of the range."""
+    totals = np.zeros(len(days))
+    if rows:
+        day_values, amounts = zip(*rows, strict=True)
+        np.add.at(totals, _offsets(day_values, days), amounts)
+    return totals
+
+
+def get_net_worth_service(db: AsyncSession = Depends(get_async_db)) -> NetWorthService:
+    return NetWorthService(db)
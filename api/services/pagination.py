@@ -0,0 +1,53 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def encode_cursor(sort_value: date | datetime, row_id: int) -> str:
+    """Encode the position after a row as an opaque cursor."""
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_type: type[date] | type[datetime]) -> tuple[date | datetime, int]:
+    """Decode a cursor made by encode_cursor. Raises ValueError if it is malformed."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(payload)
+        return sort_type.fromisoformat(sort_value), int(row_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def apply_keyset(
+    query: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    limit: Optional[int],
+    cursor: Optional[str],
+) -> Select:
+    """
+    Order a query newest first by (sort_column, id) and continue after the cursor.
+    Fetches one row beyond the limit so split_page can tell whether another page exists.
+    """
+    if cursor is not None:
+        sort_value, row_id = decode_cursor(cursor, sort_column.type.python_type)
+        query = query.where(tuple_(sort_column, id_column) < tuple_(sort_value, row_id))
+    query = query.order_by(sort_column.desc(), id_column.desc())
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def split_page(rows: list, limit: Optional[int], sort_attr: str) -> tuple[list, Optional[str]]:
+    """Trim the look-ahead row from a keyset query and build the cursor for the next page."""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_attr), last.id)
@@ -0,0 +1,64 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.exceptions import HTTPException
+from passlib.context import CryptContext
+from starlette.status import HTTP_429_TOO_MANY_REQUESTS
+
+from core.config import settings
+from core.metrics import Histogram
+
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__rounds=settings.argon2_time_cost,
+    argon2__memory_cost=settings.argon2_memory_cost,
+    argon2__parallelism=settings.argon2_parallelism,
+)
+
+
+class PasswordHasher:
+    """Runs argon2 hashing on a bounded thread pool so it never blocks the event loop."""
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_pending = max_pending
+        self.duration = Histogram()
+        self.rejected = 0
+        self._pending = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, plain_password: str) -> str:
+        return await self._run(pwd_context.hash, plain_password)
+
+    async def verify_and_update(self, plain_password: str, password_hash: str) -> tuple[bool, str | None]:
+        """Verify a password, returning a new hash if the stored one uses outdated parameters."""
+        return await self._run(pwd_context.verify_and_update, plain_password, password_hash)
+
+    async def _run(self, func, *args):
+        # Only touched from the event loop thread, so a plain counter is enough
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many concurrent sign-in attempts, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        self._pending += 1
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+            self.duration.observe((time.perf_counter() - start) * 1000)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
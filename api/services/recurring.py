@@ -0,0 +1,253 @@
+from calendar import monthrange
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy import Integer, any_, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.engine import get_async_db
+from models.expense import Expense
+from models.income import Income
+from models.recurring_template import RecurrenceFrequency, RecurringKind, RecurringTemplate
+from services.budget_analytics import add_category_spend
+from services.bulk_import import copy_rows
+from services.expense import COPY_COLUMNS as EXPENSE_COPY_COLUMNS
+from services.monthly_budget import MonthlyBudgetService
+from services.net_worth import mark_rollups_stale
+
+# Column order of the income rows materialize streams with COPY
+INCOME_COPY_COLUMNS = ("monthly_budget_id", "amount", "source", "created_at", "updated_at")
+# Postgres types of those columns and the expense ones, for binary COPY
+EXPENSE_COPY_TYPES = ("int4", "float8", "text", "int4", "timestamp", "timestamp", "timestamp")
+INCOME_COPY_TYPES = ("int4", "float8", "text", "timestamp", "timestamp")
+
+
+def month_end(day: date) -> date:
+    return day.replace(day=monthrange(day.year, day.month)[1])
+
+
+def occurrences(
+    frequency: RecurrenceFrequency,
+    interval: int,
+    start: date,
+    after: date,
+    through: date,
+) -> list[date]:
+    """
+    Dates of a recurrence that fall after one date and on or before another. Monthly and yearly occurrences keep
+    the day of start, moved to the last day of shorter months (a template starting Jan 31 falls on Feb 28).
+    """
+    if frequency == RecurrenceFrequency.WEEKLY:
+        step = timedelta(weeks=interval)
+        index = max(0, (after - start).days // step.days + 1)
+        dates = []
+        while (day := start + index * step) <= through:
+            dates.append(day)
+            index += 1
+        return dates
+
+    months = interval * 12 if frequency == RecurrenceFrequency.YEARLY else interval
+    # The occurrence in or just before the month of `after`; earlier ones are all on or before it
+    index = max(0, ((after.year - start.year) * 12 + after.month - start.month) // months)
+    dates = []
+    while True:
+        year, month = divmod(start.year * 12 + start.month - 1 + index * months, 12)
+        day = date(year, month + 1, min(start.day, monthrange(year, month + 1)[1]))
+        if day > through:
+            return dates
+        if day > after:
+            dates.append(day)
+        index += 1
+
+
+class RecurringService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ==================== Template Methods ====================
+
+    async def get_by_household(self, household_id: int) -> list[RecurringTemplate]:
+        """Get all recurring templates of a household."""
+        result = await self.db.execute(
+            select(RecurringTemplate)
+            .where(RecurringTemplate.household_id == household_id)
+            .order_by(RecurringTemplate.start_date, RecurringTemplate.id)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_id(self, template_id: int) -> Optional[RecurringTemplate]:
+        """Get a single recurring template by ID."""
+        result = await self.db.execute(select(RecurringTemplate).where(RecurringTemplate.id == template_id))
+        return result.scalars().first()
+
+    async def create(
+        self,
+        household_id: int,
+        kind: RecurringKind,
+        amount: float,
+        description: str,
+        category_id: Optional[int],
+        frequency: RecurrenceFrequency,
+        interval: int,
+        start_date: date,
+        end_date: Optional[date] = None,
+    ) -> RecurringTemplate:
+        """Create a recurring template and write its occurrences up to the end of the current month."""
+        template = RecurringTemplate(
+            household_id=household_id,
+            kind=kind,
+            amount=amount,
+            description=description,
+            category_id=category_id if kind == RecurringKind.EXPENSE else None,
+            frequency=frequency,
+            interval=interval,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        self._validate(template)
+        self.db.add(template)
+        await self.db.commit()
+        await self.materialize(household_ids=[household_id])
+        await self.db.refresh(template)
+        return template
+
+    async def update(
+        self,
+        template_id: int,
+        amount: Optional[float] = None,
+        description: Optional[str] = None,
+        category_id: Optional[int] = None,
+        frequency: Optional[RecurrenceFrequency] = None,
+        interval: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Optional[RecurringTemplate]:
+        """Update a recurring template. Only occurrences that have not been written yet follow the change."""
+        template = await self.get_by_id(template_id)
+        if not template:
+            return None
+
+        if amount is not None:
+            template.amount = amount
+        if description is not None:
+            template.description = description
+        if category_id is not None and template.kind == RecurringKind.EXPENSE:
+            template.category_id = category_id
+        if frequency is not None:
+            template.frequency = frequency
+        if interval is not None:
+            template.interval = interval
+        if start_date is not None:
+            template.start_date = start_date
+        if end_date is not None:
+            template.end_date = end_date
+        self._validate(template)
+
+        template.updated_at = datetime.now()
+        await self.db.commit()
+        await self.db.refresh(template)
+        return template
+
+    async def delete(self, template_id: int) -> bool:
+        """Delete a recurring template. Expenses and income it already wrote are kept."""
+        template = await self.get_by_id(template_id)
+        if not template:
+            return False
+
+        await self.db.delete(template)
+        await self.db.commit()
+        return True
+
+    @staticmethod
+    def _validate(template: RecurringTemplate) -> None:
+        if template.kind == RecurringKind.EXPENSE and template.category_id is None:
+            raise ValueError("Recurring expenses need a category")
+        if template.end_date is not None and template.end_date < template.start_date:
+            raise ValueError("end_date must not be before start_date")
+
+    # ==================== Materialization Methods ====================
+
+    async def materialize(
+        self,
+        through: Optional[date] = None,
+        household_ids: Optional[list[int]] = None,
+    ) -> tuple[int, int]:
+        """
+        Write every occurrence of recurring templates up to a date (default the end of the current month) as
+        expenses and income in the budgets of their months, for all households or the given ones. Runs in one
+        pass: templates are locked and advanced past the date in the same transaction as the rows they write, so
+        running it again or concurrently never writes an occurrence twice. Returns the expenses and income written.
+        """
+        through = through or month_end(date.today())
+        query = (
+            select(RecurringTemplate)
+            .where(
+                RecurringTemplate.start_date <= through,
+                or_(
+                    RecurringTemplate.materialized_through.is_(None),
+                    RecurringTemplate.materialized_through < through,
+                ),
+                or_(
+                    RecurringTemplate.end_date.is_(None),
+                    RecurringTemplate.materialized_through.is_(None),
+                    RecurringTemplate.end_date > RecurringTemplate.materialized_through,
+                ),
+            )
+            .order_by(RecurringTemplate.id)
+            # Templates another run is already writing are left to it
+            .with_for_update(skip_locked=True)
+        )
+        if household_ids is not None:
+            query = query.where(RecurringTemplate.household_id.in_(household_ids))
+        templates = (await self.db.execute(query)).scalars().all()
+
+        due: list[tuple[RecurringTemplate, list[date]]] = []
+        for template in templates:
+            after = template.materialized_through or template.start_date - timedelta(days=1)
+            last = min(through, template.end_date) if template.end_date else through
+            dates = occurrences(template.frequency, template.interval, template.start_date, after, last)
+            if dates:
+                due.append((template, dates))
+
+        budget_ids = await MonthlyBudgetService(self.db).ensure_budgets(
+            {(template.household_id, day.year, day.month) for template, dates in due for day in dates}
+        )
+        now = datetime.now()
+        expense_rows, income_rows = [], []
+        changed_on: dict[int, date] = {}
+        for template, dates in due:
+            for day in dates:
+                budget_id = budget_ids[template.household_id, day.year, day.month]
+                booked_at = datetime.combine(day, time())
+                if template.kind == RecurringKind.EXPENSE:
+                    row = (budget_id, template.amount, template.description, template.category_id, booked_at, now, now)
+                    expense_rows.append(row)
+                else:
+                    # Income is dated by created_at
+                    income_rows.append((budget_id, template.amount, template.description, booked_at, now))
+            household_id = template.household_id
+            changed_on[household_id] = min(changed_on.get(household_id, dates[0]), dates[0])
+
+        if expense_rows:
+            await copy_rows(
+                self.db, Expense.__tablename__, EXPENSE_COPY_COLUMNS, expense_rows, types=EXPENSE_COPY_TYPES
+            )
+            await add_category_spend(self.db, ((row[0], row[3], row[1], 1) for row in expense_rows))
+        if income_rows:
+            await copy_rows(self.db, Income.__tablename__, INCOME_COPY_COLUMNS, income_rows, types=INCOME_COPY_TYPES)
+        await mark_rollups_stale(self.db, changed_on)
+        if templates:
+            await self.db.execute(
+                update(RecurringTemplate)
+                .where(RecurringTemplate.id == any_(literal([template.id for template in templates], ARRAY(Integer))))
+                .values(materialized_through=through)
+                .execution_options(synchronize_session=False)
+            )
+        await self.db.commit()
+        return len(expense_rows), len(income_rows)
+
+
+def get_recurring_service(db: AsyncSession = Depends(get_async_db)) -> RecurringService:
+    return RecurringService(db)
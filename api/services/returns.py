@@ -0,0 +1,90 @@
+"""
+Money-weighted (XIRR) and time-weighted returns, vectorized over many series at once.
+
+Cash flows are signed from the investor's side: buying costs money (negative), selling and
+dividends bring it back (positive). XIRR solves every series with Newton's method in lockstep;
+series that do not converge fall back to bisection over a fixed rate bracket.
+"""
+
+import numpy as np
+
+# Annual rates searched by the bisection fallback
+RATE_FLOOR = -0.9999
+RATE_CEILING = 1000.0
+
+
+def _npv(groups: np.ndarray, years: np.ndarray, amounts: np.ndarray, rates: np.ndarray, count: int):
+    """Net present value of each series and its derivative, at one rate per series."""
+    growth = 1 + rates[groups]
+    discounted = amounts * growth**-years
+    npv = np.bincount(groups, discounted, minlength=count)
+    slope = np.bincount(groups, -years * discounted / growth, minlength=count)
+    return npv, slope
+
+
+def xirr(
+    groups: np.ndarray,
+    years: np.ndarray,
+    amounts: np.ndarray,
+    count: int,
+    tolerance: float = 1e-9,
+    max_iterations: int = 50,
+) -> np.ndarray:
+    """
+    Annual internal rate of return of count cash flow series at once. Flow i belongs to series groups[i]
+    and happens years[i] after a common origin. Series without both an outflow and an inflow get NaN.
+    """
+    has_outflow = np.bincount(groups, amounts < 0, minlength=count) > 0
+    has_inflow = np.bincount(groups, amounts > 0, minlength=count) > 0
+    solvable = has_outflow & has_inflow
+
+    rates = np.full(count, 0.1)
+    converged = ~solvable
+    with np.errstate(all="ignore"):
+        for _ in range(max_iterations):
+            npv, slope = _npv(groups, years, amounts, rates, count)
+            step = np.where(converged, 0.0, npv / slope)
+            rates = np.maximum(rates - np.nan_to_num(step), RATE_FLOOR)
+            converged |= np.abs(step) < tolerance
+            if converged.all():
+                break
+
+        # Bisection for what Newton left unsolved, where the bracket holds a sign change
+        pending = ~converged
+        if pending.any():
+            low = np.full(count, RATE_FLOOR)
+            high = np.full(count, RATE_CEILING)
+            low_npv, _ = _npv(groups, years, amounts, low, count)
+            high_npv, _ = _npv(groups, years, amounts, high, count)
+            bracketed = pending & (np.sign(low_npv) != np.sign(high_npv))
+            for _ in range(100):
+                middle = (low + high) / 2
+                middle_npv, _ = _npv(groups, years, amounts, middle, count)
+                same_side = np.sign(middle_npv) == np.sign(low_npv)
+                low = np.where(same_side, middle, low)
+                low_npv = np.where(same_side, middle_npv, low_npv)
+                high = np.where(same_side, high, middle)
+            rates = np.where(bracketed, (low + high) / 2, rates)
+            converged |= bracketed
+
+    return np.where(solvable & converged & np.isfinite(rates), rates, np.nan)
+
+
+def twr(values: np.ndarray, contributions: np.ndarray, withdrawals: np.ndarray) -> np.ndarray:
+    """
+    Cumulative time-weighted return of series of daily values (one row per series). Money put in counts
+    from the start of its day and money taken out (sales, dividends) at the end of it, so a day's return
+    is (value + withdrawals) / (previous value + contributions). Days that start from nothing or have no
+    known value are skipped.
+    """
+    previous = np.concatenate((np.zeros((len(values), 1)), values[:, :-1]), axis=1)
+    start = previous + contributions
+    with np.errstate(all="ignore"):
+        growth = np.where((start > 0) & np.isfinite(start) & np.isfinite(values), (values + withdrawals) / start, 1.0)
+    return np.prod(growth, axis=1) - 1
+
+
+def annualize(total_return: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """Annual rate of a cumulative return earned over a number of years. NaN for spans under a day."""
+    with np.errstate(all="ignore"):
+        return np.where(years >= 1 / 365, (1 + total_return) ** (1 / years) - 1, np.nan)
@@ -0,0 +1,119 @@
+import re
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy import func, literal, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.engine import get_async_db
+from models.expense import Expense
+from models.income import Income
+from models.monthly_budget import MonthlyBudget
+
+# Text search configuration of the search_vector columns. "simple" lowercases words without stemming them for a
+# particular language, so it works the same for any language descriptions are written in.
+SEARCH_CONFIG = "simple"
+HIGHLIGHT_OPTIONS = "StartSel=<mark>, StopSel=</mark>, HighlightAll=true"
+# Escaped before highlighting, so the <mark> tags are the only markup in a highlight. & goes first.
+HTML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;"))
+
+
+def prefix_query(search_text: str) -> Optional[str]:
+    """A to_tsquery expression that matches every word of a search as a word prefix, or None if it has no words."""
+    words = re.findall(r"\w+", search_text.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def escape_html(text):
+    """A text column with HTML special characters replaced by entities, like html.escape."""
+    for character, entity in HTML_ESCAPES:
+        text = func.replace(text, character, entity)
+    return text
+
+
+class SearchService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(
+        self,
+        household_id: int,
+        search_text: str,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[list[dict], Optional[int]]:
+        """
+        Search the expense descriptions and income sources of a household across all months. A row matches when
+        each word of the search starts one of its words (full text, on the tsvector index) or when the search is
+        close to part of it (fuzzy, on the pg_trgm index), and rows are ranked by both. Highlights are the
+        HTML-escaped text with matched words wrapped in <mark>. Returns a page of results and the offset of the
+        next page, if there is one.
+        """
+        words = prefix_query(search_text)
+        if words is None:
+            return [], None
+        tsquery = func.to_tsquery(SEARCH_CONFIG, words)
+
+        def matches(kind: str, model, text_column, date_column, category_column):
+            score = func.ts_rank(model.search_vector, tsquery) + func.word_similarity(search_text, text_column)
+            return (
+                select(
+                    literal(kind).label("kind"),
+                    model.id,
+                    MonthlyBudget.year,
+                    MonthlyBudget.month,
+                    date_column.label("date"),
+                    model.amount,
+                    text_column.label("text"),
+                    category_column.label("category_id"),
+                    score.label("score"),
+                )
+                .join(MonthlyBudget, model.monthly_budget_id == MonthlyBudget.id)
+                .where(
+                    MonthlyBudget.household_id == household_id,
+                    model.search_vector.op("@@")(tsquery) | literal(search_text).op("<%")(text_column),
+                )
+            )
+
+        # Income has no date of its own, so it is dated by created_at
+        results = union_all(
+            matches("expense", Expense, Expense.description, Expense.date, Expense.category_id),
+            matches("income", Income, Income.source, Income.created_at, null()),
+        ).subquery("results")
+        page = (
+            select(results)
+            .order_by(results.c.score.desc(), results.c.date.desc(), results.c.kind, results.c.id.desc())
+            .offset(offset)
+            .limit(limit + 1)
+            .subquery("page")
+        )
+        # Highlighting is the costly part, so it only runs for the rows of the page
+        highlight = func.ts_headline(SEARCH_CONFIG, escape_html(page.c.text), tsquery, HIGHLIGHT_OPTIONS)
+        rows = (
+            await self.db.execute(
+                select(page, highlight.label("highlight")).order_by(
+                    page.c.score.desc(), page.c.date.desc(), page.c.kind, page.c.id.desc()
+                )
+            )
+        ).all()
+
+        next_offset = offset + limit if len(rows) > limit else None
+        return [
+            {
+                "kind": row.kind,
+                "id": row.id,
+                "year": row.year,
+                "month": row.month,
+                "date": row.date,
+                "amount": row.amount,
+                "text": row.text,
+                "highlight": row.highlight,
+                "category_id": row.category_id,
+                "score": row.score,
+            }
+            for row in rows[:limit]
+        ], next_offset
+
+
+def get_search_service(db: AsyncSession = Depends(get_async_db)) -> SearchService:
+    return SearchService(db)
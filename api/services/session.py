@@ -1,20 +1,37 @@
+import asyncio
+import hashlib
+import logging
 import secrets
+import time
 from datetime import datetime, timedelta
 
 from fastapi import Depends
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from core.cache import TTLCache
 from core.config import settings
-from db.engine import get_db
+from db.engine import AsyncSessionLocal, get_async_db
 from models.session import Session as SessionModel
 from models.user import User
 
+# Validated sessions (with their user and households loaded) keyed by token hash.
+# Shared by the auth dependencies and the session refresh middleware.
+session_cache = TTLCache(max_size=settings.session_cache_max_size, ttl=settings.session_cache_ttl)
+
+logger = logging.getLogger(__name__)
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
 
 class SessionService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_session(
+    async def create_session(
         self,
         user_id: int,
         user_agent: str = "",
@@ -30,40 +47,107 @@ class SessionService:
             expires_at=expires_at,
         )
         self.db.add(session)
-        self.db.commit()
+        await self.db.commit()
         return token
 
     def create_token(self) -> str:
         return secrets.token_urlsafe(32)
 
-    def get_valid_session(self, token: str) -> SessionModel | None:
+    async def get_valid_session(self, token: str) -> SessionModel | None:
         """Get a session by token if it exists and is not expired."""
-        session = (
-            self.db.query(SessionModel)
-            .options(joinedload(SessionModel.user).joinedload(User.households))
-            .filter(SessionModel.token == token)
-            .first()
-        )
-        if not session or session.expires_at < datetime.now():
+        cache_key = hash_token(token)
+        session = session_cache.get(cache_key)
+        if session is None:
+            result = await self.db.execute(
+                select(SessionModel)
+                .options(joinedload(SessionModel.user).joinedload(User.households))
+                .where(SessionModel.token == token)
+            )
+            session = result.unique().scalars().first()
+            if session:
+                session_cache.set(cache_key, session)
+
+        if not session:
+            return None
+        if session.expires_at < datetime.now():
+            session_cache.invalidate(cache_key)
             return None
         return session
 
-    def refresh_session(self, session: SessionModel) -> None:
-        """Extend the session expiration time."""
-        session.expires_at = datetime.now() + timedelta(seconds=settings.session_token_expiration_time)
-        self.db.commit()
+    async def refresh_sessions(self, tokens: list[str]) -> None:
+        """Extend the expiration time of the given sessions."""
+        # Sessions may come from the cache, so update by token rather than relying on the unit of work
+        expires_at = datetime.now() + timedelta(seconds=settings.session_token_expiration_time)
+        await self.db.execute(update(SessionModel).where(SessionModel.token.in_(tokens)).values(expires_at=expires_at))
+        await self.db.commit()
+        for token in tokens:
+            session_cache.invalidate(hash_token(token))
 
-    def should_refresh_session(self, session: SessionModel) -> bool:
+    @staticmethod
+    def should_refresh_session(session: SessionModel) -> bool:
         """Check if session is within the refresh threshold of expiring."""
         threshold = datetime.now() + timedelta(seconds=settings.session_refresh_threshold)
         return session.expires_at < threshold
 
-    def delete_session(self, token: str) -> None:
-        session = self.db.query(SessionModel).filter(SessionModel.token == token).first()
+    async def delete_session(self, token: str) -> None:
+        session_cache.invalidate(hash_token(token))
+        result = await self.db.execute(select(SessionModel).where(SessionModel.token == token))
+        session = result.scalars().first()
         if session:
-            self.db.delete(session)
-            self.db.commit()
+            await self.db.delete(session)
+            await self.db.commit()
 
 
-def get_session_service(db: Session = Depends(get_db)) -> SessionService:
+def get_session_service(db: AsyncSession = Depends(get_async_db)) -> SessionService:
     return SessionService(db)
+
+
+class SessionRefreshQueue:
+    """Coalesces session refreshes and writes them from a background task."""
+
+    def __init__(self, interval: int):
+        self.interval = interval
+        self._queued_at: dict[str, float] = {}
+        self._queue: asyncio.Queue[str] | None = None
+        self._worker: asyncio.Task | None = None
+
+    def schedule(self, session: SessionModel) -> bool:
+        """Queue a refresh unless one was queued for this token within the interval."""
+        now = time.monotonic()
+        key = hash_token(session.token)
+        queued_at = self._queued_at.get(key)
+        if queued_at is not None and now - queued_at < self.interval:
+            return False
+
+        self._prune(now)
+        self._queued_at[key] = now
+        self._ensure_worker()
+        self._queue.put_nowait(session.token)
+        return True
+
+    def _prune(self, now: float) -> None:
+        if len(self._queued_at) < settings.session_cache_max_size:
+            return
+        self._queued_at = {key: at for key, at in self._queued_at.items() if now - at < self.interval}
+
+    def _ensure_worker(self) -> None:
+        # The queue and task belong to the running loop, so start them lazily from a request
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            tokens = [await self._queue.get()]
+            while not self._queue.empty():
+                tokens.append(self._queue.get_nowait())
+            try:
+                async with AsyncSessionLocal() as db:
+                    await SessionService(db).refresh_sessions(tokens)
+            except Exception:
+                logger.exception("Failed to refresh %d session(s)", len(tokens))
+                for token in tokens:
+                    self._queued_at.pop(hash_token(token), None)
+
+
+session_refresh_queue = SessionRefreshQueue(interval=settings.session_refresh_interval)
@@ -3,42 +3,52 @@ from typing import Optional
 from fastapi import Depends
 from fastapi.exceptions import HTTPException
 from pydantic import EmailStr
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_400_BAD_REQUEST
 
-from db.engine import get_db
+from db.engine import get_async_db
 from models.user import User
+from services.password import password_hasher
 
 
 class UserService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def authenticate(self, identifier: str, password: str) -> Optional[User]:
-        user = self.db.query(User).filter(or_(User.username == identifier, User.email == identifier)).first()
-        if not user or not user.check_password(password):
+    async def authenticate(self, identifier: str, password: str) -> Optional[User]:
+        result = await self.db.execute(select(User).where(or_(User.username == identifier, User.email == identifier)))
+        user = result.scalars().first()
+        if not user:
             return None
+
+        verified, new_hash = await password_hasher.verify_and_update(password, user.password)
+        if not verified:
+            return None
+        if new_hash:
+            # Stored hash predates the current argon2 settings
+            user.password = new_hash
+            await self.db.commit()
         return user
 
-    def create_user(
+    async def create_user(
         self,
         username: str,
         email: EmailStr,
         password: str,
     ) -> User:
-        existing_user = self.db.query(User).filter(or_(User.username == username, User.email == email)).first()
+        result = await self.db.execute(select(User).where(or_(User.username == username, User.email == email)))
+        existing_user = result.scalars().first()
 
         if existing_user:
             if existing_user.username == username:
                 raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Username already taken")
             raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Email already taken")
-        user = User(username=username, email=email)
-        user.set_password(password)
+        user = User(username=username, email=email, password=await password_hasher.hash(password))
         self.db.add(user)
-        self.db.commit()
+        await self.db.commit()
         return user
 
 
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
+def get_user_service(db: AsyncSession = Depends(get_async_db)) -> UserService:
     return UserService(db)
@@ -0,0 +1,128 @@
+"""
+As-of valuation of a household's investment holdings over a range of dates.
+
+The quantity held on a date is the running sum of BUY and SELL transactions up to it, and the price is
+the last valuation snapshot on or before it. Both come from one grouped query each, bucketed by day, week
+or month in SQL, and are laid out as asset x period matrices, so the as-of join is a cumulative sum plus a
+forward fill instead of a query per date.
+"""
+
+from datetime import date
+
+import numpy as np
+from sqlalchemy import Date, Integer, case, cast, desc, func, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.investment_asset import InvestmentAsset
+from models.investment_transaction import InvestmentTransaction, TransactionType
+from models.investment_valuation_snapshot import InvestmentValuationSnapshot
+
+
+class HoldingsHistory:
+    """Per-asset quantity, price and value at the end of each period of a range. Rows follow asset_ids."""
+
+    def __init__(self, asset_ids: list[int], dates: np.ndarray, quantities: np.ndarray, prices: np.ndarray):
+        self.asset_ids = asset_ids
+        self.dates = dates
+        self.quantities = quantities
+        self.prices = prices
+        # NaN where units are held but no valuation is known yet
+        self.values = np.where(quantities == 0, 0.0, quantities * prices)
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Value of all holdings per date, counting holdings without a valuation as zero."""
+        return np.nansum(self.values, axis=0)
+
+
+def period_ends(days: np.ndarray, interval: str) -> np.ndarray:
+    """Positions of the last day of each day, week (Monday to Sunday) or month in a range of days."""
+    if interval == "day":
+        return np.arange(len(days))
+    # Weeks are counted from Monday 1969-12-29, as day 0 (1970-01-01) was a Thursday
+    periods = (days.astype(int) + 3) // 7 if interval == "week" else days.astype("datetime64[M]").astype(int)
+    return np.flatnonzero(np.append(periods[1:] != periods[:-1], True))
+
+
+def _period_offset(column, start: date, interval: str):
+    """
+    Days from start to the first day of a date's period, with earlier periods collapsed onto start.
+    Integers are much cheaper to fetch than dates when there are a lot of rows.
+    """
+    period_start = column if interval == "day" else cast(func.date_trunc(interval, column), Date)
+    return type_coerce(func.greatest(period_start, start) - start, Integer)
+
+
+async def load_holdings_history(
+    db: AsyncSession,
+    household_id: int,
+    start: date,
+    end: date,
+    interval: str = "day",
+) -> HoldingsHistory:
+    """
+    Load the holdings of a household at the end of every day, week or month from start to end (the
+    last period ends at end). Everything before start is carried into the first period.
+    """
+    days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    ends = period_ends(days, interval)
+    period_starts = np.append(0, ends[:-1] + 1)
+    dates = days[ends]
+
+    transaction_period = _period_offset(InvestmentTransaction.date, start, interval)
+    signed_quantity = case(
+        (InvestmentTransaction.transaction_type == TransactionType.BUY, InvestmentTransaction.quantity),
+        (InvestmentTransaction.transaction_type == TransactionType.SELL, -InvestmentTransaction.quantity),
+        else_=0,
+    )
+    quantity_rows = (
+        await db.execute(
+            select(InvestmentTransaction.asset_id, transaction_period, func.sum(signed_quantity))
+            .where(InvestmentTransaction.household_id == household_id, InvestmentTransaction.date <= end)
+            .group_by(InvestmentTransaction.asset_id, transaction_period)
+        )
+    ).all()
+    if not quantity_rows:
+        return HoldingsHistory([], dates, np.zeros((0, len(dates))), np.zeros((0, len(dates))))
+
+    row_assets, offsets, amounts = (np.array(column) for column in zip(*quantity_rows, strict=True))
+    asset_ids = np.unique(row_assets)
+
+    def cells(row_assets: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Matrix positions of (asset_id, period offset) rows
+        return np.searchsorted(asset_ids, row_assets), np.searchsorted(period_starts, offsets, side="right") - 1
+
+    quantities = np.zeros((len(asset_ids), len(dates)))
+    np.add.at(quantities, cells(row_assets, offsets), amounts)
+    quantities = np.cumsum(quantities, axis=1)
+
+    # The last valuation of each held asset per period
+    valuation_period = _period_offset(InvestmentValuationSnapshot.date, start, interval)
+    price_rows = (
+        await db.execute(
+            select(InvestmentValuationSnapshot.asset_id, valuation_period, InvestmentValuationSnapshot.valuation)
+            .join(InvestmentAsset, InvestmentValuationSnapshot.asset_id == InvestmentAsset.id)
+            .where(
+                InvestmentAsset.household_id == household_id,
+                InvestmentValuationSnapshot.asset_id.in_(asset_ids.tolist()),
+                InvestmentValuationSnapshot.date <= end,
+            )
+            .distinct(InvestmentValuationSnapshot.asset_id, valuation_period)
+            .order_by(
+                InvestmentValuationSnapshot.asset_id,
+                valuation_period,
+                desc(InvestmentValuationSnapshot.date),
+                desc(InvestmentValuationSnapshot.id),
+            )
+        )
+    ).all()
+    prices = np.full(quantities.shape, np.nan)
+    if price_rows:
+        row_assets, offsets, valuations = (np.array(column) for column in zip(*price_rows, strict=True))
+        prices[cells(row_assets, offsets)] = valuations
+
+    # Forward fill: every period takes the price of the last period that had one
+    last_priced = np.where(np.isnan(prices), 0, np.arange(len(dates)))
+    np.maximum.accumulate(last_priced, axis=1, out=last_priced)
+    prices = np.take_along_axis(prices, last_priced, axis=1)
+    return HoldingsHistory(asset_ids.tolist(), dates, quantities, prices)
@@ -7,6 +7,7 @@ import {
   deleteCategory,
   deleteExpense,
   deleteIncome,
+  getBudgetSummary,
   getCategories,
   getExpenses,
   getIncome,
@@ -56,6 +57,20 @@ export function useUpdateBudget(year: number, month: number) {
   });
 }
 
+// Totals come from the server so they don't depend on every expense being loaded.
+// The key sits under byMonth, so expense, income and budget mutations refresh it too.
+export function useBudgetSummary(
+  budgetId: number | undefined,
+  year: number,
+  month: number
+) {
+  return useQuery({
+    queryKey: queryKeys.budgets.summary(year, month),
+    queryFn: () => getBudgetSummary(budgetId!),
+    enabled: Boolean(budgetId),
+  });
+}
+
 // Expense Hooks
 export function useExpenses(budgetId: number | undefined) {
   return useQuery({
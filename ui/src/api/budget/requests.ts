@@ -1,4 +1,4 @@
-import { apiClient } from '@/lib/axios';
+import { apiClient, fetchAllPages } from '@/lib/axios';
 import type {
   CreateCategoryRequest,
   CreateCategoryResponse,
@@ -9,11 +9,14 @@ import type {
   DeleteCategoryResponse,
   DeleteExpenseResponse,
   DeleteIncomeResponse,
+  Expense,
   GetCategoriesResponse,
   GetExpensesResponse,
   GetIncomeResponse,
   GetOrCreateBudgetRequest,
   GetOrCreateBudgetResponse,
+  Income,
+  MonthlyBudgetSummary,
   UpdateBudgetRequest,
   UpdateBudgetResponse,
   UpdateExpenseRequest,
@@ -50,14 +53,24 @@ export async function updateBudget(
   return response.data;
 }
 
+export async function getBudgetSummary(
+  budgetId: number
+): Promise<MonthlyBudgetSummary> {
+  const response = await apiClient.get<MonthlyBudgetSummary>(
+    `/monthly_budgets/${budgetId}/summary`
+  );
+  return response.data;
+}
+
 // Expenses
 export async function getExpenses(
   budgetId: number
 ): Promise<GetExpensesResponse> {
-  const response = await apiClient.get<GetExpensesResponse>(
-    `/monthly_budgets/${budgetId}/expenses`
+  const expenses = await fetchAllPages<Expense>(
+    `/monthly_budgets/${budgetId}/expenses`,
+    'expenses'
   );
-  return response.data;
+  return { expenses };
 }
 
 export async function createExpense(
@@ -93,10 +106,11 @@ export async function deleteExpense(
 
 // Income
 export async function getIncome(budgetId: number): Promise<GetIncomeResponse> {
-  const response = await apiClient.get<GetIncomeResponse>(
-    `/monthly_budgets/${budgetId}/income`
+  const income = await fetchAllPages<Income>(
+    `/monthly_budgets/${budgetId}/income`,
+    'income'
   );
-  return response.data;
+  return { income };
 }
 
 export async function createIncome(
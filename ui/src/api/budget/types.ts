@@ -35,6 +35,33 @@ export interface UpdateBudgetResponse {
   currency: string;
 }
 
+export interface BudgetCategorySummary {
+  categoryId: number;
+  name: string;
+  color: string;
+  colorCode?: string | null;
+  total: number;
+  count: number;
+}
+
+export interface MonthlyBudgetSummary {
+  id: number;
+  year: number;
+  month: number;
+  currency: string;
+  plannedBudget: number;
+  totalExpenses: number;
+  expenseCount: number;
+  totalIncome: number;
+  incomeCount: number;
+  remainingBudget: number;
+  daysInMonth: number;
+  daysElapsed: number;
+  dailyBurnRate: number;
+  projectedExpenses: number;
+  categories: BudgetCategorySummary[];
+}
+
 // Expense Types
 export interface Expense {
   id: number;
@@ -84,6 +111,7 @@ export interface DeleteExpenseResponse {
 
 export interface GetExpensesResponse {
   expenses: Expense[];
+  nextCursor?: string | null;
 }
 
 // Income Types
@@ -124,6 +152,7 @@ export interface DeleteIncomeResponse {
 
 export interface GetIncomeResponse {
   income: Income[];
+  nextCursor?: string | null;
 }
 
 // Category Types
@@ -1,4 +1,4 @@
-import { apiClient } from '@/lib/axios';
+import { apiClient, fetchAllPages } from '@/lib/axios';
 import type {
   AssetDetailResponse,
   CreateAssetRequest,
@@ -12,6 +12,7 @@ import type {
   GetAssetsResponse,
   GetTransactionsResponse,
   GetValuationsResponse,
+  InvestmentTransaction,
   PortfolioSummary,
   UpdateAssetRequest,
   UpdateAssetResponse,
@@ -83,10 +84,11 @@ export async function getPortfolioSummary(
 export async function getTransactions(
   assetId: number
 ): Promise<GetTransactionsResponse> {
-  const response = await apiClient.get<GetTransactionsResponse>(
-    `/investments/${assetId}/transactions`
+  const transactions = await fetchAllPages<InvestmentTransaction>(
+    `/investments/${assetId}/transactions`,
+    'transactions'
   );
-  return response.data;
+  return { transactions };
 }
 
 export async function createTransaction(
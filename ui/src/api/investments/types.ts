@@ -119,6 +119,7 @@ export type UpdateTransactionResponse = InvestmentTransaction;
 
 export interface GetTransactionsResponse {
   transactions: InvestmentTransaction[];
+  nextCursor?: string | null;
 }
 
 export interface DeleteTransactionResponse {
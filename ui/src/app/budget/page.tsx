@@ -2,6 +2,7 @@
 
 import { useAuth } from '@/api/auth/context';
 import {
+  useBudgetSummary,
   useCategories,
   useCreateCategory,
   useCreateExpense,
@@ -62,6 +63,7 @@ export default function BudgetPage() {
     useExpenses(budgetId);
   const { data: incomeData, isLoading: incomeLoading } = useIncome(budgetId);
   const { data: categoriesData } = useCategories();
+  const { data: summary } = useBudgetSummary(budgetId, year, month);
 
   // Mutations
   const updateBudgetMutation = useUpdateBudget(year, month);
@@ -81,15 +83,8 @@ export default function BudgetPage() {
   const income = useMemo(() => incomeData?.income || [], [incomeData?.income]);
   const categories = categoriesData?.categories || [];
 
-  const totalExpenses = useMemo(
-    () => expenses.reduce((sum, exp) => sum + exp.amount, 0),
-    [expenses]
-  );
-
-  const totalIncome = useMemo(
-    () => income.reduce((sum, inc) => sum + inc.amount, 0),
-    [income]
-  );
+  const totalExpenses = summary?.totalExpenses ?? 0;
+  const totalIncome = summary?.totalIncome ?? 0;
 
   // Handlers
   const handleMonthChange = (newYear: number, newMonth: number) => {
@@ -43,4 +43,21 @@ apiClient.interceptors.response.use(
   }
 );
 
+// Follow nextCursor until every page of a paginated list endpoint has been fetched
+export async function fetchAllPages<TItem>(
+  url: string,
+  key: string
+): Promise<TItem[]> {
+  const items: TItem[] = [];
+  let cursor: string | null | undefined;
+  do {
+    const response = await apiClient.get<
+      Record<string, unknown> & { nextCursor?: string | null }
+    >(url, { params: { limit: 500, cursor } });
+    items.push(...(response.data[key] as TItem[]));
+    cursor = response.data.nextCursor;
+  } while (cursor);
+  return items;
+}
+
 export type { AxiosError };
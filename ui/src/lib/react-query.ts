@@ -49,6 +49,8 @@ export const queryKeys = {
     all: ['budgets'] as const,
     byMonth: (year: number, month: number) =>
       [...queryKeys.budgets.all, year, month] as const,
+    summary: (year: number, month: number) =>
+      [...queryKeys.budgets.byMonth(year, month), 'summary'] as const,
   },
   expenses: {
     all: ['expenses'] as const,